@@ -9,8 +9,8 @@ AWS Support API is only available in us-east-1, regardless of where
 this Lambda is deployed.
 
 Workflow:
-1. Scan S3 for all cases not in 'resolved' status
-2. For each case, assume the appropriate IAM role in the target account
+1. Read the cases not in 'resolved' status from the open-cases index (no bucket listing)
+2. For each case (checked concurrently), assume the appropriate IAM role in the target account
 3. Call AWS Support API to get current case status
 4. If status changed, update S3 and send notification to Lark chat
 5. Update last_checked timestamp for all processed cases
@@ -21,11 +21,15 @@ Environment Variables:
 - APP_ID_ARN: Secrets Manager ARN for Lark App ID
 - APP_SECRET_ARN: Secrets Manager ARN for Lark App Secret
 - DATA_BUCKET: S3 bucket name for case and config data
+- POLL_CONCURRENCY: Number of cases checked in parallel (default: 8)
 """
 import json
 import os
+import threading
+import time
 import boto3
 import urllib3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 from s3_storage import get_open_cases, update_case
@@ -35,12 +39,13 @@ from i18n import get_message, DEFAULT_LANGUAGE
 secrets_client = boto3.client('secretsmanager')
 sts_client = boto3.client('sts')
 
-# Initialize urllib3 PoolManager
-http = urllib3.PoolManager()
-
 # Environment variables
 APP_ID_ARN = os.environ['APP_ID_ARN']
 APP_SECRET_ARN = os.environ['APP_SECRET_ARN']
+POLL_CONCURRENCY = int(os.environ.get('POLL_CONCURRENCY', '8'))
+
+# Initialize urllib3 PoolManager (one kept-alive connection per concurrent case check)
+http = urllib3.PoolManager(maxsize=POLL_CONCURRENCY)
 
 # Cache
 _app_id = None
@@ -52,15 +57,16 @@ def get_app_credentials():
     """Get Lark app credentials"""
     global _app_id, _app_secret
     
-    if _app_id is None:
-        response = secrets_client.get_secret_value(SecretId=APP_ID_ARN)
-        secret = json.loads(response['SecretString'])
-        _app_id = secret.get('app_id', '')
-    
-    if _app_secret is None:
-        response = secrets_client.get_secret_value(SecretId=APP_SECRET_ARN)
-        secret = json.loads(response['SecretString'])
-        _app_secret = secret.get('app_secret', '')
+    if _app_id is None or _app_secret is None:
+        # One BatchGetSecretValue call for both secrets instead of a GetSecretValue each
+        response = secrets_client.batch_get_secret_value(SecretIdList=[APP_ID_ARN, APP_SECRET_ARN])
+        if response.get('Errors'):
+            raise Exception(f"Failed to get Lark app credentials: {response['Errors']}")
+        secrets = {}
+        for value in response['SecretValues']:
+            secrets[value['ARN']] = secrets[value['Name']] = json.loads(value['SecretString'])
+        _app_id = secrets.get(APP_ID_ARN, {}).get('app_id', '')
+        _app_secret = secrets.get(APP_SECRET_ARN, {}).get('app_secret', '')
     
     return _app_id, _app_secret
 
@@ -118,10 +124,27 @@ def send_lark_message(chat_id: str, content: str):
     return result.get('code') == 0
 
 
-def get_case_details(role_arn: str, case_id: str, include_communications: bool = False) -> Optional[Dict]:
-    """Get case details from AWS Support"""
-    try:
-        # Assume role
+# Support API clients per role_arn, reused across cases and warm invocations:
+# role_arn -> (client, credentials expiry timestamp)
+_support_clients = {}
+# Guards client construction: cases are checked concurrently, so several cases in the same
+# account would otherwise each call AssumeRole, and boto3.client() is not thread-safe
+_support_clients_lock = threading.Lock()
+CLIENT_REFRESH_MARGIN = 300  # Re-assume the role 5 minutes before credentials expire
+
+
+def get_support_client(role_arn: str):
+    """Get an AWS Support client (us-east-1) for the account behind role_arn"""
+    cached = _support_clients.get(role_arn)
+    if cached and cached[1] - time.time() > CLIENT_REFRESH_MARGIN:
+        return cached[0]
+    
+    with _support_clients_lock:
+        # Another thread may have assumed the role while we waited
+        cached = _support_clients.get(role_arn)
+        if cached and cached[1] - time.time() > CLIENT_REFRESH_MARGIN:
+            return cached[0]
+        
         assumed_role = sts_client.assume_role(
             RoleArn=role_arn,
             RoleSessionName='LarkCaseBotPoller'
@@ -135,6 +158,14 @@ def get_case_details(role_arn: str, case_id: str, include_communications: bool =
             aws_secret_access_key=credentials['SecretAccessKey'],
             aws_session_token=credentials['SessionToken']
         )
+        _support_clients[role_arn] = (support_client, credentials['Expiration'].timestamp())
+        return support_client
+
+
+def get_case_details(role_arn: str, case_id: str, include_communications: bool = False) -> Optional[Dict]:
+    """Get case details from AWS Support"""
+    try:
+        support_client = get_support_client(role_arn)
         
         response = support_client.describe_cases(
             caseIdList=[case_id],
@@ -150,141 +181,147 @@ def get_case_details(role_arn: str, case_id: str, include_communications: bool =
         return None
 
 
-def check_case_updates():
-    """Check all open cases for updates (status changes and new communications)"""
-    # Get all open cases from S3
-    cases = get_open_cases()
-    print(f"Found {len(cases)} open cases to check")
-    
-    for case in cases:
-        case_id = case.get('case_id')
-        try:
-            role_arn = case.get('role_arn')
-            case_chat_id = case.get('case_chat_id')
-            last_status = case.get('status', 'opened')
-            last_communication_time = case.get('last_communication_time')
-            
-            if not all([case_id, role_arn, case_chat_id]):
-                print(f"Skipping case {case_id}: missing required fields")
-                continue
-            
-            # Get current case details with communications
-            case_details = get_case_details(role_arn, case_id, include_communications=True)
-            if not case_details:
-                print(f"Could not get details for case {case_id}")
+def _check_case(case: Dict[str, Any]):
+    """Check one open case for a status change and new communications"""
+    case_id = case.get('case_id')
+    try:
+        role_arn = case.get('role_arn')
+        case_chat_id = case.get('case_chat_id')
+        last_status = case.get('status', 'opened')
+        last_communication_time = case.get('last_communication_time')
+        
+        if not all([case_id, role_arn, case_chat_id]):
+            print(f"Skipping case {case_id}: missing required fields")
+            return
+        
+        # Get current case details with communications
+        case_details = get_case_details(role_arn, case_id, include_communications=True)
+        if not case_details:
+            print(f"Could not get details for case {case_id}")
+            return
+        
+        current_status = case_details.get('status', 'opened')
+        display_id = case.get('display_id', case_id)
+        
+        # Check for new communications
+        communications = case_details.get('recentCommunications', {}).get('communications', [])
+        new_comms = []
+        latest_comm_time = last_communication_time
+        
+        for comm in communications:
+            comm_time_str = comm.get('timeCreated', '')
+            if not comm_time_str:
                 continue
             
-            current_status = case_details.get('status', 'opened')
-            display_id = case.get('display_id', case_id)
-            
-            # Check for new communications
-            communications = case_details.get('recentCommunications', {}).get('communications', [])
-            new_comms = []
-            latest_comm_time = last_communication_time
-            
-            for comm in communications:
-                comm_time_str = comm.get('timeCreated', '')
-                if not comm_time_str:
-                    continue
-                
-                # Check if this is a new communication (after last_communication_time)
-                if last_communication_time:
-                    try:
-                        comm_time = datetime.fromisoformat(comm_time_str.replace('Z', '+00:00'))
-                        last_time = datetime.fromisoformat(last_communication_time.replace('Z', '+00:00'))
-                        if comm_time <= last_time:
-                            continue  # Skip already synced communications
-                    except Exception as e:
-                        print(f"Error parsing time: {e}")
-                        continue
-                
-                # Skip messages sent via Lark (already confirmed in chat, no need to echo back)
-                body = comm.get('body', '')
-                if '[From ' in body and 'via Lark]' in body:
-                    print(f"Skipping Lark-originated message for case {case_id}")
-                    # Still update latest_comm_time to avoid re-processing
-                    if not latest_comm_time or comm_time_str > latest_comm_time:
-                        latest_comm_time = comm_time_str
+            # Check if this is a new communication (after last_communication_time)
+            if last_communication_time:
+                try:
+                    comm_time = datetime.fromisoformat(comm_time_str.replace('Z', '+00:00'))
+                    last_time = datetime.fromisoformat(last_communication_time.replace('Z', '+00:00'))
+                    if comm_time <= last_time:
+                        continue  # Skip already synced communications
+                except Exception as e:
+                    print(f"Error parsing time: {e}")
                     continue
-                
-                # Include AWS Support replies and customer replies from console
-                new_comms.append(comm)
-                
-                # Track latest communication time
+            
+            # Skip messages sent via Lark (already confirmed in chat, no need to echo back)
+            body = comm.get('body', '')
+            if '[From ' in body and 'via Lark]' in body:
+                print(f"Skipping Lark-originated message for case {case_id}")
+                # Still update latest_comm_time to avoid re-processing
                 if not latest_comm_time or comm_time_str > latest_comm_time:
                     latest_comm_time = comm_time_str
+                continue
+            
+            # Include AWS Support replies and customer replies from console
+            new_comms.append(comm)
             
-            # Sort by time (oldest first) to send in chronological order
-            new_comms.sort(key=lambda x: x.get('timeCreated', ''))
+            # Track latest communication time
+            if not latest_comm_time or comm_time_str > latest_comm_time:
+                latest_comm_time = comm_time_str
+        
+        # Sort by time (oldest first) to send in chronological order
+        new_comms.sort(key=lambda x: x.get('timeCreated', ''))
+        
+        # Send notifications for all new communications
+        for comm in new_comms:
+            body = comm.get('body', '')
+            submitted_by = comm.get('submittedBy', '')
             
-            # Send notifications for all new communications
-            for comm in new_comms:
-                body = comm.get('body', '')
-                submitted_by = comm.get('submittedBy', '')
-                
-                # Truncate long messages
-                if len(body) > 8000:
-                    body = body[:8000] + '...\n\n' + get_message(DEFAULT_LANGUAGE, 'poller_message_truncated')
-                
-                # Different emoji for AWS Support vs customer
-                if 'Amazon Web Services' in submitted_by:
-                    emoji = "📨"
-                    sender = "AWS Support"
-                else:
-                    emoji = "💬"
-                    sender = submitted_by if submitted_by else "Console"
-                
-                message = f"{emoji} {get_message(DEFAULT_LANGUAGE, 'poller_case_reply')} [{sender}]\n\n{get_message(DEFAULT_LANGUAGE, 'poller_case_label')}: {display_id}\n\n{body}"
-                send_lark_message(case_chat_id, message)
-                print(f"Sent communication notification for case {case_id} from {sender}")
+            # Truncate long messages
+            if len(body) > 8000:
+                body = body[:8000] + '...\n\n' + get_message(DEFAULT_LANGUAGE, 'poller_message_truncated')
             
-            # Check if status changed
-            status_changed = current_status != last_status
-            if status_changed:
-                print(f"Case {case_id} status changed: {last_status} -> {current_status}")
-                
-                # Send status notification to Lark
-                status_map = {
-                    'opened': get_message(DEFAULT_LANGUAGE, 'status_opened'),
-                    'pending-customer-action': get_message(DEFAULT_LANGUAGE, 'status_pending_customer'),
-                    'customer-action-completed': get_message(DEFAULT_LANGUAGE, 'status_customer_completed'),
-                    'reopened': get_message(DEFAULT_LANGUAGE, 'status_reopened'),
-                    'resolved': get_message(DEFAULT_LANGUAGE, 'status_resolved'),
-                    'unassigned': get_message(DEFAULT_LANGUAGE, 'status_unassigned'),
-                    'work-in-progress': get_message(DEFAULT_LANGUAGE, 'status_in_progress')
-                }
-                
-                status_display = status_map.get(current_status, current_status)
-                message = f"📢 {get_message(DEFAULT_LANGUAGE, 'poller_status_update')}\n\n{get_message(DEFAULT_LANGUAGE, 'poller_case_label')}: {display_id}\n{get_message(DEFAULT_LANGUAGE, 'poller_new_status')}: {status_display}"
-                
-                # Add auto-dissolve notice if case is resolved
-                if current_status == 'resolved':
-                    auto_dissolve_hours = int(os.environ.get('AUTO_DISSOLVE_HOURS', '72'))
-                    message += f"\n\n{get_message(DEFAULT_LANGUAGE, 'case_resolved_dissolve_notice').format(auto_dissolve_hours)}"
-                
-                if send_lark_message(case_chat_id, message):
-                    print(f"Sent status change notification for case {case_id}: {last_status} -> {current_status}")
-                else:
-                    print(f"Failed to send status change notification for case {case_id}")
+            # Different emoji for AWS Support vs customer
+            if 'Amazon Web Services' in submitted_by:
+                emoji = "📨"
+                sender = "AWS Support"
+            else:
+                emoji = "💬"
+                sender = submitted_by if submitted_by else "Console"
             
-            # Update S3 with latest info
-            now_iso = datetime.now(timezone.utc).isoformat()
-            update_data = {
-                'last_checked': now_iso
+            message = f"{emoji} {get_message(DEFAULT_LANGUAGE, 'poller_case_reply')} [{sender}]\n\n{get_message(DEFAULT_LANGUAGE, 'poller_case_label')}: {display_id}\n\n{body}"
+            send_lark_message(case_chat_id, message)
+            print(f"Sent communication notification for case {case_id} from {sender}")
+        
+        # Check if status changed
+        status_changed = current_status != last_status
+        if status_changed:
+            print(f"Case {case_id} status changed: {last_status} -> {current_status}")
+            
+            # Send status notification to Lark
+            status_map = {
+                'opened': get_message(DEFAULT_LANGUAGE, 'status_opened'),
+                'pending-customer-action': get_message(DEFAULT_LANGUAGE, 'status_pending_customer'),
+                'customer-action-completed': get_message(DEFAULT_LANGUAGE, 'status_customer_completed'),
+                'reopened': get_message(DEFAULT_LANGUAGE, 'status_reopened'),
+                'resolved': get_message(DEFAULT_LANGUAGE, 'status_resolved'),
+                'unassigned': get_message(DEFAULT_LANGUAGE, 'status_unassigned'),
+                'work-in-progress': get_message(DEFAULT_LANGUAGE, 'status_in_progress')
             }
-            if status_changed:
-                update_data['status'] = current_status
-                # Record resolved_at time for auto-dissolve feature
-                if current_status == 'resolved':
-                    update_data['resolved_at'] = now_iso
-            if latest_comm_time and latest_comm_time != last_communication_time:
-                update_data['last_communication_time'] = latest_comm_time
             
-            update_case(case_id, update_data)
+            status_display = status_map.get(current_status, current_status)
+            message = f"📢 {get_message(DEFAULT_LANGUAGE, 'poller_status_update')}\n\n{get_message(DEFAULT_LANGUAGE, 'poller_case_label')}: {display_id}\n{get_message(DEFAULT_LANGUAGE, 'poller_new_status')}: {status_display}"
+            
+            # Add auto-dissolve notice if case is resolved
+            if current_status == 'resolved':
+                auto_dissolve_hours = int(os.environ.get('AUTO_DISSOLVE_HOURS', '72'))
+                message += f"\n\n{get_message(DEFAULT_LANGUAGE, 'case_resolved_dissolve_notice').format(auto_dissolve_hours)}"
             
-        except Exception as e:
-            print(f"Error processing case {case_id}: {e}")
-            continue
+            if send_lark_message(case_chat_id, message):
+                print(f"Sent status change notification for case {case_id}: {last_status} -> {current_status}")
+            else:
+                print(f"Failed to send status change notification for case {case_id}")
+        
+        # Update S3 with latest info
+        now_iso = datetime.now(timezone.utc).isoformat()
+        update_data = {
+            'last_checked': now_iso
+        }
+        if status_changed:
+            update_data['status'] = current_status
+            # Record resolved_at time for auto-dissolve feature
+            if current_status == 'resolved':
+                update_data['resolved_at'] = now_iso
+        if latest_comm_time and latest_comm_time != last_communication_time:
+            update_data['last_communication_time'] = latest_comm_time
+        
+        update_case(case_id, update_data)
+        
+    except Exception as e:
+        print(f"Error processing case {case_id}: {e}")
+
+
+def check_case_updates():
+    """Check all open cases for updates (status changes and new communications)"""
+    # Get all open cases from S3
+    cases = get_open_cases()
+    print(f"Found {len(cases)} open cases to check")
+    
+    # Each case is independent and IO-bound (STS/Support, Lark, S3), so check them concurrently.
+    # A dedicated pool: update_case fans out on s3_storage.io_pool and must not wait behind these.
+    with ThreadPoolExecutor(max_workers=POLL_CONCURRENCY, thread_name_prefix='poll') as pool:
+        list(pool.map(_check_case, cases))
 
 
 def lambda_handler(event, context):
@@ -20,7 +20,8 @@ Features:
 - Supports dual timezone display (UTC and Beijing time)
 - Sends rich text messages with case links to AWS Console
 
-Triggered by: EventBridge rule matching 'aws.support' events
+Triggered by: EventBridge rule matching 'aws.support' events, delivered through an
+SQS queue so bursts of updates are handled in batches of up to 10 events
 
 Environment Variables:
 - APP_ID_ARN: Secrets Manager ARN for Lark App ID
@@ -29,6 +30,7 @@ Environment Variables:
 """
 import json
 import os
+import time
 import boto3
 import urllib3
 from datetime import datetime, timezone, timedelta
@@ -56,15 +58,16 @@ def get_app_credentials():
     """Get Lark app credentials"""
     global _app_id, _app_secret
     
-    if _app_id is None:
-        response = secrets_client.get_secret_value(SecretId=APP_ID_ARN)
-        secret = json.loads(response['SecretString'])
-        _app_id = secret.get('app_id', '')
-    
-    if _app_secret is None:
-        response = secrets_client.get_secret_value(SecretId=APP_SECRET_ARN)
-        secret = json.loads(response['SecretString'])
-        _app_secret = secret.get('app_secret', '')
+    if _app_id is None or _app_secret is None:
+        # One BatchGetSecretValue call for both secrets instead of a GetSecretValue each
+        response = secrets_client.batch_get_secret_value(SecretIdList=[APP_ID_ARN, APP_SECRET_ARN])
+        if response.get('Errors'):
+            raise Exception(f"Failed to get Lark app credentials: {response['Errors']}")
+        secrets = {}
+        for value in response['SecretValues']:
+            secrets[value['ARN']] = secrets[value['Name']] = json.loads(value['SecretString'])
+        _app_id = secrets.get(APP_ID_ARN, {}).get('app_id', '')
+        _app_secret = secrets.get(APP_SECRET_ARN, {}).get('app_secret', '')
     
     return _app_id, _app_secret
 
@@ -111,6 +114,35 @@ def update_last_communication_time(case_id: str, last_time: str):
     update_case(case_id, {'last_communication_time': last_time})
 
 
+# Support API clients per role_arn, reused across cases and warm invocations:
+# role_arn -> (client, credentials expiry timestamp)
+_support_clients = {}
+CLIENT_REFRESH_MARGIN = 300  # Re-assume the role 5 minutes before credentials expire
+
+
+def get_support_client(role_arn: str):
+    """Get an AWS Support client (us-east-1) for the account behind role_arn"""
+    cached = _support_clients.get(role_arn)
+    if cached and cached[1] - time.time() > CLIENT_REFRESH_MARGIN:
+        return cached[0]
+    
+    assumed_role = sts_client.assume_role(
+        RoleArn=role_arn,
+        RoleSessionName='LarkCaseBotGetCommunication'
+    )
+    
+    credentials = assumed_role['Credentials']
+    support_client = boto3.client(
+        'support',
+        region_name='us-east-1',
+        aws_access_key_id=credentials['AccessKeyId'],
+        aws_secret_access_key=credentials['SecretAccessKey'],
+        aws_session_token=credentials['SessionToken']
+    )
+    _support_clients[role_arn] = (support_client, credentials['Expiration'].timestamp())
+    return support_client
+
+
 def get_recent_communications(role_arn: str, case_id: str, last_communication_time: Optional[str] = None, minutes_back: int = 15) -> tuple:
     """
     Get recent communications from AWS Support case since last check
@@ -127,20 +159,7 @@ def get_recent_communications(role_arn: str, case_id: str, last_communication_ti
         - case_status: Current case status string
     """
     try:
-        # Assume role
-        assumed_role = sts_client.assume_role(
-            RoleArn=role_arn,
-            RoleSessionName='LarkCaseBotGetCommunication'
-        )
-        
-        credentials = assumed_role['Credentials']
-        support_client = boto3.client(
-            'support',
-            region_name='us-east-1',
-            aws_access_key_id=credentials['AccessKeyId'],
-            aws_secret_access_key=credentials['SecretAccessKey'],
-            aws_session_token=credentials['SessionToken']
-        )
+        support_client = get_support_client(role_arn)
         
         # Get case details with communications
         response = support_client.describe_cases(
@@ -455,8 +474,8 @@ def format_case_update(event_detail: Dict[str, Any], case_info: Dict[str, Any])
         return None
 
 
-def lambda_handler(event, context):
-    """Main Lambda handler for EventBridge events"""
+def process_case_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Push one AWS Support EventBridge event to the case's Lark chat"""
     try:
         print(f"Received event: {json.dumps(event)}")
         
@@ -547,3 +566,20 @@ def lambda_handler(event, context):
             'statusCode': 500,
             'body': json.dumps({'error': str(e)})
         }
+
+
+def lambda_handler(event, context):
+    """Main Lambda handler for EventBridge events (batched through the SQS queue)"""
+    if 'Records' not in event:
+        # Direct EventBridge invocation
+        return process_case_event(event)
+    
+    print(f"Processing {len(event['Records'])} queued case events")
+    results = [process_case_event(json.loads(record['body'])) for record in event['Records']]
+    # Failures are logged per event and not retried, as with direct EventBridge delivery
+    # (a retried event could send the same Lark notification twice)
+    return {
+        'statusCode': 200,
+        'body': json.dumps({'processed': len(results),
+                            'failed': sum(1 for r in results if r.get('statusCode') != 200)})
+    }
@@ -3,7 +3,11 @@
 Group Cleanup Lambda - Auto-dissolve resolved case groups
 
 This Lambda automatically dissolves Lark groups for resolved cases 
-after a configurable time period (default: 72 hours).
+after a configurable time period (default: 72 hours). Candidates come from the
+dissolve-pending index (resolved cases whose group is not dissolved yet), so a run
+reads only those cases instead of listing the bucket. Once a day (the run in
+INDEX_REBUILD_HOUR) the index is rebuilt from a full scan, so a case left out of
+it by a failed index write is still picked up.
 
 Triggered by: EventBridge scheduled rule (every hour)
 
@@ -12,6 +16,7 @@ Environment Variables:
 - APP_ID_ARN: Secrets Manager ARN for Lark App ID
 - APP_SECRET_ARN: Secrets Manager ARN for Lark App Secret
 - AUTO_DISSOLVE_HOURS: Hours to wait before auto-dissolving (default: 72)
+- INDEX_REBUILD_HOUR: UTC hour of the run that rebuilds the dissolve-pending index (default: 0)
 """
 import json
 import os
@@ -19,7 +24,7 @@ import boto3
 import urllib3
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, Optional
-from s3_storage import get_all_cases, update_case
+from s3_storage import get_dissolve_pending_cases, update_case
 
 # Initialize clients
 secrets_client = boto3.client('secretsmanager')
@@ -27,6 +32,7 @@ http = urllib3.PoolManager()
 
 # Environment variables
 AUTO_DISSOLVE_HOURS = int(os.environ.get('AUTO_DISSOLVE_HOURS', '72'))
+INDEX_REBUILD_HOUR = int(os.environ.get('INDEX_REBUILD_HOUR', '0'))
 APP_ID_ARN = os.environ.get('APP_ID_ARN', '')
 APP_SECRET_ARN = os.environ.get('APP_SECRET_ARN', '')
 
@@ -40,15 +46,16 @@ def get_app_credentials():
     """Get Lark app credentials from Secrets Manager"""
     global _app_id, _app_secret
     
-    if _app_id is None:
-        response = secrets_client.get_secret_value(SecretId=APP_ID_ARN)
-        secret = json.loads(response['SecretString'])
-        _app_id = secret.get('app_id', '')
-    
-    if _app_secret is None:
-        response = secrets_client.get_secret_value(SecretId=APP_SECRET_ARN)
-        secret = json.loads(response['SecretString'])
-        _app_secret = secret.get('app_secret', '')
+    if _app_id is None or _app_secret is None:
+        # One BatchGetSecretValue call for both secrets instead of a GetSecretValue each
+        response = secrets_client.batch_get_secret_value(SecretIdList=[APP_ID_ARN, APP_SECRET_ARN])
+        if response.get('Errors'):
+            raise Exception(f"Failed to get Lark app credentials: {response['Errors']}")
+        secrets = {}
+        for value in response['SecretValues']:
+            secrets[value['ARN']] = secrets[value['Name']] = json.loads(value['SecretString'])
+        _app_id = secrets.get(APP_ID_ARN, {}).get('app_id', '')
+        _app_secret = secrets.get(APP_SECRET_ARN, {}).get('app_secret', '')
     
     return _app_id, _app_secret
 
@@ -125,10 +132,16 @@ def check_and_dissolve_resolved_cases() -> int:
     print(f"=== Group Cleanup (Auto-dissolve after {AUTO_DISSOLVE_HOURS} hours) ===")
     
     try:
-        all_cases = get_all_cases()
-        print(f"Found {len(all_cases)} total cases")
-        
         now = datetime.now(timezone.utc)
+        
+        # Only resolved cases with an undissolved case chat, not every case ever created;
+        # one run a day rescans all cases to repair the index
+        rebuild = now.hour == INDEX_REBUILD_HOUR
+        if rebuild:
+            print("Rebuilding dissolve-pending index from a full case scan")
+        all_cases = get_dissolve_pending_cases(rebuild=rebuild)
+        print(f"Found {len(all_cases)} resolved cases with active groups")
+        
         dissolved_count = 0
         
         for case in all_cases:
@@ -26,6 +26,7 @@ Usage:
     # Match command in any language
     matched, lang, remaining = match_command('create case test', 'create_case')
 """
+from functools import lru_cache
 
 # ============================================================
 # 默认语言设置 / Default Language Setting
@@ -463,6 +464,17 @@ def get_user_language(user_id: str = None, open_id: str = None, token_func=None,
         return DEFAULT_LANGUAGE
 
 
+@lru_cache(maxsize=1024)
+def _cached_message(lang: str, key: str) -> str:
+    """Resolve message template with language/key fallbacks (MESSAGES is static, no invalidation needed)"""
+    # Fallback to DEFAULT_LANGUAGE if language not supported
+    if lang not in MESSAGES:
+        lang = DEFAULT_LANGUAGE
+    
+    # Get message template (fallback to DEFAULT_LANGUAGE if key not found)
+    return MESSAGES[lang].get(key, MESSAGES[DEFAULT_LANGUAGE].get(key, key))
+
+
 def get_message(lang: str, key: str, *args) -> str:
     """
     Get localized message
@@ -475,12 +487,7 @@ def get_message(lang: str, key: str, *args) -> str:
     Returns:
         Localized message string
     """
-    # Fallback to DEFAULT_LANGUAGE if language not supported
-    if lang not in MESSAGES:
-        lang = DEFAULT_LANGUAGE
-    
-    # Get message template (fallback to DEFAULT_LANGUAGE if key not found)
-    template = MESSAGES[lang].get(key, MESSAGES[DEFAULT_LANGUAGE].get(key, key))
+    template = _cached_message(lang, key)
     
     # Format with arguments if provided
     if args:
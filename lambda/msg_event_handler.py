@@ -36,12 +36,22 @@ Environment Variables:
 - USER_WHITELIST: Enable user whitelist (true/false)
 """
 import json
+import logging
 import os
+import re
+import threading
+import time
 import boto3
 import urllib3
+from urllib3.util.retry import Retry
 import base64
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional, List
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 from aws_services_complete import (
     get_all_services_flat,
     get_services_for_issue_type,
@@ -56,15 +66,58 @@ from s3_storage import (
     get_case_by_chat_id as s3_get_case_by_chat_id,
     get_cases_by_user as s3_get_cases_by_user,
     get_case_by_case_chat_id,
-    scan_cases_by_filter
+    get_case_by_display_id,
+    scan_cases_by_filter,
+    mark_event_processed,
+    io_pool
 )
 
-# Initialize urllib3 PoolManager
-http = urllib3.PoolManager()
+# Hot-path logging goes through a level-checked logger (LOG_LEVEL=WARNING silences debug output)
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
+
+# Initialize urllib3 PoolManager (module-level so warm containers reuse keep-alive
+# connections to open.larksuite.com; maxsize covers the concurrent calls on _executor)
+http = urllib3.PoolManager(
+    num_pools=4,
+    maxsize=16,
+    block=False,
+    retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+)
+
+# Compact JSON encoder reused for request payloads and response bodies
+_encoder = json.JSONEncoder(separators=(',', ':')).encode
+
+# Shared 200 OK response for early returns. Returned by reference: it must not be
+# mutated (a plain dict, not a MappingProxyType, since the runtime JSON-serializes it)
+_OK_RESPONSE = {'statusCode': 200, 'body': _encoder({'message': 'OK'})}
+
+# Lark request/response (de)serialization. Stdlib only: the function code is deployed
+# without third-party packages (json.loads also accepts the UTF-8 response bytes)
+_loads = json.loads
+_dumps_str = _encoder
+
+
+def _dumps_bytes(obj) -> bytes:
+    return _encoder(obj).encode('utf-8')
+
 
-# Initialize AWS clients
-secrets_client = boto3.client('secretsmanager')
-sts_client = boto3.client('sts')
+# Shared thread pool for independent Lark API calls within a single event (the
+# container-wide I/O pool from s3_storage, so S3 and Lark calls share warm threads)
+_executor = io_pool
+
+# Initialize AWS clients from one session; adaptive retries and explicit timeouts
+# bound the tail latency of STS and the cross-account Support calls
+_boto_session = boto3.Session()
+_STS_CONFIG = Config(connect_timeout=1, read_timeout=3, retries={'mode': 'adaptive', 'max_attempts': 3})
+_AWS_CLIENT_CONFIG = Config(connect_timeout=2, read_timeout=15, retries={'mode': 'adaptive', 'max_attempts': 3},
+                            max_pool_connections=20)
+secrets_client = _boto_session.client('secretsmanager')
+sts_client = _boto_session.client('sts', config=_STS_CONFIG)
+# Self-invoke for async case submission; no retries since a failed invoke falls back to sync processing
+lambda_client = _boto_session.client('lambda', config=Config(connect_timeout=1, read_timeout=3,
+                                                             retries={'max_attempts': 1},
+                                                             max_pool_connections=8))
 
 # Environment variables
 APP_ID_ARN = os.environ['APP_ID_ARN']
@@ -82,13 +135,50 @@ _app_id = None
 _app_secret = None
 _encrypt_key = None
 _verification_token = None
-_bot_config = None
 _tenant_access_token = None
+_tenant_access_token_expiry = 0
+TOKEN_REFRESH_MARGIN = 300  # Refresh the Lark token 5 minutes before it expires
 _bot_open_id = None
 
-# Event deduplication cache (in-memory for Lambda warm starts)
-_processed_events = {}
+# Assumed-role credential cache: role_arn -> (credentials, expiration_ts)
+_credentials_cache = {}
+
+# Recent AssumeRole failures: role_arn -> (error, retry_after_ts)
+_assume_role_failures = {}
+ASSUME_ROLE_FAILURE_TTL = 60  # Don't retry a failing role for 1 minute
+
+# Assumed-role client cache: (service, role_arn, region) -> (client, expiration_ts)
+_client_cache = {}
+# Guards client construction: concurrent history fetches would otherwise each build
+# the same client, and a boto3 Session is not safe to build clients on in parallel
+_client_cache_lock = threading.Lock()
+CLIENT_REFRESH_MARGIN = 300  # Refresh clients 5 minutes before credentials expire
+
+# Case chat -> case lookup cache TTL (seconds)
+CASE_CHAT_CACHE_TTL = 30
+
+# History shows S3 data as-is for cases the poller checked this recently (seconds)
+HISTORY_FRESH_SECONDS = 60
+
+# Max characters of a synced message echoed back in the confirmation
+SYNC_PREVIEW_LENGTH = 50
+
+# Bot config cache TTL (seconds)
+BOT_CONFIG_CACHE_TTL = 60
+
+# User display name cache TTL (seconds) - names rarely change
+USER_INFO_CACHE_TTL = 300
+
+# Recently added chat members: (chat_id, open_id) -> added timestamp
+_recently_added = {}
+RECENTLY_ADDED_TTL = 60
+
+# Event deduplication cache (in-memory for Lambda warm starts): event_id -> expiry timestamp
+# Kept in insertion order, which is expiry order, so trimming pops from the front
+_processed_events = OrderedDict()
 MAX_CACHE_SIZE = 100
+PROCESSED_EVENTS_KEEP = 50
+EVENT_DEDUP_TTL = 300  # 5 minutes
 
 
 def get_dual_timezone_time() -> str:
@@ -136,19 +226,33 @@ def format_aws_time_dual(aws_time_str: str) -> str:
         return aws_time_str
 
 
+def run_concurrently(*calls):
+    """Run independent zero-argument callables concurrently
+    
+    Each call is one blocking HTTP round trip; running them on the shared pool
+    overlaps their network latency instead of paying it sequentially.
+    
+    Returns:
+        List of results in the same order as calls (first exception is re-raised)
+    """
+    futures = [_executor.submit(call) for call in calls]
+    return [future.result() for future in futures]
+
+
 def get_app_credentials():
-    """Get Lark app credentials from Secrets Manager"""
+    """Get Lark app credentials from Secrets Manager (cached for the container lifetime)"""
     global _app_id, _app_secret
     
-    if _app_id is None:
-        response = secrets_client.get_secret_value(SecretId=APP_ID_ARN)
-        secret = json.loads(response['SecretString'])
-        _app_id = secret.get('app_id', '')
-    
-    if _app_secret is None:
-        response = secrets_client.get_secret_value(SecretId=APP_SECRET_ARN)
-        secret = json.loads(response['SecretString'])
-        _app_secret = secret.get('app_secret', '')
+    if _app_id is None or _app_secret is None:
+        # One BatchGetSecretValue call for both secrets instead of a GetSecretValue each
+        response = secrets_client.batch_get_secret_value(SecretIdList=[APP_ID_ARN, APP_SECRET_ARN])
+        if response.get('Errors'):
+            raise Exception(f"Failed to get Lark app credentials: {response['Errors']}")
+        secrets = {}
+        for value in response['SecretValues']:
+            secrets[value['ARN']] = secrets[value['Name']] = json.loads(value['SecretString'])
+        _app_id = secrets.get(APP_ID_ARN, {}).get('app_id', '')
+        _app_secret = secrets.get(APP_SECRET_ARN, {}).get('app_secret', '')
     
     return _app_id, _app_secret
 
@@ -347,14 +451,21 @@ def decrypt_lark_event(encrypt_data: str) -> dict:
     cipher = AESCipher(encrypt_key)
     decrypted_str = cipher.decrypt(encrypt_data)
     
-    return json.loads(decrypted_str)
+    return _loads(decrypted_str)
 
 
 def get_tenant_access_token():
-    """Get Lark tenant access token"""
-    global _tenant_access_token
+    """Get Lark tenant access token
+    
+    The token is cached until TOKEN_REFRESH_MARGIN seconds before it expires
+    (Lark tenant tokens are valid for ~2 hours), so warm invocations skip the
+    auth round trip on every Lark API call.
+    """
+    global _tenant_access_token, _tenant_access_token_expiry
+    
+    if _tenant_access_token and time.time() < _tenant_access_token_expiry:
+        return _tenant_access_token
     
-    # TODO: Implement token caching with expiration
     app_id, app_secret = get_app_credentials()
     
     url = "https://open.larksuite.com/open-apis/auth/v3/tenant_access_token/internal"
@@ -363,7 +474,7 @@ def get_tenant_access_token():
         "app_secret": app_secret
     }
     
-    encoded_data = json.dumps(payload).encode('utf-8')
+    encoded_data = _dumps_bytes(payload)
     response = http.request(
         'POST',
         url,
@@ -371,10 +482,11 @@ def get_tenant_access_token():
         headers={'Content-Type': 'application/json'}
     )
     
-    result = json.loads(response.data.decode('utf-8'))
+    result = _loads(response.data)
     
     if result.get('code') == 0:
         _tenant_access_token = result.get('tenant_access_token')
+        _tenant_access_token_expiry = time.time() + result.get('expire', 7200) - TOKEN_REFRESH_MARGIN
         return _tenant_access_token
     else:
         raise Exception(f"Failed to get tenant access token: {result}")
@@ -393,7 +505,7 @@ def get_bot_open_id() -> str:
         'GET', url,
         headers={'Authorization': f'Bearer {token}'}
     )
-    result = json.loads(response.data.decode('utf-8'))
+    result = _loads(response.data)
     
     if result.get('code') == 0:
         _bot_open_id = result.get('bot', {}).get('open_id', '')
@@ -403,16 +515,16 @@ def get_bot_open_id() -> str:
     return ''
 
 
-def get_user_info(user_id: str = None, open_id: str = None) -> Dict[str, str]:
-    """Get user information from Lark API
+class _UserInfoLookupError(Exception):
+    """A Lark user lookup failed; fallback is the user info to show instead"""
     
-    Args:
-        user_id: Lark user_id (internal ID)
-        open_id: Lark open_id (app-level ID)
-    
-    Returns:
-        Dict with 'name', 'en_name', 'email'
-    """
+    def __init__(self, message: str, fallback: Dict[str, str]):
+        super().__init__(message)
+        self.fallback = fallback
+
+
+def _fetch_user_info(user_id: str = None, open_id: str = None) -> Dict[str, str]:
+    """Get user information from Lark API, raising _UserInfoLookupError on failure"""
     try:
         token = get_tenant_access_token()
         
@@ -433,7 +545,7 @@ def get_user_info(user_id: str = None, open_id: str = None) -> Dict[str, str]:
         
         print(f"Requesting user info from: {url}")
         response = http.request('GET', url, headers=headers)
-        result = json.loads(response.data.decode('utf-8'))
+        result = _loads(response.data)
         print(f"User API response: {result}")
         
         if result.get('code') == 0:
@@ -445,10 +557,68 @@ def get_user_info(user_id: str = None, open_id: str = None) -> Dict[str, str]:
             }
         else:
             print(f"Failed to get user info: {result}")
-            return {'name': fallback_name}
+            raise _UserInfoLookupError(f"Lark user lookup failed: {result}", {'name': fallback_name})
+    except _UserInfoLookupError:
+        raise
     except Exception as e:
         print(f"Error getting user info: {e}")
-        return {'name': fallback_name if 'fallback_name' in locals() else 'Unknown User'}
+        fallback = {'name': fallback_name if 'fallback_name' in locals() else 'Unknown User'}
+        raise _UserInfoLookupError(str(e), fallback) from e
+
+
+def get_user_info(user_id: str = None, open_id: str = None) -> Dict[str, str]:
+    """Get user information from Lark API
+    
+    Args:
+        user_id: Lark user_id (internal ID)
+        open_id: Lark open_id (app-level ID)
+    
+    Returns:
+        Dict with 'name', 'en_name', 'email' (just 'name', the ID, if the lookup fails)
+    """
+    try:
+        return _fetch_user_info(user_id, open_id)
+    except _UserInfoLookupError as e:
+        return e.fallback
+
+
+@lru_cache(maxsize=256)
+def _user_info_bucketed(user_id: str, open_id: str, epoch_bucket: int) -> Dict[str, str]:
+    """Cache user info lookups per time bucket (a new bucket is a cache miss)
+    
+    Failed lookups raise, and lru_cache does not cache exceptions, so a transient
+    Lark error is retried on the next call instead of being served for the bucket.
+    """
+    return _fetch_user_info(user_id=user_id, open_id=open_id)
+
+
+def get_cached_user_info(user_id: str = None, open_id: str = None) -> Dict[str, str]:
+    """Get user information, cached for USER_INFO_CACHE_TTL seconds (successful lookups only)
+    
+    The returned dict is shared between calls and must not be mutated.
+    """
+    try:
+        return _user_info_bucketed(user_id, open_id, int(time.time() // USER_INFO_CACHE_TTL))
+    except _UserInfoLookupError as e:
+        return e.fallback
+
+
+def get_member_display_name(user_id: str = None, open_id: str = None) -> str:
+    """Get the name shown as message author in AWS Support communications
+    
+    Uses the cached user info (failed lookups fall back to the ID and are not
+    cached); names that are still an ID become 'Team Member'.
+    """
+    try:
+        user_name = get_cached_user_info(user_id, open_id).get('name', 'Team Member')
+    except Exception as e:
+        print(f"Failed to get user name, using default: {e}")
+        return 'Team Member'
+    
+    # If name is ID format, use generic name
+    if user_name.startswith('ou_') or user_name.startswith('on_'):
+        return 'Team Member'
+    return user_name
 
 
 def send_message(chat_id: str, msg_type: str, content: dict, reply_to_message_id: str = None):
@@ -470,7 +640,7 @@ def send_message(chat_id: str, msg_type: str, content: dict, reply_to_message_id
     payload = {
         "receive_id": chat_id,
         "msg_type": msg_type,
-        "content": json.dumps(content)
+        "content": _dumps_str(content)
     }
     
     # Add reply reference if provided
@@ -479,7 +649,7 @@ def send_message(chat_id: str, msg_type: str, content: dict, reply_to_message_id
         # Use uuid parameter to reference the original message
         url = f"https://open.larksuite.com/open-apis/im/v1/messages/{reply_to_message_id}/reply"
     
-    encoded_data = json.dumps(payload).encode('utf-8')
+    encoded_data = _dumps_bytes(payload)
     response = http.request(
         'POST',
         url,
@@ -487,7 +657,7 @@ def send_message(chat_id: str, msg_type: str, content: dict, reply_to_message_id
         headers=headers
     )
     
-    result = json.loads(response.data.decode('utf-8'))
+    result = _loads(response.data)
     
     if result.get('code') != 0:
         # 200341 is card expired error, this is normal and should not throw exception
@@ -512,10 +682,10 @@ def send_card(chat_id: str, card: dict):
     payload = {
         "receive_id": chat_id,
         "msg_type": "interactive",
-        "content": json.dumps(card)
+        "content": _dumps_str(card)
     }
     
-    encoded_data = json.dumps(payload).encode('utf-8')
+    encoded_data = _dumps_bytes(payload)
     response = http.request(
         'POST',
         url,
@@ -523,7 +693,7 @@ def send_card(chat_id: str, card: dict):
         headers=headers
     )
     
-    result = json.loads(response.data.decode('utf-8'))
+    result = _loads(response.data)
     
     if result.get('code') != 0:
         print(f"Failed to send card: {result}")
@@ -548,7 +718,7 @@ def recall_message(message_id: str):
         headers=headers
     )
     
-    result = json.loads(response.data.decode('utf-8'))
+    result = _loads(response.data)
     
     if result.get('code') != 0:
         print(f"Failed to recall message: {result}")
@@ -557,6 +727,15 @@ def recall_message(message_id: str):
     return result
 
 
+def recall_old_card(message_id: str):
+    """Recall a superseded case card, logging instead of raising on failure"""
+    try:
+        recall_message(message_id)
+        print(f"Recalled old card message: {message_id}")
+    except Exception as e:
+        print(f"Failed to recall old card {message_id}: {e}")
+
+
 def send_post_message(chat_id: str, title: str, content: list):
     """Send rich text post message to Lark chat (supports bold, links, etc.)"""
     token = get_tenant_access_token()
@@ -577,10 +756,10 @@ def send_post_message(chat_id: str, title: str, content: list):
     payload = {
         "receive_id": chat_id,
         "msg_type": "post",
-        "content": json.dumps(post_content)
+        "content": _dumps_str(post_content)
     }
     
-    encoded_data = json.dumps(payload).encode('utf-8')
+    encoded_data = _dumps_bytes(payload)
     response = http.request(
         'POST',
         url,
@@ -588,7 +767,7 @@ def send_post_message(chat_id: str, title: str, content: list):
         headers=headers
     )
     
-    result = json.loads(response.data.decode('utf-8'))
+    result = _loads(response.data)
     
     if result.get('code') != 0:
         print(f"Failed to send post message: {result}")
@@ -612,7 +791,7 @@ def create_group_chat(name: str, user_ids: List[str]) -> str:
         "user_id_list": user_ids
     }
     
-    encoded_data = json.dumps(payload).encode('utf-8')
+    encoded_data = _dumps_bytes(payload)
     response = http.request(
         'POST',
         url,
@@ -620,7 +799,7 @@ def create_group_chat(name: str, user_ids: List[str]) -> str:
         headers=headers
     )
     
-    result = json.loads(response.data.decode('utf-8'))
+    result = _loads(response.data)
     
     if result.get('code') == 0:
         return result['data']['chat_id']
@@ -645,7 +824,7 @@ def dissolve_group_chat(chat_id: str) -> dict:
         }
         
         response = http.request('DELETE', url, headers=headers)
-        result = json.loads(response.data.decode('utf-8'))
+        result = _loads(response.data)
         
         print(f"Dissolve group chat response: {result}")
         
@@ -678,14 +857,19 @@ def download_file(file_key: str) -> bytes:
         raise Exception(f"Failed to download file: {response.status}")
 
 
+@lru_cache(maxsize=1)
+def _bot_config_bucketed(epoch_bucket: int) -> Dict[str, Any]:
+    """Cache the bot config per time bucket (a new bucket is a cache miss)"""
+    return s3_get_bot_config(CFG_KEY) or {}
+
+
 def get_bot_config():
-    """Get bot configuration from S3"""
-    global _bot_config
-    
-    if _bot_config is None:
-        _bot_config = s3_get_bot_config(CFG_KEY) or {}
+    """Get bot configuration from S3, cached for BOT_CONFIG_CACHE_TTL seconds
     
-    return _bot_config
+    Warm containers skip the S3 GET, and config edits (e.g. accounts added by
+    setup) are picked up within the TTL instead of waiting for a cold start.
+    """
+    return _bot_config_bucketed(int(time.time() // BOT_CONFIG_CACHE_TTL))
 
 
 def check_user_whitelist(user_id: str) -> bool:
@@ -745,14 +929,68 @@ def match_command(text: str, command_key: str) -> tuple:
     return (False, 'zh', '')
 
 
+def account_id_from_role_arn(role_arn: str, default: str = 'Unknown') -> str:
+    """Extract account ID from role_arn (format: arn:aws:iam::123456789012:role/...)
+    
+    Splits at most 5 times so the resource part after the account ID is never scanned.
+    """
+    parts = role_arn.split(':', 5)
+    return parts[4] if len(parts) >= 5 else default
+
+
+@lru_cache(maxsize=128)
+def _mention_pattern(mention_keys: tuple) -> re.Pattern:
+    """Compile one alternation regex for a set of mention keys"""
+    return re.compile('|'.join(map(re.escape, mention_keys)))
+
+
+def strip_mentions(text: str, mention_keys: List[str]) -> str:
+    """Remove all @mention placeholders (e.g. @_user_1) from text in a single pass"""
+    keys = tuple(key for key in mention_keys if key)
+    if not keys:
+        return text.strip()
+    return _mention_pattern(keys).sub('', text).strip()
+
+
 def get_case_by_chat_id(chat_id: str) -> Optional[Dict[str, Any]]:
     """Get case information by chat_id"""
     return s3_get_case_by_chat_id(chat_id)
 
 
-def get_cases_by_user(user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+@lru_cache(maxsize=512)
+def _case_by_case_chat_id_bucketed(case_chat_id: str, epoch_bucket: int) -> Optional[Dict[str, Any]]:
+    """Cache case_chat_id lookups per time bucket (a new bucket is a cache miss)"""
+    return get_case_by_case_chat_id(case_chat_id)
+
+
+def get_cached_case_by_case_chat_id(case_chat_id: str) -> Optional[Dict[str, Any]]:
+    """Get case by case_chat_id, cached for CASE_CHAT_CACHE_TTL seconds
+    
+    The case chat -> case mapping does not change during the chat's lifetime,
+    so repeat messages in the same chat skip the S3 index + case GETs.
+    The returned dict is shared between calls and must not be mutated.
+    """
+    return _case_by_case_chat_id_bucketed(case_chat_id, int(time.time() // CASE_CHAT_CACHE_TTL))
+
+
+def is_recently_checked(case: Dict[str, Any]) -> bool:
+    """Check whether the case poller refreshed this case's S3 record within HISTORY_FRESH_SECONDS"""
+    last_checked = case.get('last_checked')
+    if not last_checked:
+        return False
+    try:
+        checked_at = datetime.fromisoformat(last_checked)
+    except ValueError:
+        return False
+    if checked_at.tzinfo is None:
+        checked_at = checked_at.replace(tzinfo=timezone.utc)
+    age = (datetime.now(timezone.utc) - checked_at).total_seconds()
+    return age < HISTORY_FRESH_SECONDS
+
+
+def get_cases_by_user(user_id: str, limit: int = 10, exclude_drafts: bool = False) -> List[Dict[str, Any]]:
     """Get user's recent cases"""
-    return s3_get_cases_by_user(user_id, limit)
+    return s3_get_cases_by_user(user_id, limit, exclude_drafts)
 
 
 def save_case_info(case_id: str, display_id: str, chat_id: str, user_id: str, 
@@ -788,26 +1026,77 @@ def save_case_info(case_id: str, display_id: str, chat_id: str, user_id: str,
     put_case(case_id, item)
 
 
-def add_communication_to_case(role_arn: str, case_id: str, body: str, 
-                              attachment_set_id: str = None) -> bool:
-    """Add communication to AWS Support case"""
+def _assume_role_credentials(role_arn: str) -> Dict[str, Any]:
+    """Get STS credentials for role_arn, reusing them until CLIENT_REFRESH_MARGIN before expiry
+    
+    Shared by every service client for the same role, so e.g. the Support and
+    Cost Explorer clients of one account cost a single AssumeRole call. Failures
+    are remembered for ASSUME_ROLE_FAILURE_TTL seconds and re-raised without
+    calling STS again.
+    """
+    cached = _credentials_cache.get(role_arn)
+    if cached and cached[1] - time.time() > CLIENT_REFRESH_MARGIN:
+        return cached[0]
+    
+    # A misconfigured role fails fast instead of paying the STS round trip on every request
+    failure = _assume_role_failures.get(role_arn)
+    if failure and time.time() < failure[1]:
+        raise failure[0]
+    
     try:
-        # Assume role
-        assumed_role = sts_client.assume_role(
+        credentials = sts_client.assume_role(
             RoleArn=role_arn,
-            RoleSessionName='LarkCaseBotAddCommunication'
-        )
-        
-        credentials = assumed_role['Credentials']
-        
-        # Create Support client
-        support_client = boto3.client(
-            'support',
-            region_name='us-east-1',
+            RoleSessionName='LarkCaseBot'
+        )['Credentials']
+    except (ClientError, BotoCoreError) as e:
+        _assume_role_failures[role_arn] = (e, time.time() + ASSUME_ROLE_FAILURE_TTL)
+        raise
+    _assume_role_failures.pop(role_arn, None)
+    _credentials_cache[role_arn] = (credentials, credentials['Expiration'].timestamp())
+    return credentials
+
+
+def _make_assumed_client(service: str, role_arn: str, region: str = 'us-east-1'):
+    """Get a boto3 client for service in the account behind role_arn
+    
+    Clients are cached per (service, role_arn, region) for the lifetime of the
+    assumed-role credentials, so warm invocations skip STS AssumeRole entirely.
+    
+    Args:
+        service: boto3 service name (e.g. 'support', 'ce')
+        role_arn: IAM role ARN to assume
+        region: Client region (Support API is only available in us-east-1)
+    """
+    key = (service, role_arn, region)
+    cached = _client_cache.get(key)
+    if cached and cached[1] - time.time() > CLIENT_REFRESH_MARGIN:
+        return cached[0]
+    
+    with _client_cache_lock:
+        # Another thread may have built the client while we waited
+        cached = _client_cache.get(key)
+        if cached and cached[1] - time.time() > CLIENT_REFRESH_MARGIN:
+            return cached[0]
+        
+        credentials = _assume_role_credentials(role_arn)
+        
+        client = _boto_session.client(
+            service,
+            region_name=region,
+            config=_AWS_CLIENT_CONFIG,
             aws_access_key_id=credentials['AccessKeyId'],
             aws_secret_access_key=credentials['SecretAccessKey'],
             aws_session_token=credentials['SessionToken']
         )
+        _client_cache[key] = (client, credentials['Expiration'].timestamp())
+        return client
+
+
+def add_communication_to_case(role_arn: str, case_id: str, body: str, 
+                              attachment_set_id: str = None) -> bool:
+    """Add communication to AWS Support case"""
+    try:
+        support_client = _make_assumed_client('support', role_arn)
         
         # Add communication
         params = {
@@ -819,7 +1108,7 @@ def add_communication_to_case(role_arn: str, case_id: str, body: str,
             params['attachmentSetId'] = attachment_set_id
         
         response = support_client.add_communication_to_case(**params)
-        print(f"Add communication response: {json.dumps(response, default=str)}")
+        logger.debug("Add communication response: %s", response)
         
         return True
     
@@ -833,22 +1122,7 @@ def add_communication_to_case(role_arn: str, case_id: str, body: str,
 def get_case_communications(role_arn: str, case_id: str) -> List[Dict[str, Any]]:
     """Get communications for a case from AWS Support"""
     try:
-        # Assume role
-        assumed_role = sts_client.assume_role(
-            RoleArn=role_arn,
-            RoleSessionName='LarkCaseBotGetCommunications'
-        )
-        
-        credentials = assumed_role['Credentials']
-        
-        # Create Support client
-        support_client = boto3.client(
-            'support',
-            region_name='us-east-1',
-            aws_access_key_id=credentials['AccessKeyId'],
-            aws_secret_access_key=credentials['SecretAccessKey'],
-            aws_session_token=credentials['SessionToken']
-        )
+        support_client = _make_assumed_client('support', role_arn)
         
         # Get case details with communications
         response = support_client.describe_cases(
@@ -876,22 +1150,7 @@ def get_case_communications(role_arn: str, case_id: str) -> List[Dict[str, Any]]
 def upload_attachment_to_support(role_arn: str, file_data: bytes, file_name: str) -> Optional[str]:
     """Upload attachment to AWS Support"""
     try:
-        # Assume role
-        assumed_role = sts_client.assume_role(
-            RoleArn=role_arn,
-            RoleSessionName='LarkCaseBotUploadAttachment'
-        )
-        
-        credentials = assumed_role['Credentials']
-        
-        # Create Support client
-        support_client = boto3.client(
-            'support',
-            region_name='us-east-1',
-            aws_access_key_id=credentials['AccessKeyId'],
-            aws_secret_access_key=credentials['SecretAccessKey'],
-            aws_session_token=credentials['SessionToken']
-        )
+        support_client = _make_assumed_client('support', role_arn)
         
         # Create attachment set
         response = support_client.add_attachments_to_set(
@@ -914,20 +1173,9 @@ def get_services_from_cost_explorer(role_arn: Optional[str] = None) -> List[str]
     """Get services from Cost Explorer"""
     try:
         if role_arn:
-            assumed_role = sts_client.assume_role(
-                RoleArn=role_arn,
-                RoleSessionName='LarkCaseBotCostExplorer'
-            )
-            credentials = assumed_role['Credentials']
-            ce = boto3.client(
-                'ce',
-                region_name='us-east-1',
-                aws_access_key_id=credentials['AccessKeyId'],
-                aws_secret_access_key=credentials['SecretAccessKey'],
-                aws_session_token=credentials['SessionToken']
-            )
+            ce = _make_assumed_client('ce', role_arn)
         else:
-            ce = boto3.client('ce', region_name='us-east-1')
+            ce = _boto_session.client('ce', region_name='us-east-1', config=_AWS_CLIENT_CONFIG)
         
         end_date = datetime.now().date()
         start_date = end_date - timedelta(days=30)
@@ -983,20 +1231,7 @@ def create_support_case(role_arn: str, subject: str, description: str,
                        issue_type: str = 'technical') -> Dict[str, Any]:
     """Create AWS Support case"""
     try:
-        assumed_role = sts_client.assume_role(
-            RoleArn=role_arn,
-            RoleSessionName='LarkCaseBot'
-        )
-        
-        credentials = assumed_role['Credentials']
-        
-        support_client = boto3.client(
-            'support',
-            region_name='us-east-1',
-            aws_access_key_id=credentials['AccessKeyId'],
-            aws_secret_access_key=credentials['SecretAccessKey'],
-            aws_session_token=credentials['SessionToken']
-        )
+        support_client = _make_assumed_client('support', role_arn)
         
         # If no valid categoryCode provided, try to get supported categories for this service
         print(f"Initial category_code: '{category_code}', service_code: '{service_code}', issue_type: '{issue_type}'")
@@ -1010,7 +1245,7 @@ def create_support_case(role_arn: str, subject: str, description: str,
                     language=CASE_LANGUAGE
                 )
                 
-                print(f"describe_services response: {json.dumps(categories_response, default=str)}")
+                logger.debug("describe_services response: %s", categories_response)
                 
                 services = categories_response.get('services', [])
                 if services and services[0].get('categories'):
@@ -1058,29 +1293,30 @@ def create_support_case(role_arn: str, subject: str, description: str,
             'issueType': issue_type
         }
         
-        print(f"Attempting to create case with params: {json.dumps({k: v for k, v in create_params.items() if k != 'communicationBody'})}")
+        logger.debug("Attempting to create case with params: %s",
+                     {k: v for k, v in create_params.items() if k != 'communicationBody'})
         
         try:
             response = support_client.create_case(**create_params)
-            print(f"Support API response: {json.dumps(response)}")
-        except Exception as first_error:
+            logger.debug("Support API response: %s", response)
+        except ClientError as first_error:
             # If the first attempt fails with InvalidParameterValueException,
             # try without issueType parameter (let AWS auto-determine it)
-            if 'InvalidParameterValueException' in str(first_error):
-                print(f"First attempt failed: {first_error}")
-                print(f"Retrying without issueType parameter...")
-                
-                create_params_retry = create_params.copy()
-                del create_params_retry['issueType']
-                
-                try:
-                    response = support_client.create_case(**create_params_retry)
-                    print(f"Retry succeeded! Response: {json.dumps(response)}")
-                except Exception as second_error:
-                    print(f"Second attempt also failed: {second_error}")
-                    raise second_error
-            else:
-                raise first_error
+            error_code = first_error.response.get('Error', {}).get('Code', '')
+            if error_code != 'InvalidParameterValueException':
+                raise
+            
+            print(f"First attempt failed: {first_error}")
+            print(f"Retrying without issueType parameter...")
+            
+            create_params.pop('issueType', None)
+            
+            try:
+                response = support_client.create_case(**create_params)
+                logger.debug("Retry succeeded! Response: %s", response)
+            except ClientError as second_error:
+                print(f"Second attempt also failed: {second_error}")
+                raise
         
         # AWS Support API returns caseId in format "case-xxx-xxx-xxx"
         # displayId is the short numeric ID, if API doesn't return it, we need to extract or query
@@ -1117,44 +1353,90 @@ def create_support_case(role_arn: str, subject: str, description: str,
 
 # Continue to next section...
 
+# AWS Support severity codes (sorted from low to high); the set is for O(1) membership checks
+SEVERITY_CODES = ('low', 'normal', 'high', 'urgent', 'critical')
+_SEVERITY_CODE_SET = frozenset(SEVERITY_CODES)
 
-def create_case_card(accounts: Dict[str, Dict[str, str]], subject: str = "", lang: str = "zh", creator_name: str = "", creator_id: str = "") -> Dict[str, Any]:
-    """Create case card: contains all required information
+# Issue type display names, flattened from ISSUE_TYPES once at import
+_ISSUE_TYPE_NAMES = {code: info.get('name', code) for code, info in ISSUE_TYPES.items()}
+
+# Card severity dropdown options (sorted from low to high) per language, built once at import
+_SEVERITY_OPTIONS = {
+    lang: tuple(
+        {"text": {"tag": "plain_text", "content": get_message(lang, f'card_severity_{code}')}, "value": code}
+        for code in ('low', 'normal', 'high', 'urgent')
+    )
+    for lang in MESSAGES
+}
+
+# Card assistant help text per language, assembled once at import
+_CARD_HELP_TEXT = {
+    lang: (
+        f"**{get_message(lang, 'card_assistant_title')}**\n\n"
+        f"{get_message(lang, 'card_create_flow')}\n"
+        f"{get_message(lang, 'card_create_step1')}\n"
+        f"{get_message(lang, 'card_create_step2')}\n"
+        f"{get_message(lang, 'card_create_step3')}\n\n"
+        f"{get_message(lang, 'card_communication')}\n"
+        f"{get_message(lang, 'card_comm_sync')}\n"
+        f"{get_message(lang, 'card_comm_upload')}\n"
+        f"{get_message(lang, 'card_comm_internal')}\n\n"
+        f"{get_message(lang, 'card_tips')}\n"
+        f"{get_message(lang, 'card_tip1')}\n"
+        f"{get_message(lang, 'card_tip2')}\n"
+        f"{get_message(lang, 'card_tip3')}\n"
+        f"{get_message(lang, 'card_tip4')}"
+    )
+    for lang in MESSAGES
+}
+
+# Card creator label per language
+_CREATOR_LABEL = {'zh': '创建者', 'en': 'Created by'}
+
+# Pre-bound formatters for card dropdown option labels
+_ACCT_FMT = "{} - {}".format
+_STAR_FMT = "⭐ {}".format
+
+
+@lru_cache(maxsize=4)
+def _service_options(lang: str) -> tuple:
+    """Build the service dropdown options once per language (service list is static)
     
-    Args:
-        accounts: Account configuration dict
-        subject: Case title
-        lang: Language code ('zh' or 'en')
-        creator_name: Name of the user who created this card
-        creator_id: User ID of the creator (for validation)
+    Returns a tuple of shared option dicts - callers must not mutate them.
     """
+    return tuple(
+        {"text": {"tag": "plain_text", "content": svc["name"]}, "value": svc["code"]}
+        for svc in islice(get_all_services_flat(), 80)
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_card_skeleton(lang: str, accounts_frozen: tuple) -> str:
+    """Build the static parts of the case card once per (lang, accounts)
     
-    # Severity levels (sorted from low to high) - localized
-    severities = [
-        {'name': get_message(lang, 'card_severity_low'), 'code': 'low'},
-        {'name': get_message(lang, 'card_severity_normal'), 'code': 'normal'},
-        {'name': get_message(lang, 'card_severity_high'), 'code': 'high'},
-        {'name': get_message(lang, 'card_severity_urgent'), 'code': 'urgent'}
-    ]
+    Everything except subject and creator info is identical across calls, so the
+    skeleton is built once and stored as a JSON string; json.loads gives each
+    caller a fresh copy that is safe to mutate.
+    
+    Args:
+        lang: Language code ('zh' or 'en')
+        accounts_frozen: Tuple of (account_key, account_name, role_arn) in config order
     
+    Returns:
+        JSON string with 'header', 'account_elements', 'select_elements',
+        'submit_action' and 'help_elements'
+    """
     # Build account options
     account_options = []
-    for account_key, account_info in accounts.items():
-        account_name = account_info.get('account_name', f'Account {account_key}')
-        role_arn = account_info.get('role_arn', '')
-        # Extract account ID from role_arn
-        account_id = role_arn.split(':')[4] if ':' in role_arn else 'Unknown'
+    for account_key, account_name, role_arn in accounts_frozen:
+        account_id = account_id_from_role_arn(role_arn)
         account_options.append({
-            "text": {"tag": "plain_text", "content": f"{account_id} - {account_name}"},
+            "text": {"tag": "plain_text", "content": _ACCT_FMT(account_id, account_name)},
             "value": account_key
         })
     
-    # Get all services
-    all_services = get_all_services_flat()
-    
     # Use all services list directly, no longer fetching from Cost Explorer
     recent_services = []
-    other_services = all_services
     
     # Build service options
     service_options = []
@@ -1162,7 +1444,7 @@ def create_case_card(accounts: Dict[str, Dict[str, str]], subject: str = "", lan
     if recent_services:
         for svc in recent_services[:20]:
             service_options.append({
-                "text": {"tag": "plain_text", "content": f"⭐ {svc['name']}"},
+                "text": {"tag": "plain_text", "content": _STAR_FMT(svc['name'])},
                 "value": svc["code"]
             })
         
@@ -1171,42 +1453,24 @@ def create_case_card(accounts: Dict[str, Dict[str, str]], subject: str = "", lan
             "value": "separator"
         })
     
-    for svc in (other_services if other_services else all_services)[:80]:
-        service_options.append({
-            "text": {"tag": "plain_text", "content": svc["name"]},
-            "value": svc["code"]
-        })
-    
-    # Build card elements
-    elements = []
+    service_options.extend(_service_options(lang))
     
     # Always show account selection dropdown (even if only one account)
+    account_elements = []
     if len(account_options) > 0:
-        elements.extend([
-            {
-                "tag": "div",
-                "text": {"tag": "lark_md", "content": f"**{get_message(lang, 'card_aws_account')}**"},
-                "extra": {
-                    "tag": "select_static",
-                    "name": "account",
-                    "placeholder": {"tag": "plain_text", "content": get_message(lang, 'card_select_account')},
-                    "options": account_options
-                }
+        account_elements.append({
+            "tag": "div",
+            "text": {"tag": "lark_md", "content": f"**{get_message(lang, 'card_aws_account')}**"},
+            "extra": {
+                "tag": "select_static",
+                "name": "account",
+                "placeholder": {"tag": "plain_text", "content": get_message(lang, 'card_select_account')},
+                "options": account_options
             }
-        ])
-    
-    # Display case title
-    if subject:
-        elements.extend([
-            {
-                "tag": "div",
-                "text": {"tag": "lark_md", "content": f"**{get_message(lang, 'card_case_title')}**\n{subject}"}
-            },
-            {"tag": "hr"}
-        ])
+        })
     
-    # Add dropdowns
-    elements.extend([
+    # Service and severity dropdowns
+    select_elements = [
         {
             "tag": "div",
             "text": {"tag": "lark_md", "content": f"**{get_message(lang, 'card_aws_service')}** ({len(service_options)})"},
@@ -1224,103 +1488,107 @@ def create_case_card(accounts: Dict[str, Dict[str, str]], subject: str = "", lan
                 "tag": "select_static",
                 "name": "severity",
                 "placeholder": {"tag": "plain_text", "content": get_message(lang, 'card_select_severity')},
-                "options": [
-                    {"text": {"tag": "plain_text", "content": sev["name"]}, "value": sev["code"]}
-                    for sev in severities
-                ]
+                "options": list(_SEVERITY_OPTIONS.get(lang) or _SEVERITY_OPTIONS[DEFAULT_LANGUAGE])
             }
         },
-        {"tag": "hr"},
-        {
-            "tag": "action",
-            "actions": [
-                {
-                    "tag": "button",
-                    "text": {
-                        "tag": "plain_text",
-                        "content": get_message(lang, 'card_submit')
-                    },
-                    "type": "primary",
-                    "value": {"action": "submit_case", "subject": subject}
-                }
-            ]
-        },
+        {"tag": "hr"}
+    ]
+    
+    # Submit button (kept separate so callers fill in its value without scanning elements)
+    submit_action = {
+        "tag": "action",
+        "actions": [
+            {
+                "tag": "button",
+                "text": {
+                    "tag": "plain_text",
+                    "content": get_message(lang, 'card_submit')
+                },
+                "type": "primary",
+                "value": {"action": "submit_case", "subject": ""}
+            }
+        ]
+    }
+    
+    # Assistant help text
+    help_elements = [
         {
             "tag": "div",
             "text": {
                 "tag": "lark_md",
-                "content": (
-                    f"**{get_message(lang, 'card_assistant_title')}**\n\n"
-                    f"{get_message(lang, 'card_create_flow')}\n"
-                    f"{get_message(lang, 'card_create_step1')}\n"
-                    f"{get_message(lang, 'card_create_step2')}\n"
-                    f"{get_message(lang, 'card_create_step3')}\n\n"
-                    f"{get_message(lang, 'card_communication')}\n"
-                    f"{get_message(lang, 'card_comm_sync')}\n"
-                    f"{get_message(lang, 'card_comm_upload')}\n"
-                    f"{get_message(lang, 'card_comm_internal')}\n\n"
-                    f"{get_message(lang, 'card_tips')}\n"
-                    f"{get_message(lang, 'card_tip1')}\n"
-                    f"{get_message(lang, 'card_tip2')}\n"
-                    f"{get_message(lang, 'card_tip3')}\n"
-                    f"{get_message(lang, 'card_tip4')}"
-                )
+                "content": _CARD_HELP_TEXT.get(lang) or _CARD_HELP_TEXT[DEFAULT_LANGUAGE]
             }
         }
-    ])
+    ]
+    
+    return json.dumps({
+        "header": {
+            "title": {"content": get_message(lang, 'card_header'), "tag": "plain_text"},
+            "template": "blue"
+        },
+        "account_elements": account_elements,
+        "select_elements": select_elements,
+        "submit_action": submit_action,
+        "help_elements": help_elements
+    })
+
+
+def create_case_card(accounts: Dict[str, Dict[str, str]], subject: str = "", lang: str = "zh", creator_name: str = "", creator_id: str = "") -> Dict[str, Any]:
+    """Create case card: contains all required information
+    
+    Args:
+        accounts: Account configuration dict
+        subject: Case title
+        lang: Language code ('zh' or 'en')
+        creator_name: Name of the user who created this card
+        creator_id: User ID of the creator (for validation)
+    """
+    accounts_frozen = tuple(
+        (account_key, account_info.get('account_name', f'Account {account_key}'), account_info.get('role_arn', ''))
+        for account_key, account_info in accounts.items()
+    )
+    skeleton = json.loads(_build_card_skeleton(lang, accounts_frozen))
     
-    # Add creator info at the top of the card
+    # Build card elements front to back: creator info at the top of the card
+    elements = []
     if creator_name:
-        creator_label = "创建者" if lang == "zh" else "Created by"
-        elements.insert(0, {
+        creator_label = _CREATOR_LABEL.get(lang, _CREATOR_LABEL['en'])
+        elements.append({
             "tag": "div",
             "text": {"tag": "lark_md", "content": f"👤 **{creator_label}:** {creator_name}"}
         })
-        elements.insert(1, {"tag": "hr"})
+        elements.append({"tag": "hr"})
     
-    card = {
-        "config": {"wide_screen_mode": True},
-        "header": {
-            "title": {"content": get_message(lang, 'card_header'), "tag": "plain_text"},
-            "template": "blue"
-        },
-        "elements": elements
-    }
+    elements.extend(skeleton['account_elements'])
     
-    # Store creator_id in card for validation (in button value)
+    # Display case title
+    if subject:
+        elements.extend([
+            {
+                "tag": "div",
+                "text": {"tag": "lark_md", "content": f"**{get_message(lang, 'card_case_title')}**\n{subject}"}
+            },
+            {"tag": "hr"}
+        ])
+    
+    # Add dropdowns
+    elements.extend(skeleton['select_elements'])
+    
+    # Store subject and creator_id in the submit button value (creator_id for validation)
+    submit_action = skeleton['submit_action']
+    submit_value = submit_action['actions'][0]['value']
+    submit_value['subject'] = subject
     if creator_id:
-        for element in elements:
-            if element.get('tag') == 'action':
-                for action in element.get('actions', []):
-                    if action.get('value', {}).get('action') == 'submit_case':
-                        action['value']['creator_id'] = creator_id
+        submit_value['creator_id'] = creator_id
+    elements.append(submit_action)
     
-    return card
-
-
-def is_user_in_chat(chat_id: str, user_open_id: str) -> bool:
-    """Check if user is already in the chat group"""
-    try:
-        token = get_tenant_access_token()
-        
-        url = f"https://open.larksuite.com/open-apis/im/v1/chats/{chat_id}/members?member_id_type=open_id"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-        
-        response = http.request('GET', url, headers=headers)
-        result = json.loads(response.data.decode('utf-8'))
-        
-        if result.get('code') == 0:
-            members = result.get('data', {}).get('items', [])
-            for member in members:
-                if member.get('member_id') == user_open_id:
-                    return True
-        return False
-    except Exception as e:
-        print(f"Error checking chat members: {e}")
-        return False
+    elements.extend(skeleton['help_elements'])
+    
+    return {
+        "config": {"wide_screen_mode": True},
+        "header": skeleton['header'],
+        "elements": elements
+    }
 
 
 def add_user_to_chat(chat_id: str, user_id: str) -> dict:
@@ -1330,9 +1598,11 @@ def add_user_to_chat(chat_id: str, user_id: str) -> dict:
         dict with 'success' (bool), 'code' (int), 'msg' (str), 'already_in_chat' (bool)
     """
     try:
-        # First check if user is already in the chat
-        if is_user_in_chat(chat_id, user_id):
-            print(f"User {user_id} is already in chat {chat_id}")
+        # Skip the API call entirely on duplicate follow bursts
+        # (no membership preflight: the POST itself reports 1254044 if user is already in chat)
+        added_at = _recently_added.get((chat_id, user_id))
+        if added_at and time.time() - added_at < RECENTLY_ADDED_TTL:
+            logger.debug("User %s was recently added to chat %s", user_id, chat_id)
             return {'success': True, 'code': 0, 'msg': 'User already in chat', 'already_in_chat': True}
         
         token = get_tenant_access_token()
@@ -1347,8 +1617,8 @@ def add_user_to_chat(chat_id: str, user_id: str) -> dict:
             "member_id_type": "open_id"  # Explicitly specify ID type
         }
         
-        print(f"Adding user to chat: chat_id={chat_id}, user_id={user_id}")
-        encoded_data = json.dumps(payload).encode('utf-8')
+        logger.debug("Adding user to chat: chat_id=%s, user_id=%s", chat_id, user_id)
+        encoded_data = _dumps_bytes(payload)
         response = http.request(
             'POST',
             url,
@@ -1356,31 +1626,206 @@ def add_user_to_chat(chat_id: str, user_id: str) -> dict:
             headers=headers
         )
         
-        result = json.loads(response.data.decode('utf-8'))
-        print(f"Add user to chat response: {result}")
+        result = _loads(response.data)
+        logger.debug("Add user to chat response: %s", result)
         
         code = result.get('code', -1)
         msg = result.get('msg', 'Unknown error')
         
         if code == 0:
-            print(f"Successfully added user to chat")
+            logger.debug("Successfully added user to chat")
+            _recently_added[(chat_id, user_id)] = time.time()
             return {'success': True, 'code': code, 'msg': msg, 'already_in_chat': False}
         elif code == 1254044:  # User already in chat
-            print(f"User already in chat")
+            logger.debug("User already in chat")
+            _recently_added[(chat_id, user_id)] = time.time()
             return {'success': True, 'code': code, 'msg': msg, 'already_in_chat': True}
         else:
-            print(f"Failed to add user to chat: code={code}, msg={msg}")
+            logger.warning("Failed to add user to chat: code=%s, msg=%s", code, msg)
             return {'success': False, 'code': code, 'msg': msg, 'already_in_chat': False}
     except Exception as e:
-        print(f"Error adding user to chat: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error adding user to chat: %s", e)
         return {'success': False, 'code': -1, 'msg': str(e), 'already_in_chat': False}
 
 
+# Shared rows for Lark rich text posts. Posts reference these same lists many times;
+# they are only read when the payload is serialized and must not be mutated.
+_POST_BLANK_ROW = [{"tag": "text", "text": ""}]
+_POST_SEPARATOR_ROW = [{"tag": "text", "text": "━━━━━━━━━━━━━━━━━━━"}]
+
+# Help post content (Lark rich text) per chat type and language, built once at import
+_HELP_P2P_ZH = [
+    [{"tag": "text", "text": "📝 "}, {"tag": "text", "text": "创建工单", "style": ["bold"]}],
+    [{"tag": "text", "text": "1. 输入命令: "},  {"tag": "text", "text": "开工单 [标题]", "style": ["bold"]}],
+    [{"tag": "text", "text": "2. 在弹出的卡片中选择:"}],
+    [{"tag": "text", "text": "   • AWS 账号（如有多个）"}],
+    [{"tag": "text", "text": "   • AWS 服务"}],
+    [{"tag": "text", "text": "   • 严重级别"}],
+    [{"tag": "text", "text": "3. 点击\"提交工单\"按钮"}],
+    [{"tag": "text", "text": "4. 机器人会自动创建专属工单群"}],
+    _POST_BLANK_ROW,
+    [{"tag": "text", "text": "💬 "}, {"tag": "text", "text": "工单沟通", "style": ["bold"]}],
+    [{"tag": "text", "text": "• 在工单群中 "}, {"tag": "text", "text": "@bot [内容]", "style": ["bold"]}, {"tag": "text", "text": " 同步到 AWS Support"}],
+    [{"tag": "text", "text": "• 上传的文件会自动同步"}],
+    [{"tag": "text", "text": "• 普通消息仅保留在群内"}],
+    _POST_BLANK_ROW,
+    [{"tag": "text", "text": "📋 "}, {"tag": "text", "text": "其他命令", "style": ["bold"]}],
+    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "历史", "style": ["bold"]}, {"tag": "text", "text": " - 查询最近10个工单"}],
+    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "关注 [工单ID]", "style": ["bold"]}, {"tag": "text", "text": " - 加入指定工单群"}],
+    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "帮助", "style": ["bold"]}, {"tag": "text", "text": " - 显示此帮助信息"}],
+]
+
+_HELP_P2P_EN = [
+    [{"tag": "text", "text": "📝 "}, {"tag": "text", "text": "Create Case", "style": ["bold"]}],
+    [{"tag": "text", "text": "1. Enter command: "},  {"tag": "text", "text": "create case [title]", "style": ["bold"]}],
+    [{"tag": "text", "text": "2. Select in the popup card:"}],
+    [{"tag": "text", "text": "   • AWS Account (if multiple)"}],
+    [{"tag": "text", "text": "   • AWS Service"}],
+    [{"tag": "text", "text": "   • Severity Level"}],
+    [{"tag": "text", "text": "3. Click \"Submit Case\" button"}],
+    [{"tag": "text", "text": "4. Bot will auto-create a dedicated case chat"}],
+    _POST_BLANK_ROW,
+    [{"tag": "text", "text": "💬 "}, {"tag": "text", "text": "Case Communication", "style": ["bold"]}],
+    [{"tag": "text", "text": "• In case chat "}, {"tag": "text", "text": "@bot [content]", "style": ["bold"]}, {"tag": "text", "text": " syncs to AWS Support"}],
+    [{"tag": "text", "text": "• Uploaded files are auto-synced"}],
+    [{"tag": "text", "text": "• Regular messages stay in chat only"}],
+    _POST_BLANK_ROW,
+    [{"tag": "text", "text": "📋 "}, {"tag": "text", "text": "Other Commands", "style": ["bold"]}],
+    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "history", "style": ["bold"]}, {"tag": "text", "text": " - Query recent 10 cases"}],
+    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "follow [case ID]", "style": ["bold"]}, {"tag": "text", "text": " - Join specified case chat"}],
+    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "help", "style": ["bold"]}, {"tag": "text", "text": " - Show this help message"}],
+]
+
+_HELP_GROUP_ZH = [
+    [{"tag": "text", "text": "📝 "}, {"tag": "text", "text": "创建工单", "style": ["bold"]}],
+    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot 开工单 [标题]", "style": ["bold"]}, {"tag": "text", "text": " - 创建新工单"}],
+    _POST_BLANK_ROW,
+    [{"tag": "text", "text": "📋 "}, {"tag": "text", "text": "其他命令", "style": ["bold"]}],
+    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot 历史", "style": ["bold"]}, {"tag": "text", "text": " - 查询最近10个工单"}],
+    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot 关注 [工单ID]", "style": ["bold"]}, {"tag": "text", "text": " - 加入指定工单群"}],
+    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot 帮助", "style": ["bold"]}, {"tag": "text", "text": " - 显示此帮助信息"}],
+    _POST_BLANK_ROW,
+    [{"tag": "text", "text": "💡 "}, {"tag": "text", "text": "提示", "style": ["bold"]}],
+    [{"tag": "text", "text": "• 在普通群中需要 @bot 才能使用命令"}],
+    [{"tag": "text", "text": "• 创建工单后会自动创建专属工单群"}],
+]
+
+_HELP_GROUP_EN = [
+    [{"tag": "text", "text": "📝 "}, {"tag": "text", "text": "Create Case", "style": ["bold"]}],
+    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot create case [title]", "style": ["bold"]}, {"tag": "text", "text": " - Create new case"}],
+    _POST_BLANK_ROW,
+    [{"tag": "text", "text": "📋 "}, {"tag": "text", "text": "Other Commands", "style": ["bold"]}],
+    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot history", "style": ["bold"]}, {"tag": "text", "text": " - Query recent 10 cases"}],
+    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot follow [case ID]", "style": ["bold"]}, {"tag": "text", "text": " - Join specified case chat"}],
+    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot help", "style": ["bold"]}, {"tag": "text", "text": " - Show this help message"}],
+    _POST_BLANK_ROW,
+    [{"tag": "text", "text": "💡 "}, {"tag": "text", "text": "Tips", "style": ["bold"]}],
+    [{"tag": "text", "text": "• In regular groups, @bot is required to use commands"}],
+    [{"tag": "text", "text": "• A dedicated case chat is auto-created after case creation"}],
+]
+
+
+# History severity display names
+_SEVERITY_MAP = {
+    'low': 'Low',
+    'normal': 'Normal',
+    'high': 'High',
+    'urgent': 'Urgent',
+    'critical': 'Critical'
+}
+
+# History status display (all possible AWS Support statuses) - bilingual
+_STATUS_MAP_EN = {
+    'opened': '🟢 In Progress',
+    'pending-customer-action': '🟡 Pending Customer Action',
+    'customer-action-completed': '🟢 Customer Action Completed',
+    'reopened': '🟢 Reopened',
+    'resolved': '⚪ Resolved',
+    'unassigned': '🔵 Unassigned',
+    'work-in-progress': '🟢 Work In Progress',
+    'pending-amazon-action': '🟠 Pending AWS',
+    'amazon-action-completed': '🟢 AWS Responded'
+}
+_STATUS_MAP_ZH = {
+    'opened': '🟢 处理中',
+    'pending-customer-action': '🟡 等待客户操作',
+    'customer-action-completed': '🟢 客户已操作',
+    'reopened': '🟢 已重开',
+    'resolved': '⚪ 已解决',
+    'unassigned': '🔵 未分配',
+    'work-in-progress': '🟢 处理中',
+    'pending-amazon-action': '🟠 等待 AWS 处理',
+    'amazon-action-completed': '🟢 AWS 已回复'
+}
+
+
+def _history_case_rows(cases: List[Dict[str, Any]], case_details_map: Dict[str, Dict[str, Any]],
+                       is_chinese: bool):
+    """Yield the rich text rows of the case history post, one case block at a time
+    
+    Args:
+        cases: Submitted cases from the user index (most recent first)
+        case_details_map: caseId -> latest describe_cases detail (may be partial)
+        is_chinese: Render labels in Chinese
+    """
+    status_map = _STATUS_MAP_ZH if is_chinese else _STATUS_MAP_EN
+    
+    # Localized labels are loop-invariant
+    label_case = '工单' if is_chinese else 'Case'
+    label_account = f"👤 {'账号' if is_chinese else 'Account'}: "
+    label_status = f"📊 {'状态' if is_chinese else 'Status'}: "
+    label_severity = f"⚠️ {'严重级别' if is_chinese else 'Severity'}: "
+    label_created = f"🕐 {'创建时间' if is_chinese else 'Created'}: "
+    
+    for i, case in enumerate(cases, 1):
+        display_id = case.get('display_id', case['case_id'])
+        case_id = case.get('case_id')
+        
+        # Get detailed info from API
+        detail = case_details_map.get(case_id, {})
+        
+        # AWS Support Console link
+        support_url = f"https://support.console.aws.amazon.com/support/home#/case/?displayId={display_id}"
+        
+        # Use latest data from API
+        subject = detail.get('subject', case.get('subject', 'N/A'))
+        severity_code = detail.get('severityCode', case.get('severity', 'N/A'))
+        severity_display = _SEVERITY_MAP.get(severity_code, severity_code)
+        status = detail.get('status', case.get('status', 'N/A'))
+        status_display = status_map.get(status, status)
+        time_created = detail.get('timeCreated', case.get('created_at', 'N/A'))
+        # Convert to dual timezone display
+        time_created = format_aws_time_dual(time_created)
+        
+        # Account ID is stored with the case; older records only have role_arn
+        account_id = case.get('account_id') or account_id_from_role_arn(case.get('role_arn') or '', 'N/A')
+        
+        # Follow hint row (localized)
+        if is_chinese:
+            follow_row = [{"tag": "text", "text": "💬 回复 "}, {"tag": "text", "text": f"关注 {display_id}", "style": ["bold"]}, {"tag": "text", "text": " 加入工单群"}]
+        else:
+            follow_row = [{"tag": "text", "text": "💬 Reply "}, {"tag": "text", "text": f"follow {display_id}", "style": ["bold"]}, {"tag": "text", "text": " to join case chat"}]
+        
+        # Case info (using rich text format)
+        yield from (
+            _POST_SEPARATOR_ROW,
+            _POST_BLANK_ROW,
+            [{"tag": "text", "text": f"📋 {label_case} #{i}", "style": ["bold"]}],
+            [{"tag": "a", "text": display_id, "href": support_url}],
+            _POST_BLANK_ROW,
+            [{"tag": "text", "text": "📝 "}, {"tag": "text", "text": subject}],
+            [{"tag": "text", "text": label_account}, {"tag": "text", "text": account_id}],
+            [{"tag": "text", "text": label_status}, {"tag": "text", "text": status_display}],
+            [{"tag": "text", "text": label_severity}, {"tag": "text", "text": severity_display}],
+            [{"tag": "text", "text": label_created}, {"tag": "text", "text": time_created}],
+            _POST_BLANK_ROW,
+            follow_row,
+            _POST_BLANK_ROW  # Empty line separator
+        )
+
+
 def handle_message_receive(event_data: Dict[str, Any]) -> Dict[str, Any]:
     """Handle message receive event"""
-    import time
     t_start = time.time()
     
     message = event_data.get('message', {})
@@ -1391,160 +1836,165 @@ def handle_message_receive(event_data: Dict[str, Any]) -> Dict[str, Any]:
     message_type = message.get('message_type', 'text')
     chat_type = message.get('chat_type', 'p2p')
     message_id = message.get('message_id', '')
+    # Parse message content once; file, command and text branches all read from it
+    msg_content = json.loads(message['content']) if message.get('content') else {}
     
     # Note: user_lang will be detected later after parsing message text
     user_lang = 'zh'  # Default, will be updated after parsing message
     
     # Detailed logging: print message type and content keys
-    print(f"=== Message Receive Event ===")
-    print(f"  message_id: {message_id}")
-    print(f"  message_type: {message_type}")
-    print(f"  chat_type: {chat_type}")
-    print(f"  chat_id: {chat_id}")
-    print(f"  user_id: {user_id}")
-    print(f"  message keys: {list(message.keys())}")
+    logger.debug("=== Message Receive Event ===")
+    logger.debug("  message_id: %s", message_id)
+    logger.debug("  message_type: %s", message_type)
+    logger.debug("  chat_type: %s", chat_type)
+    logger.debug("  chat_id: %s", chat_id)
+    logger.debug("  user_id: %s", user_id)
+    logger.debug("  message keys: %s", list(message.keys()))
     
     if message_type != 'text':
         content_preview = str(message.get('content', ''))[:200]
-        print(f"  Non-text message content preview: {content_preview}")
+        logger.debug("  Non-text message content preview: %s", content_preview)
     
-    # Check whitelist
+    # Check whitelist and whether this is a case chat concurrently (independent lookups, query once, reuse later)
     t0 = time.time()
-    if not check_user_whitelist(user_id):
+    logger.debug("Checking if chat_id %s is a case chat", chat_id)
+    whitelist_future = _executor.submit(check_user_whitelist, user_id)
+    case_future = _executor.submit(get_cached_case_by_case_chat_id, chat_id)
+    
+    if not whitelist_future.result():
         no_permission_msg = get_message(DEFAULT_LANGUAGE, 'no_permission')
         send_message(chat_id, 'text', {'text': no_permission_msg}, reply_to_message_id=message_id)
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
-    print(f"[TIMING] check_user_whitelist: {(time.time()-t0)*1000:.0f}ms")
+        return _OK_RESPONSE
     
-    # Check if this is a case chat message (query once, reuse later)
-    t0 = time.time()
-    print(f"Checking if chat_id {chat_id} is a case chat")
-    case_info = get_case_by_case_chat_id(chat_id)
+    case_info = case_future.result()
     is_case_chat = case_info is not None
-    print(f"[TIMING] get_case_by_case_chat_id: {(time.time()-t0)*1000:.0f}ms")
-    print(f"is_case_chat: {is_case_chat}")
+    logger.debug("[TIMING] check_user_whitelist + get_case_by_case_chat_id: %.0fms", (time.time()-t0)*1000)
+    logger.debug("is_case_chat: %s", is_case_chat)
     
     # File message: don't upload by default, only prompt user how to upload
     if message_type == 'file':
-        print(f"Received file message, message_type: {message_type}")
+        logger.debug("Received file message, message_type: %s", message_type)
         
         # Validate if this is really a file message (check required fields)
-        content = json.loads(message.get('content', '{}'))
-        file_key = content.get('file_key', '')
-        file_name = content.get('file_name', 'attachment')
+        file_key = msg_content.get('file_key', '')
+        file_name = msg_content.get('file_name', 'attachment')
         
-        print(f"File message validation: file_key={file_key}, message_id={message_id}")
+        logger.debug("File message validation: file_key=%s, message_id=%s", file_key, message_id)
         
         # If missing required fields, may be misidentified or special message, skip
         if not file_key or not message_id:
-            print(f"Invalid file message (missing file_key or message_id), skipping file upload handler")
+            logger.debug("Invalid file message (missing file_key or message_id), skipping file upload handler")
             # Continue processing as normal message
         elif is_case_chat:
             # Don't auto-upload, prompt user to reply with "upload" to upload
             # Note: Don't use reply_to_message_id here, so user knows to reply to the file message directly
-            print(f"File received in case chat, not auto-uploading. case_id: {case_info.get('case_id')}")
+            logger.debug("File received in case chat, not auto-uploading. case_id: %s", case_info.get('case_id'))
             file_msg = f"{get_message(DEFAULT_LANGUAGE, 'file_received', file_name)}\n\n{get_message(DEFAULT_LANGUAGE, 'file_upload_hint')}"
             send_message(chat_id, 'text', {'text': file_msg})
-            return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+            return _OK_RESPONSE
         else:
             # File upload in non-case chat, silently ignore
-            print(f"File received in non-case chat, ignoring silently")
-            return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+            logger.debug("File received in non-case chat, ignoring silently")
+            return _OK_RESPONSE
     
     # Handle "upload" command (when replying to file message)
     if is_case_chat and message_type == 'text':
         # First clean @bot content for command detection
-        content = json.loads(message.get('content', '{}'))
-        cmd_text = content.get('text', '').strip()
-        mentions = message.get('mentions', [])
-        for mention in mentions:
-            mention_key = mention.get('key', '')
-            if mention_key:
-                cmd_text = cmd_text.replace(mention_key, '').strip()
+        cmd_text = msg_content.get('text', '').strip()
+        mention_keys = [m.get('key', '') for m in message.get('mentions', [])]
+        cmd_text = strip_mentions(cmd_text, mention_keys)
         
         # Handle "dissolve group" command
         if cmd_text in ['dissolve', 'dissolve group']:
-            print(f"Dissolve group command detected, case_info: {case_info}")
+            logger.debug("Dissolve group command detected, case_info: %s", case_info)
             return handle_dissolve_group(case_info, chat_id, open_id)
         
         # Handle "upload" command (when replying to file message)
         parent_id = message.get('parent_id', '')
         if parent_id:
-            print(f"Upload command check: parent_id={parent_id}, cmd_text='{cmd_text}'")
+            logger.debug("Upload command check: parent_id=%s, cmd_text='%s'", parent_id, cmd_text)
             if cmd_text in ['upload', '上传']:
-                print(f"Upload command detected, parent_id: {parent_id}")
+                logger.debug("Upload command detected, parent_id: %s", parent_id)
                 return handle_upload_reply(case_info, parent_id, chat_id, user_id)
     
     # Handle text messages in case chat
     if is_case_chat:
-        print(f"This is a case chat, case_id: {case_info.get('case_id')}")
-        return handle_case_chat_message(case_info, message, user_id, open_id)
+        logger.debug("This is a case chat, case_id: %s", case_info.get('case_id'))
+        return handle_case_chat_message(case_info, message, user_id, open_id, content=msg_content)
     
     # Parse message content
-    content = json.loads(message.get('content', '{}'))
-    text = content.get('text', '').strip()
+    text = msg_content.get('text', '').strip()
     
     # In regular group chat, check if @bot (must be this bot, not other users)
     if chat_type == 'group':
         mentions = message.get('mentions', [])
-        bot_mentioned = False
         bot_open_id = get_bot_open_id()
         
         # Check if THIS bot was mentioned (not just any @mention)
-        for mention in mentions:
-            mention_key = mention.get('key', '')
-            mention_open_id = mention.get('id', {}).get('open_id', '')
-            
-            if mention_key and mention_open_id == bot_open_id:
-                # Only remove bot mention and set flag when it's actually the bot
-                text = text.replace(mention_key, '').strip()
-                bot_mentioned = True
+        # Only remove bot mentions, other users' mentions stay in the text
+        bot_mention_keys = [
+            m.get('key', '') for m in mentions
+            if m.get('key') and m.get('id', {}).get('open_id', '') == bot_open_id
+        ]
+        bot_mentioned = bool(bot_mention_keys)
+        if bot_mentioned:
+            text = strip_mentions(text, bot_mention_keys)
         
         # In regular group chat, ignore message if bot not mentioned
         if not bot_mentioned:
-            return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+            return _OK_RESPONSE
     
     # Now detect user language based on message text (command language)
     user_lang = get_user_language(user_id=user_id, open_id=open_id, token_func=get_tenant_access_token, message_text=text)
-    print(f"User language detected: {user_lang}, from text: {text[:50] if text else 'empty'}")
+    logger.debug("User language detected: %s, from text: %s", user_lang, text[:50] if text else 'empty')
     
     # Handle commands with multi-language support
     # Check for create case command
     matched, cmd_lang, subject = match_command(text, 'create_case')
     if matched:
-        import time
         t_cmd_start = time.time()
         
         if not subject:
             error_msg = get_message(DEFAULT_LANGUAGE, 'enter_title')
             send_message(chat_id, 'text', {'text': error_msg}, reply_to_message_id=message_id)
-            return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+            return _OK_RESPONSE
+        
+        # Fetch creator name for the card in the background, overlapping the draft prep below
+        user_info_future = _executor.submit(get_cached_user_info, user_id, open_id)
         
         # Get configured account list
         t0 = time.time()
         config = get_bot_config()
         accounts = config.get('accounts', {})
-        print(f"[TIMING] get_bot_config: {(time.time()-t0)*1000:.0f}ms")
+        logger.debug("[TIMING] get_bot_config: %.0fms", (time.time()-t0)*1000)
         
         if not accounts:
             send_message(chat_id, 'text', {'text': get_message(DEFAULT_LANGUAGE, 'no_accounts_configured')}, reply_to_message_id=message_id)
-            return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+            return _OK_RESPONSE
         
-        # Create initial draft
-        draft_id = f"draft_{user_id}_{chat_id}_{int(datetime.now().timestamp())}"
+        # Create initial draft (one clock read for both the draft ID and created_at)
+        now_ts = time.time()
+        draft_id = f"draft_{user_id}_{chat_id}_{int(now_ts)}"
         
         # First delete old drafts from this user in current chat (avoid multiple draft conflicts)
         t0 = time.time()
         old_drafts = s3_get_cases_by_user(user_id, limit=5)
-        print(f"[TIMING] s3_get_cases_by_user: {(time.time()-t0)*1000:.0f}ms")
+        logger.debug("[TIMING] s3_get_cases_by_user: %.0fms", (time.time()-t0)*1000)
+        
+        stale_drafts = [
+            item for item in old_drafts
+            if item.get('status') == 'draft' and item.get('chat_id') == chat_id
+        ]
         
-        old_message_ids = []
-        for item in old_drafts:
-            if item.get('status') == 'draft' and item.get('chat_id') == chat_id:
-                # Record old card message_id (if exists)
-                if item.get('card_message_id'):
-                    old_message_ids.append(item['card_message_id'])
-                delete_case(item['case_id'])
+        # Recall old cards (if any) in the background - Lark calls are independent of S3 work
+        recall_futures = [
+            _executor.submit(recall_old_card, item['card_message_id'])
+            for item in stale_drafts if item.get('card_message_id')
+        ]
+        
+        # Draft deletes stay sequential: they read-modify-write the same user/chat index files
+        for item in stale_drafts:
+            delete_case(item['case_id'])
         
         # Create new draft
         t0 = time.time()
@@ -1555,41 +2005,35 @@ def handle_message_receive(event_data: Dict[str, Any]) -> Dict[str, Any]:
             'subject': subject,
             'status': 'draft',
             'issue_type': 'technical',
-            'created_at': datetime.now().isoformat()
+            'created_at': datetime.fromtimestamp(now_ts).isoformat()
         })
-        print(f"[TIMING] put_case (draft): {(time.time()-t0)*1000:.0f}ms")
+        logger.debug("[TIMING] put_case (draft): %.0fms", (time.time()-t0)*1000)
         
-        # Recall old cards (if any)
-        for msg_id in old_message_ids:
-            try:
-                recall_message(msg_id)
-                print(f"Recalled old card message: {msg_id}")
-            except Exception as e:
-                print(f"Failed to recall old card {msg_id}: {e}")
+        for future in recall_futures:
+            future.result()
         
         # Get creator name for display on card
         t0 = time.time()
         creator_name = ""
         try:
-            user_info = get_user_info(user_id=user_id, open_id=open_id)
-            creator_name = user_info.get('name', '')
+            creator_name = user_info_future.result().get('name', '')
         except Exception as e:
-            print(f"Failed to get user info: {e}")
-        print(f"[TIMING] get_user_info: {(time.time()-t0)*1000:.0f}ms")
+            logger.warning("Failed to get user info: %s", e)
+        logger.debug("[TIMING] get_user_info (wait): %.0fms", (time.time()-t0)*1000)
         
         # Send case card, display case title (use global default language)
         t0 = time.time()
         card = create_case_card(accounts, subject, lang=DEFAULT_LANGUAGE, creator_name=creator_name, creator_id=user_id)
         result = send_card(chat_id, card)
-        print(f"[TIMING] send_card: {(time.time()-t0)*1000:.0f}ms")
+        logger.debug("[TIMING] send_card: %.0fms", (time.time()-t0)*1000)
         
         # Save new card message_id to draft
         if result.get('data', {}).get('message_id'):
             new_message_id = result['data']['message_id']
             update_case(draft_id, {'card_message_id': new_message_id})
         
-        print(f"[TIMING] create_case total: {(time.time()-t_cmd_start)*1000:.0f}ms")
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+        logger.debug("[TIMING] create_case total: %.0fms", (time.time()-t_cmd_start)*1000)
+        return _OK_RESPONSE
     
     # Check for follow command - require space after keyword to avoid matching "关注人" etc.
     follow_zh = MESSAGES['zh']['follow']
@@ -1602,7 +2046,7 @@ def handle_message_receive(event_data: Dict[str, Any]) -> Dict[str, Any]:
         parts = text.split(' ', 1)
         if len(parts) < 2 or not parts[1].strip():
             send_message(chat_id, 'text', {'text': get_message(DEFAULT_LANGUAGE, 'enter_case_id')}, reply_to_message_id=message_id)
-            return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+            return _OK_RESPONSE
         
         display_id = parts[1].strip()
         
@@ -1614,9 +2058,14 @@ def handle_message_receive(event_data: Dict[str, Any]) -> Dict[str, Any]:
                 case_info = item
                 break
         
-        # If not found in user's own cases, do global search
+        # If not found in user's own cases, look up display_id index
         if not case_info:
-            print(f"Case not found in user's cases, searching globally for display_id: {display_id}")
+            logger.debug("Case not found in user's cases, looking up display_id index: %s", display_id)
+            case_info = get_case_by_display_id(display_id)
+        
+        # Index miss (e.g. cases saved before the index existed), do global search
+        if not case_info:
+            logger.debug("Case not found in display_id index, searching globally for display_id: %s", display_id)
             # Global scan to find case (by display_id)
             matches = scan_cases_by_filter(
                 lambda c: c.get('display_id') == display_id or c.get('case_id') == display_id
@@ -1624,17 +2073,17 @@ def handle_message_receive(event_data: Dict[str, Any]) -> Dict[str, Any]:
             
             if matches:
                 case_info = matches[0]
-                print(f"Found case globally: case_id={case_info.get('case_id')}")
+                logger.debug("Found case globally: case_id=%s", case_info.get('case_id'))
             else:
-                print(f"Case not found globally: {display_id}")
+                logger.debug("Case not found globally: %s", display_id)
                 send_message(chat_id, 'text', {'text': get_message(DEFAULT_LANGUAGE, 'case_not_found', display_id)}, reply_to_message_id=message_id)
-                return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+                return _OK_RESPONSE
         
         # Check if case has a chat group
         case_chat_id = case_info.get('case_chat_id')
         if not case_chat_id:
             send_message(chat_id, 'text', {'text': get_message(DEFAULT_LANGUAGE, 'case_no_chat', display_id)}, reply_to_message_id=message_id)
-            return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+            return _OK_RESPONSE
         
         # Add user to case chat
         # Need to use open_id instead of user_id
@@ -1642,11 +2091,11 @@ def handle_message_receive(event_data: Dict[str, Any]) -> Dict[str, Any]:
             # Get open_id from sender
             open_id = sender.get('sender_id', {}).get('open_id', '')
             
-            print(f"Adding user to case chat: user_id={user_id}, open_id={open_id}, case_chat_id={case_chat_id}")
+            logger.debug("Adding user to case chat: user_id=%s, open_id=%s, case_chat_id=%s", user_id, open_id, case_chat_id)
             
             if not open_id:
                 send_message(chat_id, 'text', {'text': get_message(DEFAULT_LANGUAGE, 'unable_get_user_info')}, reply_to_message_id=message_id)
-                return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+                return _OK_RESPONSE
             
             result = add_user_to_chat(case_chat_id, open_id)
             
@@ -1663,19 +2112,17 @@ def handle_message_receive(event_data: Dict[str, Any]) -> Dict[str, Any]:
                 # Add failed, show specific error
                 error_code = result['code']
                 error_msg = result['msg']
-                print(f"Failed to add user to case chat: code={error_code}, msg={error_msg}")
+                logger.warning("Failed to add user to case chat: code=%s, msg=%s", error_code, error_msg)
                 send_message(chat_id, 'text', {
                     'text': get_message(DEFAULT_LANGUAGE, 'add_to_chat_failed', error_code, error_msg)
                 }, reply_to_message_id=message_id)
         except Exception as e:
-            print(f"Error adding user to case chat: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error adding user to case chat: %s", e)
             send_message(chat_id, 'text', {
                 'text': get_message(DEFAULT_LANGUAGE, 'add_to_chat_failed', -1, str(e))
             }, reply_to_message_id=message_id)
         
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+        return _OK_RESPONSE
     
     elif text in ['help', '帮助']:
         # Detect language from command (default to Chinese)
@@ -1683,237 +2130,86 @@ def handle_message_receive(event_data: Dict[str, Any]) -> Dict[str, Any]:
         
         # Show different help info based on context and language
         if chat_type == 'p2p':
-            if is_chinese:
-                content = [
-                    [{"tag": "text", "text": "📝 "}, {"tag": "text", "text": "创建工单", "style": ["bold"]}],
-                    [{"tag": "text", "text": "1. 输入命令: "},  {"tag": "text", "text": "开工单 [标题]", "style": ["bold"]}],
-                    [{"tag": "text", "text": "2. 在弹出的卡片中选择:"}],
-                    [{"tag": "text", "text": "   • AWS 账号（如有多个）"}],
-                    [{"tag": "text", "text": "   • AWS 服务"}],
-                    [{"tag": "text", "text": "   • 严重级别"}],
-                    [{"tag": "text", "text": "3. 点击\"提交工单\"按钮"}],
-                    [{"tag": "text", "text": "4. 机器人会自动创建专属工单群"}],
-                    [{"tag": "text", "text": ""}],
-                    [{"tag": "text", "text": "💬 "}, {"tag": "text", "text": "工单沟通", "style": ["bold"]}],
-                    [{"tag": "text", "text": "• 在工单群中 "}, {"tag": "text", "text": "@bot [内容]", "style": ["bold"]}, {"tag": "text", "text": " 同步到 AWS Support"}],
-                    [{"tag": "text", "text": "• 上传的文件会自动同步"}],
-                    [{"tag": "text", "text": "• 普通消息仅保留在群内"}],
-                    [{"tag": "text", "text": ""}],
-                    [{"tag": "text", "text": "📋 "}, {"tag": "text", "text": "其他命令", "style": ["bold"]}],
-                    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "历史", "style": ["bold"]}, {"tag": "text", "text": " - 查询最近10个工单"}],
-                    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "关注 [工单ID]", "style": ["bold"]}, {"tag": "text", "text": " - 加入指定工单群"}],
-                    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "帮助", "style": ["bold"]}, {"tag": "text", "text": " - 显示此帮助信息"}],
-                ]
-            else:
-                content = [
-                    [{"tag": "text", "text": "📝 "}, {"tag": "text", "text": "Create Case", "style": ["bold"]}],
-                    [{"tag": "text", "text": "1. Enter command: "},  {"tag": "text", "text": "create case [title]", "style": ["bold"]}],
-                    [{"tag": "text", "text": "2. Select in the popup card:"}],
-                    [{"tag": "text", "text": "   • AWS Account (if multiple)"}],
-                    [{"tag": "text", "text": "   • AWS Service"}],
-                    [{"tag": "text", "text": "   • Severity Level"}],
-                    [{"tag": "text", "text": "3. Click \"Submit Case\" button"}],
-                    [{"tag": "text", "text": "4. Bot will auto-create a dedicated case chat"}],
-                    [{"tag": "text", "text": ""}],
-                    [{"tag": "text", "text": "💬 "}, {"tag": "text", "text": "Case Communication", "style": ["bold"]}],
-                    [{"tag": "text", "text": "• In case chat "}, {"tag": "text", "text": "@bot [content]", "style": ["bold"]}, {"tag": "text", "text": " syncs to AWS Support"}],
-                    [{"tag": "text", "text": "• Uploaded files are auto-synced"}],
-                    [{"tag": "text", "text": "• Regular messages stay in chat only"}],
-                    [{"tag": "text", "text": ""}],
-                    [{"tag": "text", "text": "📋 "}, {"tag": "text", "text": "Other Commands", "style": ["bold"]}],
-                    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "history", "style": ["bold"]}, {"tag": "text", "text": " - Query recent 10 cases"}],
-                    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "follow [case ID]", "style": ["bold"]}, {"tag": "text", "text": " - Join specified case chat"}],
-                    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "help", "style": ["bold"]}, {"tag": "text", "text": " - Show this help message"}],
-                ]
-            send_post_message(chat_id, "AWS Support Case Bot", content)
+            content = _HELP_P2P_ZH if is_chinese else _HELP_P2P_EN
         else:
-            if is_chinese:
-                content = [
-                    [{"tag": "text", "text": "📝 "}, {"tag": "text", "text": "创建工单", "style": ["bold"]}],
-                    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot 开工单 [标题]", "style": ["bold"]}, {"tag": "text", "text": " - 创建新工单"}],
-                    [{"tag": "text", "text": ""}],
-                    [{"tag": "text", "text": "📋 "}, {"tag": "text", "text": "其他命令", "style": ["bold"]}],
-                    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot 历史", "style": ["bold"]}, {"tag": "text", "text": " - 查询最近10个工单"}],
-                    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot 关注 [工单ID]", "style": ["bold"]}, {"tag": "text", "text": " - 加入指定工单群"}],
-                    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot 帮助", "style": ["bold"]}, {"tag": "text", "text": " - 显示此帮助信息"}],
-                    [{"tag": "text", "text": ""}],
-                    [{"tag": "text", "text": "💡 "}, {"tag": "text", "text": "提示", "style": ["bold"]}],
-                    [{"tag": "text", "text": "• 在普通群中需要 @bot 才能使用命令"}],
-                    [{"tag": "text", "text": "• 创建工单后会自动创建专属工单群"}],
-                ]
-            else:
-                content = [
-                    [{"tag": "text", "text": "📝 "}, {"tag": "text", "text": "Create Case", "style": ["bold"]}],
-                    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot create case [title]", "style": ["bold"]}, {"tag": "text", "text": " - Create new case"}],
-                    [{"tag": "text", "text": ""}],
-                    [{"tag": "text", "text": "📋 "}, {"tag": "text", "text": "Other Commands", "style": ["bold"]}],
-                    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot history", "style": ["bold"]}, {"tag": "text", "text": " - Query recent 10 cases"}],
-                    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot follow [case ID]", "style": ["bold"]}, {"tag": "text", "text": " - Join specified case chat"}],
-                    [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot help", "style": ["bold"]}, {"tag": "text", "text": " - Show this help message"}],
-                    [{"tag": "text", "text": ""}],
-                    [{"tag": "text", "text": "💡 "}, {"tag": "text", "text": "Tips", "style": ["bold"]}],
-                    [{"tag": "text", "text": "• In regular groups, @bot is required to use commands"}],
-                    [{"tag": "text", "text": "• A dedicated case chat is auto-created after case creation"}],
-                ]
-            send_post_message(chat_id, "AWS Support Case Bot", content)
+            content = _HELP_GROUP_ZH if is_chinese else _HELP_GROUP_EN
+        send_post_message(chat_id, "AWS Support Case Bot", content)
         
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+        return _OK_RESPONSE
     
     elif text.startswith('history') or text.startswith('历史'):
         is_chinese = DEFAULT_LANGUAGE == 'zh'
         # Use global default language for bot responses
         no_history_msg = get_message(DEFAULT_LANGUAGE, 'no_history')
         
-        # Query case history
-        cases = get_cases_by_user(user_id, limit=10)
-        
-        if not cases:
-            send_message(chat_id, 'text', {'text': no_history_msg}, reply_to_message_id=message_id)
-            return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
-        
-        # Filter out drafts
-        cases = [c for c in cases if c.get('status') != 'draft']
+        # Query case history (drafts are skipped at the index, before their objects are fetched)
+        cases = [
+            c for c in get_cases_by_user(user_id, limit=10, exclude_drafts=True)
+            if c.get('status') != 'draft'
+        ]
         
         if not cases:
             send_message(chat_id, 'text', {'text': no_history_msg}, reply_to_message_id=message_id)
-            return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+            return _OK_RESPONSE
         
-        # Batch get case details (from AWS Support API)
-        case_details_map = {}
+        # Group case IDs by account role: describe_cases takes a caseIdList, so one
+        # call per role covers all of that account's cases. Cases the poller checked
+        # within HISTORY_FRESH_SECONDS are shown from S3 without an API call.
+        case_ids_by_role = {}
         for case in cases[:10]:
             role_arn = case.get('role_arn')
             case_id = case.get('case_id')
-            if role_arn and case_id:
-                try:
-                    # Get latest case info from AWS Support API
-                    assumed_role = sts_client.assume_role(
-                        RoleArn=role_arn,
-                        RoleSessionName='LarkCaseBotHistoryQuery'
-                    )
-                    credentials = assumed_role['Credentials']
-                    support_client = boto3.client(
-                        'support',
-                        region_name='us-east-1',
-                        aws_access_key_id=credentials['AccessKeyId'],
-                        aws_secret_access_key=credentials['SecretAccessKey'],
-                        aws_session_token=credentials['SessionToken']
-                    )
-                    response = support_client.describe_cases(
-                        caseIdList=[case_id],
-                        includeResolvedCases=True
-                    )
-                    if response.get('cases'):
-                        case_details_map[case_id] = response['cases'][0]
-                except Exception as e:
-                    print(f"Error fetching case details for {case_id}: {e}")
-        
-        # Severity mapping
-        severity_map = {
-            'low': 'Low',
-            'normal': 'Normal',
-            'high': 'High',
-            'urgent': 'Urgent',
-            'critical': 'Critical'
-        }
+            if role_arn and case_id and not is_recently_checked(case):
+                case_ids_by_role.setdefault(role_arn, []).append(case_id)
         
-        # Status mapping (all possible AWS Support statuses) - bilingual
-        status_map_en = {
-            'opened': '🟢 In Progress',
-            'pending-customer-action': '🟡 Pending Customer Action',
-            'customer-action-completed': '🟢 Customer Action Completed',
-            'reopened': '🟢 Reopened',
-            'resolved': '⚪ Resolved',
-            'unassigned': '🔵 Unassigned',
-            'work-in-progress': '🟢 Work In Progress',
-            'pending-amazon-action': '🟠 Pending AWS',
-            'amazon-action-completed': '🟢 AWS Responded'
-        }
-        status_map_zh = {
-            'opened': '🟢 处理中',
-            'pending-customer-action': '🟡 等待客户操作',
-            'customer-action-completed': '🟢 客户已操作',
-            'reopened': '🟢 已重开',
-            'resolved': '⚪ 已解决',
-            'unassigned': '🔵 未分配',
-            'work-in-progress': '🟢 处理中',
-            'pending-amazon-action': '🟠 等待 AWS 处理',
-            'amazon-action-completed': '🟢 AWS 已回复'
+        # Fetch latest case details from AWS Support API, roles concurrently
+        def fetch_case_details(role_item):
+            role_arn, case_ids = role_item
+            try:
+                support_client = _make_assumed_client('support', role_arn)
+                response = support_client.describe_cases(
+                    caseIdList=case_ids,
+                    includeResolvedCases=True
+                )
+                return response.get('cases', [])
+            except Exception as e:
+                logger.error("Error fetching case details for %s: %s", case_ids, e)
+                return []
+        
+        case_details_map = {
+            detail['caseId']: detail
+            for details in _executor.map(fetch_case_details, case_ids_by_role.items())
+            for detail in details
         }
-        status_map = status_map_zh if is_chinese else status_map_en
         
         # Build rich text content
-        content = []
-        
-        for i, case in enumerate(cases[:10], 1):
-            display_id = case.get('display_id', case['case_id'])
-            case_id = case.get('case_id')
-            
-            # Get detailed info from API
-            detail = case_details_map.get(case_id, {})
-            
-            # AWS Support Console link
-            support_url = f"https://support.console.aws.amazon.com/support/home#/case/?displayId={display_id}"
-            
-            # Use latest data from API
-            subject = detail.get('subject', case.get('subject', 'N/A'))
-            severity_code = detail.get('severityCode', case.get('severity', 'N/A'))
-            severity_display = severity_map.get(severity_code, severity_code)
-            status = detail.get('status', case.get('status', 'N/A'))
-            status_display = status_map.get(status, status)
-            time_created = detail.get('timeCreated', case.get('created_at', 'N/A'))
-            # Convert to dual timezone display
-            time_created = format_aws_time_dual(time_created)
-            
-            # Extract account ID from role_arn
-            account_id = 'N/A'
-            role_arn = case.get('role_arn', '')
-            if role_arn and ':' in role_arn:
-                # role_arn format: arn:aws:iam::123456789012:role/...
-                parts = role_arn.split(':')
-                if len(parts) >= 5:
-                    account_id = parts[4]
-            
-            # Add case info (using rich text format)
-            content.append([{"tag": "text", "text": "━━━━━━━━━━━━━━━━━━━"}])
-            content.append([{"tag": "text", "text": ""}])
-            content.append([{"tag": "text", "text": f"📋 {'工单' if is_chinese else 'Case'} #{i}", "style": ["bold"]}])
-            content.append([{"tag": "a", "text": display_id, "href": support_url}])
-            content.append([{"tag": "text", "text": ""}])
-            content.append([{"tag": "text", "text": "📝 "}, {"tag": "text", "text": subject}])
-            content.append([{"tag": "text", "text": f"👤 {'账号' if is_chinese else 'Account'}: "}, {"tag": "text", "text": account_id}])
-            content.append([{"tag": "text", "text": f"📊 {'状态' if is_chinese else 'Status'}: "}, {"tag": "text", "text": status_display}])
-            content.append([{"tag": "text", "text": f"⚠️ {'严重级别' if is_chinese else 'Severity'}: "}, {"tag": "text", "text": severity_display}])
-            content.append([{"tag": "text", "text": f"🕐 {'创建时间' if is_chinese else 'Created'}: "}, {"tag": "text", "text": time_created}])
-            content.append([{"tag": "text", "text": ""}])
-            if is_chinese:
-                content.append([{"tag": "text", "text": "💬 回复 "}, {"tag": "text", "text": f"关注 {display_id}", "style": ["bold"]}, {"tag": "text", "text": " 加入工单群"}])
-            else:
-                content.append([{"tag": "text", "text": "💬 Reply "}, {"tag": "text", "text": f"follow {display_id}", "style": ["bold"]}, {"tag": "text", "text": " to join case chat"}])
-            content.append([{"tag": "text", "text": ""}])  # Empty line separator
+        content = list(_history_case_rows(cases[:10], case_details_map, is_chinese))
         
         title = f"📚 工单历史 (最近 {len(cases[:10])} 个)" if is_chinese else f"📚 Your Case History (Recent {len(cases[:10])})"
         send_post_message(chat_id, title, content)
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+        return _OK_RESPONSE
     
-    return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+    return _OK_RESPONSE
 
 
-def handle_case_chat_message(case_info: Dict[str, Any], message: Dict[str, Any], user_id: str, open_id: str = '') -> Dict[str, Any]:
-    """Handle messages in case chat - only sync messages with @bot mention to AWS Support"""
-    content = json.loads(message.get('content', '{}'))
+def handle_case_chat_message(case_info: Dict[str, Any], message: Dict[str, Any], user_id: str, open_id: str = '',
+                             content: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Handle messages in case chat - only sync messages with @bot mention to AWS Support
+    
+    Args:
+        content: Already-parsed message content; parsed from message['content'] if omitted
+    """
+    if content is None:
+        content = json.loads(message.get('content', '{}'))
     text = content.get('text', '').strip()
     
     if not text:
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+        return _OK_RESPONSE
     
     # Check if @bot mentioned
-    mentions = message.get('mentions', [])
-    has_bot_mention = False
-    for mention in mentions:
-        mention_key = mention.get('key', '')
-        if mention_key:
-            has_bot_mention = True
-            text = text.replace(mention_key, '').strip()
+    mention_keys = [m.get('key', '') for m in message.get('mentions', []) if m.get('key')]
+    has_bot_mention = bool(mention_keys)
+    text = strip_mentions(text, mention_keys)
     
     print(f"Case chat message - has_bot_mention: {has_bot_mention}, text after removing mentions: '{text}'")
     
@@ -1927,18 +2223,18 @@ def handle_case_chat_message(case_info: Dict[str, Any], message: Dict[str, Any],
         if is_chinese:
             content = [
                 [{"tag": "text", "text": "📋 "}, {"tag": "text", "text": "当前工单", "style": ["bold"]}, {"tag": "text", "text": ": "}, {"tag": "a", "text": display_id, "href": support_url}],
-                [{"tag": "text", "text": ""}],
+                _POST_BLANK_ROW,
                 [{"tag": "text", "text": "💬 "}, {"tag": "text", "text": "同步到 AWS Support", "style": ["bold"]}],
                 [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot [内容]", "style": ["bold"]}, {"tag": "text", "text": " - 将消息同步到 AWS Support"}],
                 [{"tag": "text", "text": "• "}, {"tag": "text", "text": "上传文件", "style": ["bold"]}, {"tag": "text", "text": " - 文件会自动同步"}],
-                [{"tag": "text", "text": ""}],
+                _POST_BLANK_ROW,
                 [{"tag": "text", "text": "💭 "}, {"tag": "text", "text": "群内讨论", "style": ["bold"]}],
                 [{"tag": "text", "text": "• 普通消息（不 @bot）仅在群内显示，不会同步到 AWS Support"}],
                 [{"tag": "text", "text": "• 适合团队内部讨论问题"}],
-                [{"tag": "text", "text": ""}],
+                _POST_BLANK_ROW,
                 [{"tag": "text", "text": "📢 "}, {"tag": "text", "text": "通知", "style": ["bold"]}],
                 [{"tag": "text", "text": "• AWS Support 工程师的回复会自动推送到此群"}],
-                [{"tag": "text", "text": ""}],
+                _POST_BLANK_ROW,
                 [{"tag": "text", "text": "💡 "}, {"tag": "text", "text": "提示", "style": ["bold"]}],
                 [{"tag": "text", "text": "• 向上滚动可查看完整工单详情"}],
                 [{"tag": "text", "text": "• 点击工单ID可跳转到 AWS 控制台"}],
@@ -1947,18 +2243,18 @@ def handle_case_chat_message(case_info: Dict[str, Any], message: Dict[str, Any],
         else:
             content = [
                 [{"tag": "text", "text": "📋 "}, {"tag": "text", "text": "Current Case", "style": ["bold"]}, {"tag": "text", "text": ": "}, {"tag": "a", "text": display_id, "href": support_url}],
-                [{"tag": "text", "text": ""}],
+                _POST_BLANK_ROW,
                 [{"tag": "text", "text": "💬 "}, {"tag": "text", "text": "Sync to AWS Support", "style": ["bold"]}],
                 [{"tag": "text", "text": "• "}, {"tag": "text", "text": "@bot [content]", "style": ["bold"]}, {"tag": "text", "text": " - Sync message to AWS Support"}],
                 [{"tag": "text", "text": "• "}, {"tag": "text", "text": "Upload files", "style": ["bold"]}, {"tag": "text", "text": " - Files are auto-synced"}],
-                [{"tag": "text", "text": ""}],
+                _POST_BLANK_ROW,
                 [{"tag": "text", "text": "💭 "}, {"tag": "text", "text": "Internal Discussion", "style": ["bold"]}],
                 [{"tag": "text", "text": "• Regular messages (without @bot) stay in chat only, not synced to AWS Support"}],
                 [{"tag": "text", "text": "• Good for team internal discussions"}],
-                [{"tag": "text", "text": ""}],
+                _POST_BLANK_ROW,
                 [{"tag": "text", "text": "📢 "}, {"tag": "text", "text": "Notifications", "style": ["bold"]}],
                 [{"tag": "text", "text": "• AWS Support engineer replies are auto-pushed to this chat"}],
-                [{"tag": "text", "text": ""}],
+                _POST_BLANK_ROW,
                 [{"tag": "text", "text": "💡 "}, {"tag": "text", "text": "Tips", "style": ["bold"]}],
                 [{"tag": "text", "text": "• Scroll up to view full case details"}],
                 [{"tag": "text", "text": "• Click case ID to jump to AWS Console"}],
@@ -1966,20 +2262,20 @@ def handle_case_chat_message(case_info: Dict[str, Any], message: Dict[str, Any],
             title = "Case Chat Instructions"
         
         send_post_message(case_info['case_chat_id'], title, content)
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+        return _OK_RESPONSE
     
     # In case chat, only @bot messages are synced to AWS Support
     # Other messages are for internal discussion, not synced
     if not has_bot_mention:
         # Regular message, don't process, just for internal discussion
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+        return _OK_RESPONSE
     
     # @bot message, sync to AWS Support
     if not text:
         send_message(case_info['case_chat_id'], 'text', {
             'text': get_message(DEFAULT_LANGUAGE, 'enter_reply_at_bot')
         })
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+        return _OK_RESPONSE
     
     # Get role_arn from case info (saved when case was created)
     role_arn = case_info.get('role_arn')
@@ -1989,25 +2285,15 @@ def handle_case_chat_message(case_info: Dict[str, Any], message: Dict[str, Any],
         send_message(case_info['case_chat_id'], 'text', {
             'text': get_message(DEFAULT_LANGUAGE, 'config_no_account')
         })
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+        return _OK_RESPONSE
     
     # Add to AWS Support (using account from when case was created)
     display_id = case_info.get('display_id', case_info.get('case_id'))
     
     print(f"Adding communication to case {case_info['case_id']}, content length: {len(text)}")
     
-    # Try to get user info for display
-    user_name = 'Team Member'
-    try:
-        user_info = get_user_info(user_id=user_id, open_id=open_id)
-        user_name = user_info.get('name', 'Team Member')
-        
-        # If name is ID format, use generic name
-        if user_name.startswith('ou_') or user_name.startswith('on_'):
-            user_name = 'Team Member'
-    except Exception as e:
-        print(f"Failed to get user name, using default: {e}")
-        user_name = 'Team Member'
+    # Get user name for display
+    user_name = get_member_display_name(user_id=user_id, open_id=open_id)
     
     success = add_communication_to_case(
         role_arn=role_arn,
@@ -2019,7 +2305,7 @@ def handle_case_chat_message(case_info: Dict[str, Any], message: Dict[str, Any],
         print(f"Communication added successfully to case {case_info['case_id']}")
         
         # Send confirmation message with reply preview
-        preview = text[:50] + '...' if len(text) > 50 else text
+        preview = text if len(text) <= SYNC_PREVIEW_LENGTH else text[:SYNC_PREVIEW_LENGTH] + '...'
         send_message(case_info['case_chat_id'], 'text', {'text': get_message(DEFAULT_LANGUAGE, 'synced_to_case', display_id, preview)})
     else:
         print(f"Failed to add communication to case {case_info['case_id']}")
@@ -2027,11 +2313,51 @@ def handle_case_chat_message(case_info: Dict[str, Any], message: Dict[str, Any],
             'text': get_message(DEFAULT_LANGUAGE, 'sync_failed', display_id)
         })
     
-    return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+    return _OK_RESPONSE
+
+
+# AWS Support rejects attachments larger than 5 MB
+MAX_ATTACHMENT_SIZE = 5 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _read_attachment_body(response) -> bytes:
+    """Read a streamed (preload_content=False) download, stopping at MAX_ATTACHMENT_SIZE
+    
+    Oversized files are rejected from Content-Length before any of the body is
+    read, or as soon as the stream passes the limit, instead of being buffered
+    in full only to be refused by AWS Support.
+    """
+    try:
+        content_length = int(response.headers.get('Content-Length') or 0)
+        if content_length > MAX_ATTACHMENT_SIZE:
+            raise Exception(f"File too large: {content_length} bytes (AWS Support limit is {MAX_ATTACHMENT_SIZE} bytes)")
+        
+        data = bytearray()
+        for chunk in response.stream(DOWNLOAD_CHUNK_SIZE):
+            data += chunk
+            if len(data) > MAX_ATTACHMENT_SIZE:
+                raise Exception(f"File too large: over {MAX_ATTACHMENT_SIZE} bytes (AWS Support limit)")
+        return bytes(data)
+    finally:
+        response.release_conn()
+
+
+def _read_error_body(response) -> str:
+    """Read and release a streamed error response"""
+    try:
+        body = response.read()
+        return body.decode('utf-8', errors='replace') if body else 'No response body'
+    finally:
+        response.release_conn()
 
 
 def download_file_from_lark(message_id: str, file_key: str) -> bytes:
-    """Download file from Lark using message_id and file_key"""
+    """Download file from Lark using message_id and file_key
+    
+    The response is streamed so files over the AWS Support attachment limit
+    are rejected without being held in memory.
+    """
     try:
         token = get_tenant_access_token()
         
@@ -2039,7 +2365,8 @@ def download_file_from_lark(message_id: str, file_key: str) -> bytes:
         # Reference: https://open.feishu.cn/document/uAjLw4CM/ukTMukTMukTM/reference/im-v1/message-resource/get
         url = f"https://open.larksuite.com/open-apis/im/v1/messages/{message_id}/resources/{file_key}"
         headers = {
-            "Authorization": f"Bearer {token}"
+            "Authorization": f"Bearer {token}",
+            "Accept-Encoding": "gzip"  # urllib3 decompresses transparently while streaming
         }
         
         # Add query parameter type, can be file, image, audio, video, media based on message type
@@ -2051,16 +2378,17 @@ def download_file_from_lark(message_id: str, file_key: str) -> bytes:
         print(f"  file_key: {file_key}")
         print(f"  url: {full_url}")
         
-        response = http.request('GET', full_url, headers=headers)
+        response = http.request('GET', full_url, headers=headers, preload_content=False)
         
         print(f"Download response: status={response.status}")
         
         if response.status == 200:
-            print(f"File downloaded successfully, size: {len(response.data)} bytes")
-            return response.data
+            file_data = _read_attachment_body(response)
+            print(f"File downloaded successfully, size: {len(file_data)} bytes")
+            return file_data
         else:
             # Print detailed error info
-            error_body = response.data.decode('utf-8') if response.data else 'No response body'
+            error_body = _read_error_body(response)
             print(f"Failed to download file:")
             print(f"  Status: {response.status}")
             print(f"  Response: {error_body}")
@@ -2068,12 +2396,13 @@ def download_file_from_lark(message_id: str, file_key: str) -> bytes:
             # Try without type parameter
             if params:
                 print(f"Retrying without type parameter...")
-                response2 = http.request('GET', url, headers=headers)
+                response2 = http.request('GET', url, headers=headers, preload_content=False)
                 if response2.status == 200:
-                    print(f"Success without type parameter, size: {len(response2.data)} bytes")
-                    return response2.data
+                    file_data = _read_attachment_body(response2)
+                    print(f"Success without type parameter, size: {len(file_data)} bytes")
+                    return file_data
                 else:
-                    error_body2 = response2.data.decode('utf-8') if response2.data else 'No response body'
+                    error_body2 = _read_error_body(response2)
                     print(f"Retry also failed: status={response2.status}, response={error_body2}")
             
             raise Exception(f"Failed to download file: HTTP {response.status} - {error_body}")
@@ -2090,11 +2419,12 @@ def get_message_content(message_id: str) -> Optional[Dict[str, Any]]:
         url = f"https://open.larksuite.com/open-apis/im/v1/messages/{message_id}"
         headers = {
             "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip"
         }
         
         response = http.request('GET', url, headers=headers)
-        result = json.loads(response.data.decode('utf-8'))
+        result = _loads(response.data)
         
         if result.get('code') == 0:
             return result.get('data', {}).get('items', [{}])[0]
@@ -2125,7 +2455,7 @@ def handle_dissolve_group(case_info: Dict[str, Any], chat_id: str, open_id: str)
     # Check if this is a case chat
     if not case_info:
         send_message(chat_id, 'text', {'text': get_message(DEFAULT_LANGUAGE, 'dissolve_not_case_chat')})
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+        return _OK_RESPONSE
     
     # Check if user is the case creator
     created_by_open_id = case_info.get('created_by_open_id', '')
@@ -2138,7 +2468,7 @@ def handle_dissolve_group(case_info: Dict[str, Any], chat_id: str, open_id: str)
     if created_by_open_id and created_by_open_id != open_id:
         creator_name = created_by if created_by else get_message(DEFAULT_LANGUAGE, 'label_case_creator')
         send_message(chat_id, 'text', {'text': get_message(DEFAULT_LANGUAGE, 'dissolve_only_creator', creator_name)})
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+        return _OK_RESPONSE
     
     # If no created_by_open_id recorded, allow anyone to dissolve (backward compatibility for old cases)
     if not created_by_open_id:
@@ -2187,19 +2517,20 @@ def handle_upload_reply(case_info: Dict[str, Any], parent_id: str, chat_id: str,
     
     if not parent_message:
         send_message(chat_id, 'text', {'text': get_message(DEFAULT_LANGUAGE, 'upload_get_msg_failed')})
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+        return _OK_RESPONSE
     
     # Check if it's a file message
     msg_type = parent_message.get('msg_type', '')
     if msg_type != 'file':
         send_message(chat_id, 'text', {'text': get_message(DEFAULT_LANGUAGE, 'upload_reply_to_file')})
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+        return _OK_RESPONSE
     
-    # Construct message object and call handle_file_upload
+    # Construct message object and call handle_file_upload (content parsed here once,
+    # so handle_file_upload takes its dict branch)
     message = {
         'message_id': parent_id,
         'message_type': 'file',
-        'content': parent_message.get('body', {}).get('content', '{}')
+        'content': json.loads(parent_message.get('body', {}).get('content') or '{}')
     }
     
     return handle_file_upload(case_info, message, user_id)
@@ -2227,19 +2558,9 @@ def handle_file_upload(case_info: Dict[str, Any], message: Dict[str, Any], user_
     
     if not file_key or not message_id:
         print(f"Missing required fields, skipping")
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+        return _OK_RESPONSE
     
     try:
-        # Download file
-        print(f"Step 1: Downloading file from Lark...")
-        file_data = download_file_from_lark(message_id, file_key)
-        print(f"Step 1: Download completed, size: {len(file_data)} bytes")
-        
-        # Check for empty file
-        if len(file_data) == 0:
-            send_message(case_info['case_chat_id'], 'text', {'text': '❌ 文件为空，无法上传 / File is empty'})
-            return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
-        
         # Get role_arn from case info (saved when case was created)
         role_arn = case_info.get('role_arn')
         
@@ -2248,14 +2569,28 @@ def handle_file_upload(case_info: Dict[str, Any], message: Dict[str, Any], user_
             send_message(case_info['case_chat_id'], 'text', {
                 'text': get_message(DEFAULT_LANGUAGE, 'upload_no_account_info')
             })
-            return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+            return _OK_RESPONSE
+        
+        # Warm the Support client (STS AssumeRole on a cache miss) while the file downloads;
+        # upload_attachment_to_support then picks it up from the client cache (or waits
+        # on the cache lock), and reports any assume-role failure itself
+        _executor.submit(_make_assumed_client, 'support', role_arn)
+        
+        # Download file
+        print(f"Step 1: Downloading file from Lark...")
+        file_data = download_file_from_lark(message_id, file_key)
+        print(f"Step 1: Download completed, size: {len(file_data)} bytes")
+        
+        # Check for empty file
+        if len(file_data) == 0:
+            send_message(case_info['case_chat_id'], 'text', {'text': '❌ 文件为空，无法上传 / File is empty'})
+            return _OK_RESPONSE
         
         # Upload to AWS Support (using account from case creation)
         display_id = case_info.get('display_id', case_info.get('case_id'))
         
         # Get user name
-        user_info = get_user_info(user_id=user_id)
-        user_name = user_info.get('name', 'Team Member')
+        user_name = get_member_display_name(user_id=user_id)
         
         print(f"Step 2: Uploading to AWS Support...")
         attachment_set_id = upload_attachment_to_support(role_arn, file_data, file_name)
@@ -2307,7 +2642,73 @@ def handle_file_upload(case_info: Dict[str, Any], message: Dict[str, Any], user_
         
         send_message(case_info['case_chat_id'], 'text', {'text': user_msg})
     
-    return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+    return _OK_RESPONSE
+
+
+# Required case fields, labelled for the "fill required fields" prompt
+_REQUIRED_FIELD_LABELS = {
+    'en': {'subject': 'Case Title', 'service': 'AWS Service', 'severity': 'Severity'},
+    'zh': {'subject': '工单标题', 'service': 'AWS 服务', 'severity': '严重程度'}
+}
+
+
+# Case submission post fragments per language, built once at import. Label strings and
+# static rows are shared (read-only); only cells carrying case values are built per submission.
+def _build_case_post_templates(lang: str) -> Dict[str, Any]:
+    def bold(key):
+        return {"tag": "text", "text": get_message(lang, key), "style": ["bold"]}
+    
+    return {
+        'success_header': [
+            [{"tag": "text", "text": get_message(lang, 'case_created_success')}],
+            _POST_BLANK_ROW,
+        ],
+        'account_label': f"{get_message(lang, 'case_account_label')}: ",
+        'id_label': f"{get_message(lang, 'case_id_label')}: ",
+        'issue_type_label': f"{get_message(lang, 'case_issue_type_label')}: ",
+        'title_label': f"{get_message(lang, 'case_title_label')}: ",
+        'severity_label': f"{get_message(lang, 'case_severity_label')}: ",
+        'chat_created_rows': [
+            [{"tag": "text", "text": get_message(lang, 'case_chat_created')}],
+            _POST_BLANK_ROW,
+        ],
+        'join_instruction': {"tag": "text", "text": f"{get_message(lang, 'case_join_instruction')} "},
+        'join_command': f"@bot {get_message(lang, 'follow')} ",
+        'join_suffix': {"tag": "text", "text": f" {get_message(lang, 'case_join_suffix')}"},
+        'severity_map': {
+            level: get_message(lang, f'severity_{level}')
+            for level in SEVERITY_CODES
+        },
+        'creator_fallback': get_message(lang, 'label_case_creator'),
+        'details_title': get_message(lang, 'case_details_title'),
+        'label_case_id': bold('label_case_id'),
+        'label_title': bold('label_title'),
+        'label_account': bold('label_account'),
+        'label_severity': bold('label_severity'),
+        'label_created_time': bold('label_created_time'),
+        'label_created_by': bold('label_created_by'),
+        'details_footer': [
+            _POST_BLANK_ROW,
+            [{"tag": "text", "text": "───────────────────"}],
+            _POST_BLANK_ROW,
+            [{"tag": "text", "text": "💬 "}, bold('sync_to_support')],
+            [{"tag": "text", "text": "• "}, bold('sync_instruction'), {"tag": "text", "text": get_message(lang, 'sync_description')}],
+            [{"tag": "text", "text": "• "}, bold('upload_attachment'), {"tag": "text", "text": get_message(lang, 'upload_description')}],
+            _POST_BLANK_ROW,
+            [{"tag": "text", "text": "💭 "}, bold('internal_discussion')],
+            [{"tag": "text", "text": get_message(lang, 'internal_discussion_1')}],
+            [{"tag": "text", "text": get_message(lang, 'internal_discussion_2')}],
+            _POST_BLANK_ROW,
+            [{"tag": "text", "text": "📢 "}, bold('notification')],
+            [{"tag": "text", "text": get_message(lang, 'notification_1')}],
+            [{"tag": "text", "text": get_message(lang, 'type_help')}, bold('help'), {"tag": "text", "text": get_message(lang, 'see_more_commands')}],
+        ],
+    }
+
+
+_CASE_POST_TEMPLATES = {lang: _build_case_post_templates(lang) for lang in MESSAGES}
+_POST_COLON_CELL = {"tag": "text", "text": ": "}
+
 
 def process_case_submission_async(action_value: Dict[str, Any], 
                                   operator: Dict[str, Any], user_id: str, context_chat_id: str):
@@ -2340,13 +2741,12 @@ def process_case_submission_async(action_value: Dict[str, Any],
     issue_type = 'technical'
     
     # Validate required fields
-    missing_fields = []
-    if not subject:
-        missing_fields.append('Case Title' if DEFAULT_LANGUAGE == 'en' else '工单标题')
-    if not service_code:
-        missing_fields.append('AWS Service' if DEFAULT_LANGUAGE == 'en' else 'AWS 服务')
-    if not severity:
-        missing_fields.append('Severity' if DEFAULT_LANGUAGE == 'en' else '严重程度')
+    labels = _REQUIRED_FIELD_LABELS['en' if DEFAULT_LANGUAGE == 'en' else 'zh']
+    missing_fields = [
+        labels[field]
+        for field, value in (('subject', subject), ('service', service_code), ('severity', severity))
+        if not value
+    ]
     
     if missing_fields:
         fields_str = "\n".join([f"• {field}" for field in missing_fields])
@@ -2399,6 +2799,17 @@ def process_case_submission_async(action_value: Dict[str, Any],
     print(f"Using global default language: {DEFAULT_LANGUAGE}, subject: {subject[:30] if subject else 'empty'}")
     
     if result['success']:
+        # Get creator info (from operator)
+        created_by = operator.get('user_id', user_id)
+        created_by_open_id = operator.get('open_id', '')
+        
+        # The creator's name is only needed for the case chat post; when the operator
+        # doesn't carry it, look it up while the case chat is being created
+        name_future = None
+        if created_by_open_id and not operator.get('user_name'):
+            print(f"Getting user info for user_id: {created_by}, open_id: {created_by_open_id}")
+            name_future = _executor.submit(get_cached_user_info, created_by, created_by_open_id)
+        
         # Create case chat - use open_id
         try:
             # Get open_id from operator
@@ -2434,13 +2845,12 @@ def process_case_submission_async(action_value: Dict[str, Any],
         
         # Save case info
         # Extract target account ID from role_arn
-        account_id = role_arn.split(':')[4] if ':' in role_arn else 'Unknown'
+        account_id = account_id_from_role_arn(role_arn)
         
-        # Get creator info (from operator)
-        created_by = operator.get('user_id', user_id)
-        created_by_open_id = operator.get('open_id', '')
-        
-        save_case_info(
+        # Save case info (S3 writes) on the pool while the posts below are built and sent;
+        # nothing sent depends on it
+        save_future = _executor.submit(
+            save_case_info,
             case_id=result['case_id'],
             display_id=result['display_id'],
             chat_id=chat_id,
@@ -2454,92 +2864,82 @@ def process_case_submission_async(action_value: Dict[str, Any],
             created_by_open_id=created_by_open_id
         )
         
-        # Send success message (using rich text format for bold)
-        issue_type_name = ISSUE_TYPES.get(issue_type, {}).get('name', issue_type)
-        
-        # Use global default language for all bot responses
-        lang = DEFAULT_LANGUAGE
-        
-        # Build rich text content (localized)
-        success_content = [
-            [{"tag": "text", "text": get_message(lang, 'case_created_success')}],
-            [{"tag": "text", "text": ""}],
-            [{"tag": "text", "text": f"{get_message(lang, 'case_account_label')}: {account_id} ({account_name})"}],
-            [{"tag": "text", "text": f"{get_message(lang, 'case_id_label')}: {result['display_id']}"}],
-            [{"tag": "text", "text": f"{get_message(lang, 'case_issue_type_label')}: {issue_type_name}"}],
-            [{"tag": "text", "text": f"{get_message(lang, 'case_title_label')}: {subject}"}],
-            [{"tag": "text", "text": f"{get_message(lang, 'case_severity_label')}: {severity}"}],
-            [{"tag": "text", "text": ""}],
-        ]
+        try:
+            # Send success message (using rich text format for bold)
+            issue_type_name = _ISSUE_TYPE_NAMES.get(issue_type, issue_type)
+        
+            # Use global default language for all bot responses
+            lang = DEFAULT_LANGUAGE
+        
+            tpl = _CASE_POST_TEMPLATES[lang]
+            display_id = result['display_id']
+        
+            # Build rich text content (localized)
+            success_content = tpl['success_header'] + [
+                [{"tag": "text", "text": f"{tpl['account_label']}{account_id} ({account_name})"}],
+                [{"tag": "text", "text": f"{tpl['id_label']}{display_id}"}],
+                [{"tag": "text", "text": f"{tpl['issue_type_label']}{issue_type_name}"}],
+                [{"tag": "text", "text": f"{tpl['title_label']}{subject}"}],
+                [{"tag": "text", "text": f"{tpl['severity_label']}{severity}"}],
+                _POST_BLANK_ROW,
+            ]
         
-        if case_chat_id:
-            success_content.extend([
-                [{"tag": "text", "text": get_message(lang, 'case_chat_created')}],
-                [{"tag": "text", "text": ""}],
-                [{"tag": "text", "text": f"{get_message(lang, 'case_join_instruction')} "}, {"tag": "text", "text": f"@bot {get_message(lang, 'follow')} {result['display_id']}", "style": ["bold"]}, {"tag": "text", "text": f" {get_message(lang, 'case_join_suffix')}"}],
-            ])
+            if case_chat_id:
+                success_content.extend(tpl['chat_created_rows'])
+                success_content.append([
+                    tpl['join_instruction'],
+                    {"tag": "text", "text": f"{tpl['join_command']}{display_id}", "style": ["bold"]},
+                    tpl['join_suffix']
+                ])
             
-            # Send detailed case information in the case group chat
-            severity_map = {
-                'low': get_message(lang, 'severity_low'),
-                'normal': get_message(lang, 'severity_normal'),
-                'high': get_message(lang, 'severity_high'),
-                'urgent': get_message(lang, 'severity_urgent'),
-                'critical': get_message(lang, 'severity_critical')
-            }
-            severity_display = severity_map.get(severity, severity)
+                # Send detailed case information in the case group chat
+                severity_display = tpl['severity_map'].get(severity, severity)
             
-            # Get current time (UTC and Beijing time)
-            created_time = get_dual_timezone_time()
+                # Get current time (UTC and Beijing time)
+                created_time = get_dual_timezone_time()
             
-            # Get creator's user info
-            # Prefer name from operator, if not available then call API
-            user_display_name = operator.get('user_name', '')
+                # Get creator's user info
+                # Prefer name from operator, if not available then call API
+                user_display_name = operator.get('user_name', '')
             
-            if not user_display_name:
-                creator_open_id = operator.get('open_id', '')
-                print(f"Getting user info for user_id: {created_by}, open_id: {creator_open_id}")
-                user_info = get_user_info(user_id=created_by, open_id=creator_open_id)
-                print(f"User info result: {user_info}")
-                user_display_name = user_info.get('name', '')
+                if not user_display_name:
+                    # A case chat implies an open_id, so the lookup was started above
+                    user_info = name_future.result() if name_future else {}
+                    print(f"User info result: {user_info}")
+                    user_display_name = user_info.get('name', '')
                 
-                # If still no name, use friendly fallback display
-                if not user_display_name or user_display_name.startswith('ou_'):
-                    user_display_name = get_message(lang, 'label_case_creator')
+                    # If still no name, use friendly fallback display
+                    if not user_display_name or user_display_name.startswith('ou_'):
+                        user_display_name = tpl['creator_fallback']
             
-            print(f"Final user display name: {user_display_name}")
+                print(f"Final user display name: {user_display_name}")
             
-            # AWS Support Console link
-            support_url = f"https://support.console.aws.amazon.com/support/home#/case/?displayId={result['display_id']}"
+                # AWS Support Console link
+                support_url = f"https://support.console.aws.amazon.com/support/home#/case/?displayId={display_id}"
             
-            # Build rich text content
-            case_content = [
-                [{"tag": "text", "text": get_message(lang, 'label_case_id'), "style": ["bold"]}, {"tag": "text", "text": ": "}, {"tag": "a", "text": result['display_id'], "href": support_url}],
-                [{"tag": "text", "text": get_message(lang, 'label_title'), "style": ["bold"]}, {"tag": "text", "text": f": {subject}"}],
-                [{"tag": "text", "text": get_message(lang, 'label_account'), "style": ["bold"]}, {"tag": "text", "text": f": {account_id} ({account_name})"}],
-                [{"tag": "text", "text": get_message(lang, 'label_severity'), "style": ["bold"]}, {"tag": "text", "text": f": {severity_display}"}],
-                [{"tag": "text", "text": get_message(lang, 'label_created_time'), "style": ["bold"]}, {"tag": "text", "text": f": {created_time}"}],
-                [{"tag": "text", "text": get_message(lang, 'label_created_by'), "style": ["bold"]}, {"tag": "text", "text": f": {user_display_name}"}],
-                [{"tag": "text", "text": ""}],
-                [{"tag": "text", "text": "───────────────────"}],
-                [{"tag": "text", "text": ""}],
-                [{"tag": "text", "text": "💬 "}, {"tag": "text", "text": get_message(lang, 'sync_to_support'), "style": ["bold"]}],
-                [{"tag": "text", "text": "• "}, {"tag": "text", "text": get_message(lang, 'sync_instruction'), "style": ["bold"]}, {"tag": "text", "text": get_message(lang, 'sync_description')}],
-                [{"tag": "text", "text": "• "}, {"tag": "text", "text": get_message(lang, 'upload_attachment'), "style": ["bold"]}, {"tag": "text", "text": get_message(lang, 'upload_description')}],
-                [{"tag": "text", "text": ""}],
-                [{"tag": "text", "text": "💭 "}, {"tag": "text", "text": get_message(lang, 'internal_discussion'), "style": ["bold"]}],
-                [{"tag": "text", "text": get_message(lang, 'internal_discussion_1')}],
-                [{"tag": "text", "text": get_message(lang, 'internal_discussion_2')}],
-                [{"tag": "text", "text": ""}],
-                [{"tag": "text", "text": "📢 "}, {"tag": "text", "text": get_message(lang, 'notification'), "style": ["bold"]}],
-                [{"tag": "text", "text": get_message(lang, 'notification_1')}],
-                [{"tag": "text", "text": get_message(lang, 'type_help')}, {"tag": "text", "text": get_message(lang, 'help'), "style": ["bold"]}, {"tag": "text", "text": get_message(lang, 'see_more_commands')}],
-            ]
+                # Build rich text content
+                case_content = [
+                    [tpl['label_case_id'], _POST_COLON_CELL, {"tag": "a", "text": display_id, "href": support_url}],
+                    [tpl['label_title'], {"tag": "text", "text": f": {subject}"}],
+                    [tpl['label_account'], {"tag": "text", "text": f": {account_id} ({account_name})"}],
+                    [tpl['label_severity'], {"tag": "text", "text": f": {severity_display}"}],
+                    [tpl['label_created_time'], {"tag": "text", "text": f": {created_time}"}],
+                    [tpl['label_created_by'], {"tag": "text", "text": f": {user_display_name}"}],
+                ]
+                case_content.extend(tpl['details_footer'])
             
-            send_post_message(case_chat_id, get_message(lang, 'case_details_title'), case_content)
-        
-        # Send success message (using rich text format)
-        send_post_message(chat_id, "", success_content)
+                # Case chat details and success message go to different chats, send both at once
+                run_concurrently(
+                    lambda: send_post_message(case_chat_id, tpl['details_title'], case_content),
+                    lambda: send_post_message(chat_id, "", success_content)
+                )
+            else:
+                # Send success message (using rich text format)
+                send_post_message(chat_id, "", success_content)
+        finally:
+            # Wait for the case record even if a send failed, so the S3 writes finish
+            # before the handler returns (re-raises save errors)
+            save_future.result()
     else:
         error_text = get_message(DEFAULT_LANGUAGE, 'case_create_failed', result.get('error', 'Unknown error'))
         send_message(chat_id, 'text', {'text': error_text})
@@ -2581,9 +2981,6 @@ def handle_card_action(event_data: Dict[str, Any]) -> Dict[str, Any]:
             }
         
         try:
-            import boto3
-            lambda_client = boto3.client('lambda')
-            
             # Prepare payload for async processing
             async_payload = {
                 'action_value': action_value,
@@ -2592,14 +2989,18 @@ def handle_card_action(event_data: Dict[str, Any]) -> Dict[str, Any]:
                 'context_chat_id': context_chat_id
             }
             
-            # Invoke self asynchronously for case processing
+            # Invoke self asynchronously for case processing. A background thread in this
+            # invocation would not work: Lambda freezes the container as soon as the
+            # handler returns, so the thread would stall until the next event arrives.
             function_name = os.environ.get('AWS_LAMBDA_FUNCTION_NAME')
             print(f"Triggering async case processing via Lambda invoke: {function_name}")
             
             lambda_client.invoke(
                 FunctionName=function_name,
+                # Same published version as this invocation, so it shares its SnapStart snapshot
+                Qualifier=os.environ.get('AWS_LAMBDA_FUNCTION_VERSION', '$LATEST'),
                 InvocationType='Event',  # Async invocation - returns immediately
-                Payload=json.dumps({
+                Payload=_dumps_bytes({
                     'async_case_processing': True,
                     'payload': async_payload
                 })
@@ -2632,9 +3033,7 @@ def handle_card_action(event_data: Dict[str, Any]) -> Dict[str, Any]:
             draft = drafts[0]
             draft_id = draft['case_id']
             
-            severity_codes = ['low', 'normal', 'high', 'urgent', 'critical']
-            
-            if selected_value in severity_codes:
+            if selected_value in _SEVERITY_CODE_SET:
                 update_case(draft_id, {'severity': selected_value})
             elif selected_value.isdigit():
                 update_case(draft_id, {'account_key': selected_value})
@@ -2647,63 +3046,63 @@ def handle_card_action(event_data: Dict[str, Any]) -> Dict[str, Any]:
             'body': json.dumps({})
         }
     
-    return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+    return _OK_RESPONSE
 
 
-def is_event_processed(event_id: str) -> bool:
-    """Check if event has been processed (S3 + in-memory cache for deduplication)"""
-    global _processed_events
-    
-    # 1. Check in-memory cache first (fast path)
-    if event_id in _processed_events:
-        time_diff = datetime.utcnow() - _processed_events[event_id]
-        if time_diff.total_seconds() < 300:  # 5 minutes
-            print(f"Event {event_id} already processed (memory cache), skipping")
-            return True
+def is_duplicate_event(event_id: str, ttl: float = EVENT_DEDUP_TTL) -> bool:
+    """Check and mark event in the in-memory dedup cache (no network calls)
     
-    # 2. Check S3 (for cold starts)
-    try:
-        dedup_case = get_case(f'event_dedup_{event_id}')
-        
-        if dedup_case:
-            # Check if event was processed recently
-            processed_at = datetime.fromisoformat(dedup_case.get('created_at', ''))
-            time_diff = datetime.utcnow() - processed_at
-            if time_diff.total_seconds() < 300:  # 5 minutes
-                print(f"Event {event_id} already processed (S3), skipping")
-                # Update memory cache
-                _processed_events[event_id] = processed_at
-                return True
-    except Exception as e:
-        print(f"Error checking S3 for event deduplication: {e}")
-        # Continue anyway, don't block on S3 errors
+    Must be called first in the handler, before any Lark/AWS API call, so that
+    Lark webhook retries are dropped without repeating the downstream work.
     
-    # 3. Mark event as processed (both memory and S3)
-    now = datetime.utcnow()
-    _processed_events[event_id] = now
+    Args:
+        event_id: Lark event ID from the event header
+        ttl: Seconds an event is considered a duplicate after first seen
+        
+    Returns:
+        True if the event was already seen within ttl, False otherwise
+    """
+    now = time.time()
+    expiry = _processed_events.get(event_id)
+    if expiry and expiry > now:
+        return True
     
+    _processed_events[event_id] = now + ttl
+    _processed_events.move_to_end(event_id)
+    
+    # Clean up oldest entries from memory cache if too large
+    if len(_processed_events) > MAX_CACHE_SIZE:
+        while len(_processed_events) > PROCESSED_EVENTS_KEEP:
+            _processed_events.popitem(last=False)
+    
+    return False
+
+
+def is_event_processed(event_id: str) -> bool:
+    """Check if event has been processed (in-memory cache + S3 for deduplication)"""
+    # 1. Check in-memory cache first (fast path, also marks the event)
+    if is_duplicate_event(event_id):
+        print(f"Event {event_id} already processed (memory cache), skipping")
+        return True
+    
+    # 2. Record in S3 (for cold starts): conditional create fails if already recorded
     try:
-        put_case(f'event_dedup_{event_id}', {
-            'case_id': f'event_dedup_{event_id}',
-            'created_at': now.isoformat(),
-            'ttl': int((now + timedelta(minutes=10)).timestamp())  # For reference (S3 doesn't auto-delete)
-        })
+        if not mark_event_processed(event_id):
+            print(f"Event {event_id} already processed (S3), skipping")
+            return True
     except Exception as e:
         print(f"Error writing to S3 for event deduplication: {e}")
         # Continue anyway, memory cache is still active
     
-    # Clean up old entries from memory cache if too large
-    if len(_processed_events) > MAX_CACHE_SIZE:
-        sorted_events = sorted(_processed_events.items(), key=lambda x: x[1])
-        _processed_events = dict(sorted_events[-50:])
-    
     return False
 
 
 def lambda_handler(event, context):
     """Main Lambda handler"""
     try:
-        print(f"Received event: {json.dumps(event)}")
+        # Serializing the whole event (card payloads can be tens of KB) is skipped unless debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received event: %s", _dumps_str(event))
         
         # Check if this is an async case processing invocation
         if event.get('async_case_processing'):
@@ -2718,8 +3117,8 @@ def lambda_handler(event, context):
             return {'statusCode': 200, 'body': json.dumps({'message': 'Async processing completed'})}
         
         body = event.get('body', '{}')
-        if isinstance(body, str):
-            body_dict = json.loads(body)
+        if isinstance(body, (str, bytes)):
+            body_dict = _loads(body)
         else:
             body_dict = body
         
@@ -2728,16 +3127,17 @@ def lambda_handler(event, context):
             encrypt_key = get_encrypt_key()
             if not encrypt_key:
                 print("Received encrypted event but no encrypt key configured")
-                return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+                return _OK_RESPONSE
             
             try:
                 body_dict = decrypt_lark_event(body_dict['encrypt'])
-                print(f"Decrypted event: {json.dumps(body_dict)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Decrypted event: %s", _dumps_str(body_dict))
             except Exception as e:
                 print(f"Failed to decrypt event: {e}")
                 import traceback
                 traceback.print_exc()
-                return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+                return _OK_RESPONSE
         
         # Handle URL verification
         if body_dict.get('type') == 'url_verification':
@@ -2751,9 +3151,9 @@ def lambda_handler(event, context):
         event_type = header.get('event_type', '')
         event_id = header.get('event_id', '')
         
-        # Event deduplication
+        # Event deduplication - must run before any Lark/AWS API call below
         if event_id and is_event_processed(event_id):
-            return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+            return _OK_RESPONSE
         
         # Route to appropriate handler
         if event_type == 'im.message.receive_v1':
@@ -2767,13 +3167,13 @@ def lambda_handler(event, context):
         # Ignore other event types (such as message recall, delete, edit, etc.)
         elif event_type in ['im.message.recalled_v1', 'im.message.deleted_v1', 'im.message.updated_v1']:
             print(f"Ignoring event type: {event_type}")
-            return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+            return _OK_RESPONSE
         
         # Unknown event type, log but don't process
         else:
             print(f"Unknown event type: {event_type}, ignoring")
         
-        return {'statusCode': 200, 'body': json.dumps({'message': 'OK'})}
+        return _OK_RESPONSE
     
     except Exception as e:
         print(f"Error: {str(e)}")
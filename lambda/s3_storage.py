@@ -8,19 +8,32 @@ Data is stored as JSON files in S3 with the following structure:
 - cases/{case_id}.json: Individual case data
 - indexes/chat_id/{chat_id}.json: Maps chat_id to case_id
 - indexes/user_id/{user_id}.json: Maps user_id to list of case_ids with created_at
+- indexes/display_id/{display_id}.json: Maps display_id to case_id
+- indexes/status/open.json: case_ids of submitted cases that are not resolved
+- indexes/status/dissolve_pending.json: case_ids of resolved cases whose case chat is not dissolved yet
+- event_dedup/{event_id}.json: Processed Lark event markers (expired by lifecycle rule)
 
 Note: S3 versioning is enabled for data protection and optimistic locking.
 """
 import json
 import os
+import threading
 import time
 import boto3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
-# Initialize S3 client
-s3_client = boto3.client('s3')
+# Initialize S3 client (pool sized so concurrent GETs from io_pool don't wait for a connection)
+s3_client = boto3.client('s3', config=Config(max_pool_connections=32, tcp_keepalive=True))
+
+# Process-wide thread pool for blocking I/O (S3 fan-out here, Lark/AWS calls in the handlers).
+# Created once per container so its threads are reused across warm invocations; boto3
+# clients are thread-safe. Sized well above the nesting depth of tasks that submit tasks.
+io_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix='io')
 
 # Environment variable
 DATA_BUCKET = os.environ.get('DATA_BUCKET', '')
@@ -34,14 +47,109 @@ CASES_PREFIX = 'cases/'
 CHAT_INDEX_PREFIX = 'indexes/chat_id/'
 CASE_CHAT_INDEX_PREFIX = 'indexes/case_chat_id/'  # Separate index for case group chats
 USER_INDEX_PREFIX = 'indexes/user_id/'
+DISPLAY_ID_INDEX_PREFIX = 'indexes/display_id/'
+STATUS_INDEX_PREFIX = 'indexes/status/'
+OPEN_CASES_INDEX_KEY = f"{STATUS_INDEX_PREFIX}open.json"
+DISSOLVE_PENDING_INDEX_KEY = f"{STATUS_INDEX_PREFIX}dissolve_pending.json"
+EVENT_DEDUP_PREFIX = 'event_dedup/'
+
+# Conditional-write attempts for a shared status index before giving up
+STATUS_INDEX_MAX_ATTEMPTS = 8
+# The open cases index is rebuilt from a full scan once it is this old (seconds), which
+# repairs entries an update left out (written while the index was first being built, or
+# given up on after repeated conflicts)
+OPEN_INDEX_MAX_AGE = 24 * 3600
+
+# Case fields that put_case mirrors into index objects
+INDEXED_FIELDS = frozenset({'chat_id', 'case_chat_id', 'user_id', 'created_at', 'display_id', 'status',
+                            'chat_dissolved'})
+
+# Case ID prefix for unsubmitted case drafts (draft_{user_id}_{chat_id}_{ts})
+DRAFT_ID_PREFIX = 'draft_'
+# Case ID prefix of legacy event dedup markers that were stored under cases/
+EVENT_DEDUP_ID_PREFIX = 'event_dedup_'
+
+# JSON (de)serialization for stored objects. Stdlib only: the function code is deployed
+# without third-party packages. Datetimes are stored via default=str, and loads accepts
+# the raw UTF-8 body bytes, so GETs skip the decode to str.
+def _dumps(data: Any) -> bytes:
+    return json.dumps(data, default=str).encode('utf-8')
+
+
+_loads = json.loads
+
+# In-memory LRU cache of config/case objects and the case_chat_id/display_id indexes (which map
+# one chat or display id to one case and do not change after the case is saved), keyed by S3
+# key: key -> (fetched_at, raw body). Misses are not cached. The other indexes are never cached
+# since they are read-modify-written by other containers. Writers of cached keys read with
+# use_cache=False, so a cached copy is never written back.
+_OBJ_CACHE: 'OrderedDict[str, tuple]' = OrderedDict()
+_OBJ_CACHE_LOCK = threading.Lock()
+_OBJ_CACHE_TTL = 30  # seconds
+_OBJ_CACHE_MAX = 512
+
+# (index key, case_id) pairs this container has seen in a chat_id/case_chat_id/user_id/display_id
+# index. Re-putting a case then skips the index GET; removals discard their pair. Index files
+# stay one object per chat/user rather than shared hash-bucket packs: a case touches only its
+# own few index files, and packing unrelated chats together would turn these writes into
+# contended read-modify-writes on the same bucket object.
+_KNOWN_INDEX_ENTRIES = set()
+_KNOWN_INDEX_ENTRIES_MAX = 4096
+
+
+def _cache_ttl(key: str) -> Optional[float]:
+    """TTL for a cacheable key, or None if the key must always be read from S3"""
+    if key.startswith((CONFIG_PREFIX, CASES_PREFIX, CASE_CHAT_INDEX_PREFIX, DISPLAY_ID_INDEX_PREFIX)):
+        return _OBJ_CACHE_TTL
+    return None
+
+
+def _cache_get(key: str, ttl: float) -> Optional[bytes]:
+    with _OBJ_CACHE_LOCK:
+        entry = _OBJ_CACHE.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= ttl:
+            del _OBJ_CACHE[key]
+            return None
+        _OBJ_CACHE.move_to_end(key)
+        return entry[1]
+
+
+def _cache_set(key: str, body: bytes):
+    with _OBJ_CACHE_LOCK:
+        _OBJ_CACHE[key] = (time.monotonic(), body)
+        _OBJ_CACHE.move_to_end(key)
+        while len(_OBJ_CACHE) > _OBJ_CACHE_MAX:
+            _OBJ_CACHE.popitem(last=False)
 
 
-def _get_object(key: str) -> Optional[Dict[str, Any]]:
-    """Get JSON object from S3"""
+def _cache_invalidate(key: str):
+    with _OBJ_CACHE_LOCK:
+        _OBJ_CACHE.pop(key, None)
+
+
+def _get_object(key: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+    """Get JSON object from S3 (cacheable objects are served from _OBJ_CACHE when fresh)
+    
+    Read-modify-write callers pass use_cache=False: another container may have
+    written the object since it was cached, and writing back the cached copy
+    would revert that write. The fresh body still refreshes the cache.
+    """
+    ttl = _cache_ttl(key)
+    if ttl is not None and use_cache:
+        # Cache raw bytes so each caller gets its own dict to mutate
+        body = _cache_get(key, ttl)
+        if body is not None:
+            return _loads(body)
+    
     t0 = time.time() if ENABLE_S3_TIMING else None
     try:
         response = s3_client.get_object(Bucket=DATA_BUCKET, Key=key)
-        data = json.loads(response['Body'].read().decode('utf-8'))
+        body = response['Body'].read()
+        data = _loads(body)
+        if ttl is not None:
+            _cache_set(key, body)
         if ENABLE_S3_TIMING:
             print(f"[S3] GET {key}: {(time.time()-t0)*1000:.0f}ms")
         return data
@@ -57,22 +165,68 @@ def _get_object(key: str) -> Optional[Dict[str, Any]]:
 
 def _put_object(key: str, data: Dict[str, Any]):
     """Put JSON object to S3"""
+    _cache_invalidate(key)
     t0 = time.time() if ENABLE_S3_TIMING else None
     s3_client.put_object(
         Bucket=DATA_BUCKET,
         Key=key,
-        Body=json.dumps(data, default=str).encode('utf-8'),
+        Body=_dumps(data),
         ContentType='application/json'
     )
+    # Again after the write: a read in another thread during the PUT may have re-cached the old body
+    _cache_invalidate(key)
+    if ENABLE_S3_TIMING:
+        print(f"[S3] PUT {key}: {(time.time()-t0)*1000:.0f}ms")
+
+
+def _get_object_with_etag(key: str) -> tuple:
+    """Get JSON object and its ETag straight from S3 (never cached), or (None, None) if missing"""
+    try:
+        response = s3_client.get_object(Bucket=DATA_BUCKET, Key=key)
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'NoSuchKey':
+            return None, None
+        raise
+    return _loads(response['Body'].read()), response['ETag']
+
+
+def _put_object_conditional(key: str, data: Dict[str, Any], etag: Optional[str] = None) -> bool:
+    """Put JSON object only if it is unchanged since it was read (If-Match: etag),
+    or only if it does not exist yet when etag is None (If-None-Match: *)
+    
+    Returns:
+        True if written, False if another writer changed the object first
+    """
+    _cache_invalidate(key)
+    condition = {'IfMatch': etag} if etag else {'IfNoneMatch': '*'}
+    t0 = time.time() if ENABLE_S3_TIMING else None
+    try:
+        s3_client.put_object(
+            Bucket=DATA_BUCKET,
+            Key=key,
+            Body=_dumps(data),
+            ContentType='application/json',
+            **condition
+        )
+    except ClientError as e:
+        # 412: changed (or created) since read; 409: a concurrent conditional write is in flight
+        if e.response['Error']['Code'] in ('PreconditionFailed', 'ConditionalRequestConflict'):
+            if ENABLE_S3_TIMING:
+                print(f"[S3] PUT {key}: CONFLICT ({(time.time()-t0)*1000:.0f}ms)")
+            return False
+        raise
     if ENABLE_S3_TIMING:
         print(f"[S3] PUT {key}: {(time.time()-t0)*1000:.0f}ms")
+    return True
 
 
 def _delete_object(key: str):
     """Delete object from S3"""
+    _cache_invalidate(key)
     t0 = time.time() if ENABLE_S3_TIMING else None
     try:
         s3_client.delete_object(Bucket=DATA_BUCKET, Key=key)
+        _cache_invalidate(key)
         if ENABLE_S3_TIMING:
             print(f"[S3] DELETE {key}: {(time.time()-t0)*1000:.0f}ms")
     except ClientError as e:
@@ -94,6 +248,17 @@ def _list_objects(prefix: str) -> List[str]:
     return keys
 
 
+def _get_objects(keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """Get many JSON objects concurrently
+    
+    Returns:
+        Objects in the same order as keys (None for missing keys)
+    """
+    if len(keys) <= 1:
+        return [_get_object(key) for key in keys]
+    return list(io_pool.map(_get_object, keys))
+
+
 # ============================================================================
 # Bot Configuration Functions
 # ============================================================================
@@ -114,53 +279,85 @@ def put_bot_config(cfg_key: str, config: Dict[str, Any]):
 # Case Data Functions
 # ============================================================================
 
-def get_case(case_id: str) -> Optional[Dict[str, Any]]:
-    """Get case data by case_id"""
+def get_case(case_id: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+    """Get case data by case_id (use_cache=False before modifying and writing it back)"""
     key = f"{CASES_PREFIX}{case_id}.json"
-    return _get_object(key)
+    return _get_object(key, use_cache)
 
 
 def put_case(case_id: str, case_data: Dict[str, Any]):
-    """Save case data and update indexes"""
+    """Save case data and update indexes
+    
+    The case object and each index live in separate S3 objects, so the writes
+    (and the index read-modify-writes) run concurrently on io_pool.
+    """
     # Ensure case_id is in the data
     case_data['case_id'] = case_id
     
     # Save case data
     key = f"{CASES_PREFIX}{case_id}.json"
-    _put_object(key, case_data)
+    writes = [(_put_object, key, case_data)]
     
     # Update chat_id index if present (source chat where command was issued)
     chat_id = case_data.get('chat_id')
     if chat_id:
-        _update_chat_index(chat_id, case_id)
+        writes.append((_update_chat_index, chat_id, case_id))
     
     # Update case_chat_id index if present (dedicated case group chat)
     # Use SEPARATE index to avoid confusion with source chat
     case_chat_id = case_data.get('case_chat_id')
     if case_chat_id:
-        _update_case_chat_index(case_chat_id, case_id)
+        writes.append((_update_case_chat_index, case_chat_id, case_id))
     
     # Update user_id index if present
     user_id = case_data.get('user_id')
     created_at = case_data.get('created_at', datetime.now(timezone.utc).isoformat())
     if user_id:
-        _update_user_index(user_id, case_id, created_at)
+        writes.append((_update_user_index, user_id, case_id, created_at))
+    
+    # Update display_id index if present (used by follow command lookups)
+    display_id = case_data.get('display_id')
+    if display_id:
+        writes.append((_update_display_id_index, display_id, case_id))
+    
+    # Update status indexes (drafts and dedup markers are never polled or dissolved)
+    if _is_submitted_case_id(case_id):
+        writes.append((_update_status_index, OPEN_CASES_INDEX_KEY, case_id, _is_open_case(case_data)))
+        writes.append((_update_status_index, DISSOLVE_PENDING_INDEX_KEY, case_id,
+                       _is_dissolve_pending(case_data)))
+    
+    futures = [io_pool.submit(func, *args) for func, *args in writes]
+    for future in futures:
+        future.result()
 
 
 def update_case(case_id: str, updates: Dict[str, Any]) -> bool:
-    """Update specific fields in a case"""
-    case_data = get_case(case_id)
+    """Update specific fields in a case
+    
+    Index maintenance is skipped when no indexed field changes value
+    (e.g. draft dropdown selections, poller last_checked updates).
+    The case is read from S3, not the object cache, so fields written
+    by other Lambdas since it was cached are not reverted.
+    """
+    case_data = get_case(case_id, use_cache=False)
     if not case_data:
         return False
     
+    indexes_changed = any(
+        case_data.get(field) != updates[field] for field in INDEXED_FIELDS.intersection(updates)
+    )
     case_data.update(updates)
-    put_case(case_id, case_data)
+    if indexes_changed:
+        put_case(case_id, case_data)
+    else:
+        case_data['case_id'] = case_id
+        _put_object(f"{CASES_PREFIX}{case_id}.json", case_data)
     return True
 
 
 def delete_case(case_id: str):
     """Delete case and remove from indexes"""
-    case_data = get_case(case_id)
+    case_data = get_case(case_id, use_cache=False)
     if case_data:
         # Remove from chat_id index (source chat)
         chat_id = case_data.get('chat_id')
@@ -176,6 +373,16 @@ def delete_case(case_id: str):
         user_id = case_data.get('user_id')
         if user_id:
             _remove_from_user_index(user_id, case_id)
+        
+        # Remove from display_id index
+        display_id = case_data.get('display_id')
+        if display_id:
+            _remove_from_display_id_index(display_id, case_id)
+        
+        # Remove from status indexes
+        if _is_submitted_case_id(case_id):
+            _update_status_index(OPEN_CASES_INDEX_KEY, case_id, False)
+            _update_status_index(DISSOLVE_PENDING_INDEX_KEY, case_id, False)
     
     # Delete case file
     key = f"{CASES_PREFIX}{case_id}.json"
@@ -186,30 +393,43 @@ def delete_case(case_id: str):
 # Index Functions
 # ============================================================================
 
+def _remember_index_entry(key: str, case_id: str):
+    if len(_KNOWN_INDEX_ENTRIES) >= _KNOWN_INDEX_ENTRIES_MAX:
+        _KNOWN_INDEX_ENTRIES.clear()
+    _KNOWN_INDEX_ENTRIES.add((key, case_id))
+
+
 def _update_chat_index(chat_id: str, case_id: str):
     """Update chat_id -> case_id index (for source chats)"""
     key = f"{CHAT_INDEX_PREFIX}{chat_id}.json"
-    index_data = _get_object(key) or {'chat_id': chat_id, 'case_ids': []}
+    if (key, case_id) in _KNOWN_INDEX_ENTRIES:
+        return
+    index_data = _get_object(key, use_cache=False) or {'chat_id': chat_id, 'case_ids': []}
     
     if case_id not in index_data['case_ids']:
         index_data['case_ids'].append(case_id)
         _put_object(key, index_data)
+    _remember_index_entry(key, case_id)
 
 
 def _update_case_chat_index(case_chat_id: str, case_id: str):
     """Update case_chat_id -> case_id index (for dedicated case group chats)"""
     key = f"{CASE_CHAT_INDEX_PREFIX}{case_chat_id}.json"
-    index_data = _get_object(key) or {'case_chat_id': case_chat_id, 'case_ids': []}
+    if (key, case_id) in _KNOWN_INDEX_ENTRIES:
+        return
+    index_data = _get_object(key, use_cache=False) or {'case_chat_id': case_chat_id, 'case_ids': []}
     
     if case_id not in index_data['case_ids']:
         index_data['case_ids'].append(case_id)
         _put_object(key, index_data)
+    _remember_index_entry(key, case_id)
 
 
 def _remove_from_chat_index(chat_id: str, case_id: str):
     """Remove case_id from chat_id index"""
     key = f"{CHAT_INDEX_PREFIX}{chat_id}.json"
-    index_data = _get_object(key)
+    _KNOWN_INDEX_ENTRIES.discard((key, case_id))
+    index_data = _get_object(key, use_cache=False)
     if index_data and case_id in index_data.get('case_ids', []):
         index_data['case_ids'].remove(case_id)
         if index_data['case_ids']:
@@ -221,7 +441,8 @@ def _remove_from_chat_index(chat_id: str, case_id: str):
 def _remove_from_case_chat_index(case_chat_id: str, case_id: str):
     """Remove case_id from case_chat_id index"""
     key = f"{CASE_CHAT_INDEX_PREFIX}{case_chat_id}.json"
-    index_data = _get_object(key)
+    _KNOWN_INDEX_ENTRIES.discard((key, case_id))
+    index_data = _get_object(key, use_cache=False)
     if index_data and case_id in index_data.get('case_ids', []):
         index_data['case_ids'].remove(case_id)
         if index_data['case_ids']:
@@ -233,24 +454,33 @@ def _remove_from_case_chat_index(case_chat_id: str, case_id: str):
 def _update_user_index(user_id: str, case_id: str, created_at: str):
     """Update user_id -> case_ids index with created_at for sorting"""
     key = f"{USER_INDEX_PREFIX}{user_id}.json"
-    index_data = _get_object(key) or {'user_id': user_id, 'cases': []}
+    if (key, case_id) in _KNOWN_INDEX_ENTRIES:
+        return
+    index_data = _get_object(key, use_cache=False) or {'user_id': user_id, 'cases': []}
     
     # Check if case already exists
     existing = next((c for c in index_data['cases'] if c['case_id'] == case_id), None)
     if not existing:
-        index_data['cases'].append({
+        # Keep created_at descending order: insert before the first older entry
+        # (position 0 for a new case, so no full re-sort per write)
+        cases = index_data['cases']
+        position = next(
+            (i for i, c in enumerate(cases) if c.get('created_at', '') < created_at),
+            len(cases)
+        )
+        cases.insert(position, {
             'case_id': case_id,
             'created_at': created_at
         })
-        # Sort by created_at descending
-        index_data['cases'].sort(key=lambda x: x.get('created_at', ''), reverse=True)
         _put_object(key, index_data)
+    _remember_index_entry(key, case_id)
 
 
 def _remove_from_user_index(user_id: str, case_id: str):
     """Remove case_id from user_id index"""
     key = f"{USER_INDEX_PREFIX}{user_id}.json"
-    index_data = _get_object(key)
+    _KNOWN_INDEX_ENTRIES.discard((key, case_id))
+    index_data = _get_object(key, use_cache=False)
     if index_data:
         index_data['cases'] = [c for c in index_data.get('cases', []) if c['case_id'] != case_id]
         if index_data['cases']:
@@ -259,6 +489,74 @@ def _remove_from_user_index(user_id: str, case_id: str):
             _delete_object(key)
 
 
+def _update_display_id_index(display_id: str, case_id: str):
+    """Update display_id -> case_id index"""
+    key = f"{DISPLAY_ID_INDEX_PREFIX}{display_id}.json"
+    if (key, case_id) in _KNOWN_INDEX_ENTRIES:
+        return
+    index_data = _get_object(key, use_cache=False)
+    
+    if not index_data or index_data.get('case_id') != case_id:
+        _put_object(key, {'display_id': display_id, 'case_id': case_id})
+    _remember_index_entry(key, case_id)
+
+
+def _remove_from_display_id_index(display_id: str, case_id: str):
+    """Remove display_id index if it points to case_id"""
+    key = f"{DISPLAY_ID_INDEX_PREFIX}{display_id}.json"
+    _KNOWN_INDEX_ENTRIES.discard((key, case_id))
+    index_data = _get_object(key, use_cache=False)
+    if index_data and index_data.get('case_id') == case_id:
+        _delete_object(key)
+
+
+def _is_submitted_case_id(case_id: str) -> bool:
+    """Check whether case_id is a real support case (not a draft or a dedup marker)"""
+    return not case_id.startswith((DRAFT_ID_PREFIX, EVENT_DEDUP_ID_PREFIX))
+
+
+def _is_open_case(case_data: Dict[str, Any]) -> bool:
+    return case_data.get('status', 'open') != 'resolved'
+
+
+def _is_dissolve_pending(case_data: Dict[str, Any]) -> bool:
+    return (case_data.get('status') == 'resolved' and bool(case_data.get('case_chat_id'))
+            and not case_data.get('chat_dissolved', False))
+
+
+def _update_status_index(index_key: str, case_id: str, is_member: bool):
+    """Add case_id to / remove it from a status index
+    
+    The index is shared by every Lambda (and the poller's worker threads), so the
+    write is conditional on the ETag that was read and retried on a conflict;
+    a plain read-modify-write would drop concurrent updates.
+    
+    Skipped until the index exists: the first query of the index builds it
+    from a full scan. An update that is skipped or given up on is only logged
+    (the case object itself is already written); the periodic rebuild of the
+    index picks the case up.
+    """
+    for attempt in range(STATUS_INDEX_MAX_ATTEMPTS):
+        index_data, etag = _get_object_with_etag(index_key)
+        if index_data is None:
+            return
+        
+        case_ids = index_data.setdefault('case_ids', [])
+        if is_member and case_id not in case_ids:
+            case_ids.append(case_id)
+        elif not is_member and case_id in case_ids:
+            case_ids.remove(case_id)
+        else:
+            return
+        
+        if _put_object_conditional(index_key, index_data, etag):
+            return
+        time.sleep(0.05 * (attempt + 1))
+    
+    print(f"[S3] Gave up updating {index_key} for {case_id} after "
+          f"{STATUS_INDEX_MAX_ATTEMPTS} conflicting writes (the next rebuild repairs it)")
+
+
 # ============================================================================
 # Query Functions
 # ============================================================================
@@ -266,19 +564,17 @@ def _remove_from_user_index(user_id: str, case_id: str):
 def get_all_cases() -> List[Dict[str, Any]]:
     """Get all cases from S3
     
+    Legacy event dedup markers under cases/ are skipped by key, without a GET.
+    
     Returns:
         List of case dictionaries
     """
-    keys = _list_objects(CASES_PREFIX)
-    cases = []
-    
-    for key in keys:
-        if key.endswith('.json'):
-            case_data = _get_object(key)
-            if case_data:
-                cases.append(case_data)
-    
-    return cases
+    dedup_prefix = f"{CASES_PREFIX}{EVENT_DEDUP_ID_PREFIX}"
+    keys = [
+        key for key in _list_objects(CASES_PREFIX)
+        if key.endswith('.json') and not key.startswith(dedup_prefix)
+    ]
+    return [case_data for case_data in _get_objects(keys) if case_data]
 
 
 def get_case_by_chat_id(chat_id: str) -> Optional[Dict[str, Any]]:
@@ -301,49 +597,78 @@ def get_cases_by_chat_id(chat_id: str) -> List[Dict[str, Any]]:
     if not index_data:
         return []
     
-    cases = []
-    for case_id in index_data.get('case_ids', []):
-        case_data = get_case(case_id)
-        if case_data:
-            cases.append(case_data)
-    return cases
+    keys = [f"{CASES_PREFIX}{case_id}.json" for case_id in index_data.get('case_ids', [])]
+    return [case_data for case_data in _get_objects(keys) if case_data]
 
 
-def get_cases_by_user(user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
-    """Get user's recent cases (sorted by created_at descending)"""
+def get_cases_by_user(user_id: str, limit: int = 10, exclude_drafts: bool = False) -> List[Dict[str, Any]]:
+    """Get user's recent cases (sorted by created_at descending)
+    
+    With exclude_drafts, draft entries are skipped by their case_id prefix before
+    any case object is fetched, and up to `limit` submitted cases are returned.
+    """
     key = f"{USER_INDEX_PREFIX}{user_id}.json"
     index_data = _get_object(key)
     
     if not index_data:
         return []
     
-    cases = []
-    for case_ref in index_data.get('cases', [])[:limit]:
-        case_data = get_case(case_ref['case_id'])
-        if case_data:
-            cases.append(case_data)
-    return cases
+    case_refs = index_data.get('cases', [])
+    if exclude_drafts:
+        case_refs = [ref for ref in case_refs if not ref['case_id'].startswith(DRAFT_ID_PREFIX)]
+    
+    keys = [f"{CASES_PREFIX}{case_ref['case_id']}.json" for case_ref in case_refs[:limit]]
+    return [case_data for case_data in _get_objects(keys) if case_data]
 
 
 def scan_cases_by_filter(filter_func) -> List[Dict[str, Any]]:
     """Scan all cases and filter (expensive, use sparingly)"""
-    keys = _list_objects(CASES_PREFIX)
-    results = []
+    return [case_data for case_data in get_all_cases() if filter_func(case_data)]
+
+
+def _get_status_indexed_cases(index_key: str, predicate, rebuild: bool = False,
+                              max_age: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Get the cases listed in a status index (one GET plus one GET per case)
+    
+    If the index does not exist yet, rebuild is set, or it was built more than
+    max_age seconds ago, it is (re)built from a full scan of cases/.
+    """
+    index_data, etag = _get_object_with_etag(index_key)
     
-    for key in keys:
-        if key.endswith('.json'):
-            case_data = _get_object(key)
-            if case_data and filter_func(case_data):
-                results.append(case_data)
+    if index_data is not None and max_age is not None:
+        rebuild = rebuild or time.time() - index_data.get('built_at_ts', 0) >= max_age
     
-    return results
+    if index_data is None or rebuild:
+        cases = scan_cases_by_filter(
+            lambda c: predicate(c) and _is_submitted_case_id(c.get('case_id', ''))
+        )
+        # Conditional on the copy read before the scan: if another writer changed the
+        # index meanwhile, keep its copy (which may already hold later updates)
+        _put_object_conditional(index_key, {
+            'case_ids': [c['case_id'] for c in cases],
+            'built_at_ts': int(time.time())
+        }, etag)
+        return cases
+    
+    keys = [f"{CASES_PREFIX}{case_id}.json" for case_id in index_data.get('case_ids', [])]
+    return [case_data for case_data in _get_objects(keys) if case_data and predicate(case_data)]
 
 
 def get_open_cases() -> List[Dict[str, Any]]:
-    """Get all cases that are not resolved"""
-    return scan_cases_by_filter(
-        lambda c: c.get('status', 'open') != 'resolved'
-    )
+    """Get all submitted cases that are not resolved (from the open cases index)
+    
+    The index is rebuilt from a full scan once it is older than OPEN_INDEX_MAX_AGE.
+    """
+    return _get_status_indexed_cases(OPEN_CASES_INDEX_KEY, _is_open_case, max_age=OPEN_INDEX_MAX_AGE)
+
+
+def get_dissolve_pending_cases(rebuild: bool = False) -> List[Dict[str, Any]]:
+    """Get resolved cases whose case chat has not been dissolved yet (from the index)
+    
+    With rebuild, the index is recomputed from a full scan of cases/ (a backstop
+    for entries a failed index write left out).
+    """
+    return _get_status_indexed_cases(DISSOLVE_PENDING_INDEX_KEY, _is_dissolve_pending, rebuild)
 
 
 def get_case_by_case_chat_id(case_chat_id: str) -> Optional[Dict[str, Any]]:
@@ -359,3 +684,52 @@ def get_case_by_case_chat_id(case_chat_id: str) -> Optional[Dict[str, Any]]:
         case_id = index_data['case_ids'][-1]
         return get_case(case_id)
     return None
+
+
+def get_case_by_display_id(display_id: str) -> Optional[Dict[str, Any]]:
+    """Get case by display_id using dedicated index (O(1) lookup)
+    
+    Cases saved before the display_id index existed are not indexed;
+    callers should fall back to scan_cases_by_filter on a miss.
+    """
+    key = f"{DISPLAY_ID_INDEX_PREFIX}{display_id}.json"
+    index_data = _get_object(key)
+    
+    if index_data and index_data.get('case_id'):
+        return get_case(index_data['case_id'])
+    return None
+
+
+# ============================================================================
+# Event Deduplication
+# ============================================================================
+
+def mark_event_processed(event_id: str) -> bool:
+    """Record an event as processed with a conditional create (If-None-Match: *)
+    
+    One round-trip: S3 rejects the write if the marker already exists, so there
+    is no separate existence check. Markers expire via the event_dedup/ lifecycle rule.
+    
+    Returns:
+        True if this call recorded the event, False if it was already recorded
+    """
+    key = f"{EVENT_DEDUP_PREFIX}{event_id}.json"
+    t0 = time.time() if ENABLE_S3_TIMING else None
+    try:
+        s3_client.put_object(
+            Bucket=DATA_BUCKET,
+            Key=key,
+            Body=_dumps({'event_id': event_id, 'created_at_ts': int(time.time())}),
+            ContentType='application/json',
+            IfNoneMatch='*'
+        )
+    except ClientError as e:
+        # 412: marker exists; 409: a concurrent request is creating it
+        if e.response['Error']['Code'] in ('PreconditionFailed', 'ConditionalRequestConflict'):
+            if ENABLE_S3_TIMING:
+                print(f"[S3] PUT {key}: EXISTS ({(time.time()-t0)*1000:.0f}ms)")
+            return False
+        raise
+    if ENABLE_S3_TIMING:
+        print(f"[S3] PUT {key}: {(time.time()-t0)*1000:.0f}ms")
+    return True
@@ -15,13 +15,18 @@ Resources Created:
     - config/{cfg_key}.json: Bot configuration
     - cases/{case_id}.json: Case data
     - indexes/chat_id/{chat_id}.json: Chat ID to case ID mapping
+    - indexes/case_chat_id/{case_chat_id}.json: Case group chat ID to case ID mapping
     - indexes/user_id/{user_id}.json: User ID to case IDs mapping
+    - indexes/display_id/{display_id}.json: Display ID to case ID mapping
+    - indexes/status/open.json: Case IDs of open (not resolved) cases
+    - event_dedup/{event_id}.json: Processed Lark event markers (expire after 1 day)
 - Lambda Functions:
   - MsgEventLambda: Handles Lark message events (create case, reply, etc.)
   - CaseUpdateLambda: Handles AWS Support case update events from EventBridge
   - CasePollerLambda: Periodically polls case status for updates
-- API Gateway: REST API endpoint for Lark webhook
+- API Gateway: REST API endpoint for Lark webhook (or an HTTP API with -c webhookHttpApi=true)
 - EventBridge: Rules for AWS Support case events and scheduled polling
+- SQS: CaseUpdateQueue batches AWS Support case events for CaseUpdateLambda
 - IAM Roles: Lambda execution roles with cross-account assume role permissions
 
 Parameters:
@@ -32,15 +37,23 @@ Parameters:
 from aws_cdk import (
     Stack,
     Duration,
+    Size,
     RemovalPolicy,
     CfnParameter,
+    CfnCondition,
+    Fn,
+    Token,
     aws_lambda as lambda_,
     aws_apigateway as apigw,
+    aws_apigatewayv2 as apigwv2,
+    aws_apigatewayv2_integrations as apigwv2_integrations,
     aws_iam as iam,
     aws_secretsmanager as secretsmanager,
     aws_s3 as s3,
     aws_events as events,
     aws_events_targets as targets,
+    aws_lambda_event_sources as lambda_event_sources,
+    aws_sqs as sqs,
     aws_logs as logs,
     CfnOutput,
 )
@@ -87,8 +100,25 @@ class LarkCaseBotStack(Stack):
         allowed_account_ids = CfnParameter(self, "AllowedAccountIds",
             type="String",
             default="",
-            description="Comma-separated list of AWS account IDs allowed for cross-account Support API access (e.g., '123456789012,987654321098'). Leave empty to allow all accounts (not recommended for production)."
-        )
+            description="Comma-separated list of AWS account IDs allowed for cross-account Support API access (e.g., '123456789012,987654321098', no spaces). Leave empty to allow all accounts (not recommended for production)."
+        )
+        has_allowed_account_ids = CfnCondition(self, "HasAllowedAccountIds",
+            expression=Fn.condition_not(Fn.condition_equals(allowed_account_ids.value_as_string, ""))
+        )
+        # Support API role ARNs the Lambdas may assume: one concrete ARN per allowed account,
+        # or every account when AllowedAccountIds is empty. CloudFormation has no list map, so
+        # "a,b" is expanded by joining with the ARN suffix/prefix and splitting again.
+        support_role_name = "LarkCaseBot-SupportApiRole"
+        support_role_arns = Token.as_list(Fn.condition_if(
+            has_allowed_account_ids.logical_id,
+            Fn.split(",", Fn.join("", [
+                "arn:aws:iam::",
+                Fn.join(f":role/{support_role_name},arn:aws:iam::",
+                        Fn.split(",", allowed_account_ids.value_as_string)),
+                f":role/{support_role_name}",
+            ])),
+            [f"arn:aws:iam::*:role/{support_role_name}"]
+        ))
 
         # Secrets Manager for Lark App ID
         app_id_secret = secretsmanager.Secret(self, "AppIDSecret",
@@ -135,16 +165,39 @@ class LarkCaseBotStack(Stack):
         #   config/{cfg_key}.json - Bot configuration
         #   cases/{case_id}.json - Case data
         #   indexes/chat_id/{chat_id}.json - Chat ID index
+        #   indexes/case_chat_id/{case_chat_id}.json - Case group chat index
         #   indexes/user_id/{user_id}.json - User ID index
+        #   indexes/display_id/{display_id}.json - Display ID index
+        #   indexes/status/open.json - Open cases index (read by the poller)
+        #   indexes/status/dissolve_pending.json - Resolved cases with an undissolved group
+        #   event_dedup/{event_id}.json - Processed Lark event markers
+        # Keys are not hash-sharded: S3 scales per prefix to thousands of requests/s,
+        # far above this bot's rate, and sharding would break existing object keys.
+        # Indexes live here too rather than in an S3 Express One Zone directory bucket: the
+        # webhook's case-chat lookups are served from the Lambdas' in-memory cache, and the
+        # indexes have no other copy, so they keep multi-AZ durability.
         data_bucket = s3.Bucket(self, "DataBucket",
             removal_policy=RemovalPolicy.RETAIN,
             versioned=True,
             encryption=s3.BucketEncryption.S3_MANAGED,
             block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
             lifecycle_rules=[
-                # Auto-delete old versions after 30 days
+                # Auto-delete old versions after 30 days, and the delete markers they leave
+                s3.LifecycleRule(
+                    noncurrent_version_expiration=Duration.days(30),
+                    expired_object_delete_marker=True
+                ),
+                # Indexes are rewritten as cases change and are derived from cases/,
+                # so their old versions are not kept for long
                 s3.LifecycleRule(
-                    noncurrent_version_expiration=Duration.days(30)
+                    prefix="indexes/",
+                    noncurrent_version_expiration=Duration.days(1)
+                ),
+                # Expire event dedup markers (Lark retries well within a day)
+                s3.LifecycleRule(
+                    prefix="event_dedup/",
+                    expiration=Duration.days(1),
+                    noncurrent_version_expiration=Duration.days(1)
                 )
             ]
         )
@@ -154,6 +207,14 @@ class LarkCaseBotStack(Stack):
             event_bus_name=f"{construct_id}-case-event-bus"
         )
 
+        # Handlers read the Lark secrets with one BatchGetSecretValue call; that action
+        # only supports resource "*" (GetSecretValue on each secret is still required)
+        _batch_get_secrets_statement = iam.PolicyStatement(
+            effect=iam.Effect.ALLOW,
+            actions=["secretsmanager:BatchGetSecretValue"],
+            resources=["*"]
+        )
+
         # IAM role for message event Lambda
         msg_event_role = iam.Role(self, "MsgEventRole",
             assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
@@ -168,6 +229,7 @@ class LarkCaseBotStack(Stack):
         # Grant permissions
         app_id_secret.grant_read(msg_event_role)
         app_secret_secret.grant_read(msg_event_role)
+        msg_event_role.add_to_policy(_batch_get_secrets_statement)
         encrypt_key_secret.grant_read(msg_event_role)
         verification_token_secret.grant_read(msg_event_role)
         data_bucket.grant_read_write(msg_event_role)
@@ -175,11 +237,12 @@ class LarkCaseBotStack(Stack):
         # Allow Lambda to assume roles for Support API
         # Note: For tighter security, specify AllowedAccountIds parameter during deployment
         # e.g., cdk deploy --parameters AllowedAccountIds="123456789012,210987654321"
+        # (the AssumeRole statements below are then limited to those accounts' roles)
         msg_event_role.add_to_policy(iam.PolicyStatement(
             sid="AllowToAssumeToRoleWithSupportAPIAccess",
             effect=iam.Effect.ALLOW,
             actions=["sts:AssumeRole"],
-            resources=["arn:aws:iam::*:role/LarkCaseBot-SupportApiRole"]
+            resources=support_role_arns
         ))
 
         # Cost Explorer access removed - using static service list instead
@@ -193,15 +256,42 @@ class LarkCaseBotStack(Stack):
             resources=[f"arn:aws:lambda:{self.region}:{self.account}:function:*MsgEventLambda*"]
         ))
 
+        # Webhook capacity is opt-in via CDK context (provisioned concurrency costs money,
+        # reserved concurrency takes from the account's unreserved pool), e.g.:
+        #   cdk deploy -c msgEventProvisionedConcurrency=2 -c msgEventReservedConcurrency=20
+        msg_event_provisioned = int(self.node.try_get_context("msgEventProvisionedConcurrency") or 0)
+        msg_event_reserved = int(self.node.try_get_context("msgEventReservedConcurrency") or 0)
+        # SnapStart restores published versions from a snapshot taken after module init
+        # (imports, boto3 clients), e.g.: cdk deploy -c msgEventSnapStart=true
+        msg_event_snap_start = str(self.node.try_get_context("msgEventSnapStart")).lower() == "true"
+        if msg_event_snap_start and msg_event_provisioned:
+            raise ValueError("msgEventSnapStart cannot be combined with msgEventProvisionedConcurrency")
+
+        # One code asset shared by all four functions: the handlers import each other's helper
+        # modules (s3_storage, i18n), the whole tree is ~250KB, and a layer would only add a
+        # second archive to fetch on cold start. Local bytecode/test caches are left out.
+        # No Docker bundling step: the only runtime dependencies (boto3, urllib3) ship with the
+        # Lambda Python runtime, so the zip is just these handler modules.
+        lambda_code = lambda_.Code.from_asset("lambda",
+            exclude=["__pycache__", "*.pyc", ".pytest_cache", "tests", "requirements.txt"]
+        )
+
+        # Log group for the message event Lambda, created up front and passed in: log_retention
+        # (the retention-setter custom resource) caused a circular dependency with API Gateway
+        msg_event_log_group = logs.LogGroup(self, "MsgEventLambdaLogs",
+            retention=logs.RetentionDays.ONE_WEEK
+        )
+
         # Message event Lambda function (urllib3 is included in boto3, no layer needed)
-        # Note: log_retention removed to avoid circular dependency with API Gateway
         msg_event_lambda = lambda_.Function(self, "MsgEventLambda",
             runtime=lambda_.Runtime.PYTHON_3_12,
             handler="msg_event_handler.lambda_handler",
-            code=lambda_.Code.from_asset("lambda"),
+            code=lambda_code,
             role=msg_event_role,
             timeout=Duration.seconds(60),  # Increased to 60 seconds
             memory_size=1024,  # Increased to 1024 MB (more memory = faster CPU)
+            reserved_concurrent_executions=msg_event_reserved or None,
+            snap_start=lambda_.SnapStartConf.ON_PUBLISHED_VERSIONS if msg_event_snap_start else None,
             environment={
                 "APP_ID_ARN": app_id_secret.secret_arn,
                 "APP_SECRET_ARN": app_secret_secret.secret_arn,
@@ -211,7 +301,14 @@ class LarkCaseBotStack(Stack):
                 "CFG_KEY": "LarkBotProfile-0",
                 "CASE_LANGUAGE": case_language.value_as_string,
                 "USER_WHITELIST": user_whitelist.value_as_string,
-            }
+            },
+            log_group=msg_event_log_group,
+            tracing=lambda_.Tracing.DISABLED
+        )
+
+        # Webhook traffic goes through the "live" alias so warm capacity (or SnapStart) applies to it
+        msg_event_alias = msg_event_lambda.add_alias("live",
+            provisioned_concurrent_executions=msg_event_provisioned or None
         )
 
         # Case update Lambda function (triggered by EventBridge)
@@ -224,6 +321,7 @@ class LarkCaseBotStack(Stack):
 
         app_id_secret.grant_read(case_update_role)
         app_secret_secret.grant_read(case_update_role)
+        case_update_role.add_to_policy(_batch_get_secrets_statement)
         data_bucket.grant_read_write(case_update_role)
         
         # Allow assuming roles to fetch communication content
@@ -231,16 +329,16 @@ class LarkCaseBotStack(Stack):
             sid="AllowAssumeRoleForCommunication",
             effect=iam.Effect.ALLOW,
             actions=["sts:AssumeRole"],
-            resources=["arn:aws:iam::*:role/LarkCaseBot-SupportApiRole"]
+            resources=support_role_arns
         ))
 
         case_update_lambda = lambda_.Function(self, "CaseUpdateLambda",
             runtime=lambda_.Runtime.PYTHON_3_12,
             handler="case_update_handler.lambda_handler",
-            code=lambda_.Code.from_asset("lambda"),
+            code=lambda_code,
             role=case_update_role,
-            timeout=Duration.seconds(30),
-            memory_size=256,
+            timeout=Duration.seconds(60),  # Up to 10 queued events per invocation
+            memory_size=1024,  # CPU scales with memory; shortens cold start and JSON work
             environment={
                 "APP_ID_ARN": app_id_secret.secret_arn,
                 "APP_SECRET_ARN": app_secret_secret.secret_arn,
@@ -259,7 +357,17 @@ class LarkCaseBotStack(Stack):
             ),
             description="Capture AWS Support case updates and push to Lark"
         )
-        case_update_rule.add_target(targets.LambdaFunction(case_update_lambda))
+        # Case updates are queued and consumed in batches, so an incident that updates many
+        # cases at once is handled by a few invocations instead of one per event
+        case_update_queue = sqs.Queue(self, "CaseUpdateQueue",
+            visibility_timeout=Duration.seconds(360),  # 6x the CaseUpdateLambda timeout
+            retention_period=Duration.days(1)
+        )
+        case_update_rule.add_target(targets.SqsQueue(case_update_queue))
+        case_update_lambda.add_event_source(lambda_event_sources.SqsEventSource(case_update_queue,
+            batch_size=10,
+            max_batching_window=Duration.seconds(5)
+        ))
 
         # Case Poller Lambda - Periodically checks case status across all accounts
         case_poller_role = iam.Role(self, "CasePollerRole",
@@ -271,6 +379,7 @@ class LarkCaseBotStack(Stack):
 
         app_id_secret.grant_read(case_poller_role)
         app_secret_secret.grant_read(case_poller_role)
+        case_poller_role.add_to_policy(_batch_get_secrets_statement)
         data_bucket.grant_read_write(case_poller_role)
 
         # Allow assuming roles in other accounts
@@ -278,21 +387,22 @@ class LarkCaseBotStack(Stack):
             sid="AllowAssumeRoleForCasePolling",
             effect=iam.Effect.ALLOW,
             actions=["sts:AssumeRole"],
-            resources=["arn:aws:iam::*:role/LarkCaseBot-SupportApiRole"]
+            resources=support_role_arns
         ))
 
         case_poller_lambda = lambda_.Function(self, "CasePollerLambda",
             runtime=lambda_.Runtime.PYTHON_3_12,
             handler="case_poller.lambda_handler",
-            code=lambda_.Code.from_asset("lambda"),
+            code=lambda_code,
             role=case_poller_role,
-            timeout=Duration.seconds(300),
+            timeout=Duration.seconds(120),  # Cases are checked concurrently (POLL_CONCURRENCY)
             memory_size=512,
             environment={
                 "APP_ID_ARN": app_id_secret.secret_arn,
                 "APP_SECRET_ARN": app_secret_secret.secret_arn,
                 "DATA_BUCKET": data_bucket.bucket_name,
                 "AUTO_DISSOLVE_HOURS": str(auto_dissolve_hours.value_as_number),
+                "POLL_CONCURRENCY": "8",
             },
             log_retention=logs.RetentionDays.ONE_WEEK
         )
@@ -314,15 +424,16 @@ class LarkCaseBotStack(Stack):
 
         app_id_secret.grant_read(group_cleanup_role)
         app_secret_secret.grant_read(group_cleanup_role)
+        group_cleanup_role.add_to_policy(_batch_get_secrets_statement)
         data_bucket.grant_read_write(group_cleanup_role)
 
         group_cleanup_lambda = lambda_.Function(self, "GroupCleanupLambda",
             runtime=lambda_.Runtime.PYTHON_3_12,
             handler="group_cleanup.lambda_handler",
-            code=lambda_.Code.from_asset("lambda"),
+            code=lambda_code,
             role=group_cleanup_role,
             timeout=Duration.minutes(5),
-            memory_size=256,
+            memory_size=1024,
             environment={
                 "APP_ID_ARN": app_id_secret.secret_arn,
                 "APP_SECRET_ARN": app_secret_secret.secret_arn,
@@ -340,31 +451,57 @@ class LarkCaseBotStack(Stack):
         group_cleanup_rule.add_target(targets.LambdaFunction(group_cleanup_lambda))
 
         # API Gateway
-        api = apigw.RestApi(self, "LarkCaseBotApi",
-            rest_api_name="Lark Case Bot API",
-            description="API Gateway for Lark bot webhook",
-            deploy_options=apigw.StageOptions(
-                stage_name="prod",
-                throttling_rate_limit=100,
-                throttling_burst_limit=200,
-                # Disable logging to avoid CloudWatch Logs role requirement
-                logging_level=apigw.MethodLoggingLevel.OFF,
-                data_trace_enabled=False
+        # An HTTP API (v2) has less per-request overhead than the REST API but gets a new
+        # webhook URL, so existing deployments opt in explicitly and re-point Lark to it:
+        #   cdk deploy -c webhookHttpApi=true
+        if str(self.node.try_get_context("webhookHttpApi")).lower() == "true":
+            http_api = apigwv2.HttpApi(self, "LarkCaseBotHttpApi",
+                api_name="Lark Case Bot API",
+                description="HTTP API for Lark bot webhook",
+                create_default_stage=False
+            )
+            api_stage = http_api.add_stage("DefaultStage",
+                stage_name="$default",
+                auto_deploy=True,
+                throttle=apigwv2.ThrottleSettings(rate_limit=100, burst_limit=200)
+            )
+            http_api.add_routes(
+                path="/messages",
+                methods=[apigwv2.HttpMethod.POST],
+                integration=apigwv2_integrations.HttpLambdaIntegration("MsgEventIntegration", msg_event_alias)
+            )
+            api_url = api_stage.url
+        else:
+            api = apigw.RestApi(self, "LarkCaseBotApi",
+                rest_api_name="Lark Case Bot API",
+                description="API Gateway for Lark bot webhook",
+                # Gzip larger responses (card updates) for clients that accept it; the small
+                # acks and challenge replies stay uncompressed. No response caching: every
+                # webhook event is unique.
+                min_compression_size=Size.kibibytes(1),
+                deploy_options=apigw.StageOptions(
+                    stage_name="prod",
+                    throttling_rate_limit=100,
+                    throttling_burst_limit=200,
+                    # Disable logging to avoid CloudWatch Logs role requirement
+                    logging_level=apigw.MethodLoggingLevel.OFF,
+                    data_trace_enabled=False
+                )
             )
-        )
 
-        # Add /messages endpoint
-        messages = api.root.add_resource("messages")
-        messages.add_method("POST", apigw.LambdaIntegration(msg_event_lambda))
+            # Add /messages endpoint
+            messages = api.root.add_resource("messages")
+            messages.add_method("POST", apigw.LambdaIntegration(msg_event_alias))
+            api_url = api.url
 
         # Outputs
         CfnOutput(self, "WebhookUrl",
-            value=f"{api.url}messages",
+            value=f"{api_url}messages",
             description="Lark webhook URL (use this in Lark Open Platform)"
         )
 
         CfnOutput(self, "msgEventapiEndpoint",
-            value=api.url,
+            value=api_url,
             description="API Gateway endpoint (add /messages for webhook URL)"
         )
 
@@ -12,19 +12,39 @@ Usage:
   python setup_lark_bot.py setup --skip-iam   # Skip IAM role creation
   python setup_lark_bot.py cleanup            # Remove all resources
   python setup_lark_bot.py verify             # Verify configuration
+  python setup_lark_bot.py verify --full      # Run every check even after a failure
 """
 import argparse
-import boto3
+import hashlib
 import json
 import sys
 import os
-from typing import Dict, Any, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Any, FrozenSet, List, Optional, Tuple
 
 from i18n import t, set_lang
 
 CONFIG_FILE = 'accounts.json'
 ROLE_NAME = 'LarkCaseBot-SupportApiRole'
+SUPPORT_POLICY_ARN = 'arn:aws:iam::aws:policy/AWSSupportAccess'
 REGION = 'us-east-1'
+MAX_ACCOUNT_WORKERS = 16  # Accounts set up / cleaned up in parallel
+
+# EventBridge forwarding from member accounts (identical for every account)
+FORWARD_EVENT_PATTERN_JSON = json.dumps({
+    "source": ["aws.support"],
+    "detail-type": ["Support Case Update"]
+})
+EVENTBRIDGE_TRUST_POLICY_JSON = json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [{
+        "Effect": "Allow",
+        "Principal": {"Service": "events.amazonaws.com"},
+        "Action": "sts:AssumeRole"
+    }]
+})
 
 
 def load_config() -> Dict[str, Any]:
@@ -38,9 +58,10 @@ def load_config() -> Dict[str, Any]:
         return json.load(f)
 
 
+@lru_cache(maxsize=1)
 def get_stack_outputs() -> Dict[str, str]:
-    """Get CloudFormation Stack outputs"""
-    cfn = boto3.client('cloudformation', region_name=REGION)
+    """Get CloudFormation Stack outputs (fetched once per run)"""
+    cfn = get_default_client('cloudformation')
     try:
         response = cfn.describe_stacks(StackName='LarkCaseBotStack')
         return {o['OutputKey']: o['OutputValue'] for o in response['Stacks'][0]['Outputs']}
@@ -49,6 +70,86 @@ def get_stack_outputs() -> Dict[str, str]:
         sys.exit(1)
 
 
+# boto3/botocore are imported inside the functions that need them: importing them takes
+# a noticeable fraction of a second, which --help and early config errors don't need.
+#
+# boto3 Sessions are built once per profile (building one re-reads the config files and
+# resolves credentials). A Session is not thread-safe, so clients are created under a lock
+# and cached too; the clients themselves are safe to share across account workers.
+_client_lock = threading.Lock()
+
+
+# Same cache directory as the AWS CLI: profiles that assume a role (role_arn + source_profile)
+# reuse temporary credentials across runs and with the CLI instead of calling AssumeRole
+# (and prompting for MFA) every time.
+ASSUME_ROLE_CACHE_DIR = os.path.expanduser(os.path.join('~', '.aws', 'cli', 'cache'))
+
+
+@lru_cache(maxsize=None)
+def _get_session(profile: str) -> 'boto3.Session':
+    import boto3
+    import botocore.session
+    from botocore.credentials import JSONFileCache
+    
+    botocore_session = botocore.session.Session(profile=profile)
+    provider = botocore_session.get_component('credential_provider').get_provider('assume-role')
+    provider.cache = JSONFileCache(ASSUME_ROLE_CACHE_DIR)
+    return boto3.Session(botocore_session=botocore_session, region_name=REGION)
+
+
+# Account workers call IAM/EventBridge in parallel and IAM's request rate limit is low:
+# adaptive retries back off on throttling client-side, and the connection pool is sized
+# for the worker count so calls on a shared client don't wait for a connection.
+CLIENT_CONFIG = {
+    'retries': {'mode': 'adaptive', 'max_attempts': 10},
+    'max_pool_connections': 32,
+}
+
+
+@lru_cache(maxsize=None)
+def _get_client(profile: Optional[str], service: str):
+    import boto3
+    from botocore.config import Config
+    
+    config = Config(**CLIENT_CONFIG)
+    if profile is None:
+        return boto3.client(service, region_name=REGION, config=config)
+    return _get_session(profile).client(service, config=config)
+
+
+def get_account_client(profile: str, service: str):
+    """Get a (cached) boto3 client for service using the account's profile"""
+    with _client_lock:
+        return _get_client(profile, service)
+
+
+def get_default_client(service: str):
+    """Get a (cached) boto3 client for service using the default credentials"""
+    with _client_lock:
+        return _get_client(None, service)
+
+
+@lru_cache(maxsize=1)
+def get_main_account_id() -> str:
+    """Account ID of the default credentials (the account the stack is deployed in)"""
+    from botocore.exceptions import BotoCoreError, ClientError
+    
+    try:
+        return get_default_client('sts').get_caller_identity()['Account']
+    except (BotoCoreError, ClientError) as e:
+        print(f"❌ Cannot identify the main account from the default AWS credentials: {e}")
+        print(f"   Check that the default profile (or AWS_PROFILE) has valid credentials.")
+        sys.exit(1)
+
+
+def attached_policy_arns(iam) -> FrozenSet[str]:
+    """ARNs of all managed policies attached to the Support API role (all pages)"""
+    paginator = iam.get_paginator('list_attached_role_policies')
+    return frozenset(policy['PolicyArn']
+                     for page in paginator.paginate(RoleName=ROLE_NAME)
+                     for policy in page['AttachedPolicies'])
+
+
 def print_header(title: str):
     """Print section header"""
     print(f"\n{'='*60}")
@@ -56,6 +157,22 @@ def print_header(title: str):
     print(f"{'='*60}\n")
 
 
+def for_each_account(func: Callable[..., List[str]], accounts: List[Dict], *args):
+    """Run func(account, *args) for all accounts in parallel
+    
+    Each call returns its output lines instead of printing them, so the lines are
+    written per account in config order (in one stdout write) rather than interleaved
+    across threads. Calls share the cached per-profile sessions and clients: those are
+    only created under _client_lock, and the clients are safe to use from any thread.
+    """
+    if not accounts:
+        return
+    with ThreadPoolExecutor(max_workers=min(MAX_ACCOUNT_WORKERS, len(accounts))) as executor:
+        results = list(executor.map(lambda account: func(account, *args), accounts))
+    sys.stdout.write(''.join(line + '\n' for lines in results for line in lines))
+    sys.stdout.flush()
+
+
 # ============================================================================
 # Setup Command
 # ============================================================================
@@ -89,8 +206,7 @@ def cmd_setup(args):
         lambda_role_arns = [r for r in lambda_role_arns if r]
         print(f"   Lambda Role ARNs: {len(lambda_role_arns)}")
         
-        for acc in config['accounts']:
-            create_iam_role(acc, lambda_role_arns)
+        for_each_account(create_iam_role, config['accounts'], lambda_role_arns)
     else:
         print("\n⏭️  Step 2: Skipping IAM role creation (--skip-iam)")
     
@@ -115,38 +231,41 @@ def cmd_setup(args):
 
 def update_secrets(config: Dict, outputs: Dict):
     """Update Lark credentials in Secrets Manager"""
-    sm = boto3.client('secretsmanager', region_name=REGION)
+    sm = get_default_client('secretsmanager')
     
     app_id = config['lark']['app_id']
     app_secret = config['lark']['app_secret']
     
-    sm.update_secret(SecretId=outputs['AppIDSecretArn'], 
-                     SecretString=json.dumps({"app_id": app_id}))
-    print(f"   ✅ App ID updated")
-    
-    sm.update_secret(SecretId=outputs['AppSecretSecretArn'], 
-                     SecretString=json.dumps({"app_secret": app_secret}))
-    print(f"   ✅ App Secret updated")
-
-
-def create_iam_role(account: Dict, lambda_role_arns: List[str]):
-    """Create IAM role in target account using its profile"""
+    # The two secrets are independent, so update them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        app_id_future = executor.submit(sm.update_secret, SecretId=outputs['AppIDSecretArn'],
+                                        SecretString=json.dumps({"app_id": app_id}))
+        app_secret_future = executor.submit(sm.update_secret, SecretId=outputs['AppSecretSecretArn'],
+                                            SecretString=json.dumps({"app_secret": app_secret}))
+        app_id_future.result()
+        print(f"   ✅ App ID updated")
+        app_secret_future.result()
+        print(f"   ✅ App Secret updated")
+
+
+def create_iam_role(account: Dict, lambda_role_arns: List[str]) -> List[str]:
+    """Create IAM role in target account using its profile (returns output lines)"""
+    out = []
     account_id = account['account_id']
     account_name = account['account_name']
     profile = account.get('profile', 'default')
     
-    print(f"\n   🔧 Account: {account_name} ({account_id})")
-    print(f"      Profile: {profile}")
+    out.append(f"\n   🔧 Account: {account_name} ({account_id})")
+    out.append(f"      Profile: {profile}")
     
     try:
-        session = boto3.Session(profile_name=profile, region_name=REGION)
-        iam = session.client('iam')
+        iam = get_account_client(profile, 'iam')
         
         # Verify we're in the right account
-        sts = session.client('sts')
+        sts = get_account_client(profile, 'sts')
         actual_account = sts.get_caller_identity()['Account']
         if actual_account != account_id:
-            print(f"      ⚠️  Warning: Profile '{profile}' is for account {actual_account}, not {account_id}")
+            out.append(f"      ⚠️  Warning: Profile '{profile}' is for account {actual_account}, not {account_id}")
         
         # Build trust policy with all Lambda roles
         principal = lambda_role_arns if len(lambda_role_arns) > 1 else lambda_role_arns[0]
@@ -164,7 +283,8 @@ def create_iam_role(account: Dict, lambda_role_arns: List[str]):
             # Role exists, update trust policy
             iam.update_assume_role_policy(RoleName=ROLE_NAME, 
                                           PolicyDocument=json.dumps(trust_policy))
-            print(f"      ✅ Role exists, trust policy updated")
+            out.append(f"      ✅ Role exists, trust policy updated")
+            attached = attached_policy_arns(iam)
         except iam.exceptions.NoSuchEntityException:
             # Create new role
             iam.create_role(
@@ -172,107 +292,100 @@ def create_iam_role(account: Dict, lambda_role_arns: List[str]):
                 AssumeRolePolicyDocument=json.dumps(trust_policy),
                 Description=f"Lark bot Support API access - {account_name}"
             )
-            print(f"      ✅ Role created: {ROLE_NAME}")
+            out.append(f"      ✅ Role created: {ROLE_NAME}")
+            attached = set()
         
-        # Ensure policy is attached
-        try:
-            iam.attach_role_policy(RoleName=ROLE_NAME, 
-                                   PolicyArn='arn:aws:iam::aws:policy/AWSSupportAccess')
-        except Exception:
-            pass  # Already attached
-        print(f"      ✅ AWSSupportAccess policy attached")
+        # Ensure policy is attached (skipped on re-runs where it already is)
+        if SUPPORT_POLICY_ARN not in attached:
+            iam.attach_role_policy(RoleName=ROLE_NAME, PolicyArn=SUPPORT_POLICY_ARN)
+        out.append(f"      ✅ AWSSupportAccess policy attached")
         
     except Exception as e:
-        print(f"      ❌ Failed: {e}")
-        print(f"      ℹ️  Please manually create role {ROLE_NAME} in account {account_id}")
+        out.append(f"      ❌ Failed: {e}")
+        out.append(f"      ℹ️  Please manually create role {ROLE_NAME} in account {account_id}")
+    
+    return out
 
 
-def setup_cross_account_eventbridge(config: Dict, outputs: Dict):
-    """Setup EventBridge rules to forward Support case events from all accounts"""
-    print("\n📝 Step 3: Setting up cross-account EventBridge...")
+def _setup_account_eventbridge(acc: Dict, event_bus_arn: str, role_policy_json: str) -> List[str]:
+    """Forward Support case events from one account to the main account's bus (returns output lines)"""
+    out = []
+    account_id = acc['account_id']
+    account_name = acc['account_name']
+    profile = acc.get('profile', 'default')
     
-    main_account = boto3.client('sts').get_caller_identity()['Account']
-    event_bus_arn = outputs['CaseEventBusArn']
+    out.append(f"\n   🔧 Account: {account_name} ({account_id})")
     
-    for acc in config['accounts']:
-        if acc['account_id'] == main_account:
-            continue
-            
-        account_id = acc['account_id']
-        account_name = acc['account_name']
-        profile = acc.get('profile', 'default')
+    try:
+        events = get_account_client(profile, 'events')
+        iam = get_account_client(profile, 'iam')
         
-        print(f"\n   🔧 Account: {account_name} ({account_id})")
+        # Create EventBridge rule
+        events.put_rule(
+            Name='LarkCaseBot-ForwardSupportEvents',
+            Description='Forward AWS Support case events to main account',
+            EventPattern=FORWARD_EVENT_PATTERN_JSON,
+            State='ENABLED'
+        )
         
+        # Create IAM role for EventBridge
         try:
-            session = boto3.Session(profile_name=profile, region_name=REGION)
-            events = session.client('events')
-            iam = session.client('iam')
-            
-            # Create EventBridge rule
-            events.put_rule(
-                Name='LarkCaseBot-ForwardSupportEvents',
-                Description='Forward AWS Support case events to main account',
-                EventPattern=json.dumps({
-                    "source": ["aws.support"],
-                    "detail-type": ["Support Case Update"]
-                }),
-                State='ENABLED'
-            )
-            
-            # Create IAM role for EventBridge
-            trust_policy = {
-                "Version": "2012-10-17",
-                "Statement": [{
-                    "Effect": "Allow",
-                    "Principal": {"Service": "events.amazonaws.com"},
-                    "Action": "sts:AssumeRole"
-                }]
-            }
-            
-            role_policy = {
-                "Version": "2012-10-17",
-                "Statement": [{
-                    "Effect": "Allow",
-                    "Action": "events:PutEvents",
-                    "Resource": event_bus_arn
-                }]
-            }
-            
-            try:
-                iam.create_role(
-                    RoleName='LarkCaseBot-EventBridgeRole',
-                    AssumeRolePolicyDocument=json.dumps(trust_policy)
-                )
-            except iam.exceptions.EntityAlreadyExistsException:
-                pass
-            
-            iam.put_role_policy(
+            iam.create_role(
                 RoleName='LarkCaseBot-EventBridgeRole',
-                PolicyName='ForwardToMainAccount',
-                PolicyDocument=json.dumps(role_policy)
-            )
-            
-            # Add target
-            events.put_targets(
-                Rule='LarkCaseBot-ForwardSupportEvents',
-                Targets=[{
-                    'Id': '1',
-                    'Arn': event_bus_arn,
-                    'RoleArn': f'arn:aws:iam::{account_id}:role/LarkCaseBot-EventBridgeRole'
-                }]
+                AssumeRolePolicyDocument=EVENTBRIDGE_TRUST_POLICY_JSON
             )
-            
-            print(f"      ✅ EventBridge forwarding configured")
-            
-        except Exception as e:
-            print(f"      ❌ Failed: {e}")
+        except iam.exceptions.EntityAlreadyExistsException:
+            pass
+        
+        iam.put_role_policy(
+            RoleName='LarkCaseBot-EventBridgeRole',
+            PolicyName='ForwardToMainAccount',
+            PolicyDocument=role_policy_json
+        )
+        
+        # Add target
+        events.put_targets(
+            Rule='LarkCaseBot-ForwardSupportEvents',
+            Targets=[{
+                'Id': '1',
+                'Arn': event_bus_arn,
+                'RoleArn': f'arn:aws:iam::{account_id}:role/LarkCaseBot-EventBridgeRole'
+            }]
+        )
+        
+        out.append(f"      ✅ EventBridge forwarding configured")
+        
+    except Exception as e:
+        out.append(f"      ❌ Failed: {e}")
+    
+    return out
+
+
+def setup_cross_account_eventbridge(config: Dict, outputs: Dict):
+    """Setup EventBridge rules to forward Support case events from all accounts"""
+    from botocore.exceptions import BotoCoreError, ClientError
+    
+    print("\n📝 Step 3: Setting up cross-account EventBridge...")
+    
+    main_account = get_main_account_id()
+    event_bus_arn = outputs['CaseEventBusArn']
+    
+    # Same policy for every account, serialized once
+    role_policy_json = json.dumps({
+        "Version": "2012-10-17",
+        "Statement": [{
+            "Effect": "Allow",
+            "Action": "events:PutEvents",
+            "Resource": event_bus_arn
+        }]
+    })
+    
+    other_accounts = [acc for acc in config['accounts'] if acc['account_id'] != main_account]
+    for_each_account(_setup_account_eventbridge, other_accounts, event_bus_arn, role_policy_json)
     
     # Update main account event bus policy
     try:
-        events_main = boto3.client('events', region_name=REGION)
-        other_accounts = [acc['account_id'] for acc in config['accounts'] if acc['account_id'] != main_account]
-        
+        events_main = get_default_client('events')
         if other_accounts:
             events_main.put_permission(
                 EventBusName='LarkCaseBotStack-case-event-bus',
@@ -281,14 +394,15 @@ def setup_cross_account_eventbridge(config: Dict, outputs: Dict):
                 StatementId='AllowCrossAccountPutEvents'
             )
             print(f"\n   ✅ Main account event bus policy updated")
-    except Exception as e:
-        if 'already exists' not in str(e):
-            print(f"   ⚠️  Event bus policy: {e}")
+    except (BotoCoreError, ClientError) as e:
+        print(f"   ⚠️  Event bus policy: {e}")
 
 
 def initialize_s3_config(config: Dict, outputs: Dict):
     """Initialize S3 with account configuration"""
-    s3 = boto3.client('s3', region_name=REGION)
+    from botocore.exceptions import ClientError
+    
+    s3 = get_default_client('s3')
     bucket_name = outputs['DataBucketName']
     
     # Build accounts map
@@ -312,11 +426,26 @@ def initialize_s3_config(config: Dict, outputs: Dict):
         "user_whitelist": user_whitelist
     }
     
+    # Compact JSON: the file is read by the Lambdas on cold start, not by people
+    body = json.dumps(config_data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    body_sha256 = hashlib.sha256(body).hexdigest()
+    config_key = f'config/{cfg_key}.json'
+    
+    # Re-running setup usually produces the same file; skip the PUT when the stored copy matches
+    try:
+        stored = s3.head_object(Bucket=bucket_name, Key=config_key)
+        if stored.get('Metadata', {}).get('sha256') == body_sha256:
+            print(f"   ✅ S3 config unchanged ({len(config['accounts'])} account(s))")
+            return
+    except ClientError:
+        pass  # Not written yet (or not readable) - write it below
+    
     s3.put_object(
         Bucket=bucket_name,
-        Key=f'config/{cfg_key}.json',
-        Body=json.dumps(config_data, indent=2, ensure_ascii=False).encode('utf-8'),
-        ContentType='application/json'
+        Key=config_key,
+        Body=body,
+        ContentType='application/json',
+        Metadata={'sha256': body_sha256}
     )
     print(f"   ✅ S3 config initialized with {len(config['accounts'])} account(s)")
 
@@ -342,63 +471,95 @@ def cmd_cleanup(args):
             return
     
     print("\n🗑️  Deleting resources...")
-    for acc in config['accounts']:
-        delete_account_resources(acc)
+    # Resolved once here and passed down, not per account
+    main_account = get_main_account_id()
+    for_each_account(delete_account_resources, config['accounts'], main_account)
     
     print_header("✅ Cleanup Complete!")
     print("ℹ️  Note: CDK stack not destroyed. Run 'cdk destroy' separately if needed.\n")
 
 
-def delete_account_resources(account: Dict):
-    """Delete all resources from target account"""
+def delete_account_resources(account: Dict, main_account_id: str) -> List[str]:
+    """Delete all resources from target account (returns output lines)"""
+    from botocore.exceptions import ClientError
+    
+    out = []
     account_id = account['account_id']
     account_name = account['account_name']
     profile = account.get('profile', 'default')
-    main_account = boto3.client('sts').get_caller_identity()['Account']
     
-    print(f"\n   🔧 Account: {account_name} ({account_id})")
+    out.append(f"\n   🔧 Account: {account_name} ({account_id})")
     
     try:
-        session = boto3.Session(profile_name=profile, region_name=REGION)
-        iam = session.client('iam')
-        events = session.client('events')
+        iam = get_account_client(profile, 'iam')
+        events = get_account_client(profile, 'events')
         
         # Delete EventBridge resources (only for non-main accounts)
-        if account_id != main_account:
+        if account_id != main_account_id:
             try:
                 events.remove_targets(Rule='LarkCaseBot-ForwardSupportEvents', Ids=['1'])
                 events.delete_rule(Name='LarkCaseBot-ForwardSupportEvents')
-                print(f"      ✅ EventBridge rule deleted")
-            except Exception:
-                pass
+                out.append(f"      ✅ EventBridge rule deleted")
+            except events.exceptions.ResourceNotFoundException:
+                pass  # Never set up (or already removed) for this account
+            except ClientError as e:
+                out.append(f"      ⚠️  EventBridge rule: {e}")
             
             try:
                 iam.delete_role_policy(RoleName='LarkCaseBot-EventBridgeRole', PolicyName='ForwardToMainAccount')
                 iam.delete_role(RoleName='LarkCaseBot-EventBridgeRole')
-                print(f"      ✅ EventBridge role deleted")
-            except Exception:
-                pass
+                out.append(f"      ✅ EventBridge role deleted")
+            except iam.exceptions.NoSuchEntityException:
+                pass  # Never set up (or already removed) for this account
+            except ClientError as e:
+                out.append(f"      ⚠️  EventBridge role: {e}")
         
         # Delete Support API role
         try:
-            policies = iam.list_attached_role_policies(RoleName=ROLE_NAME)
-            for policy in policies['AttachedPolicies']:
-                iam.detach_role_policy(RoleName=ROLE_NAME, PolicyArn=policy['PolicyArn'])
+            policy_arns = attached_policy_arns(iam)
+            if policy_arns:
+                # Detaches are independent calls; list() re-raises the first failure
+                with ThreadPoolExecutor(max_workers=min(8, len(policy_arns))) as executor:
+                    list(executor.map(
+                        lambda policy_arn: iam.detach_role_policy(RoleName=ROLE_NAME, PolicyArn=policy_arn),
+                        policy_arns
+                    ))
             iam.delete_role(RoleName=ROLE_NAME)
-            print(f"      ✅ Support API role deleted")
+            out.append(f"      ✅ Support API role deleted")
         except iam.exceptions.NoSuchEntityException:
-            print(f"      ⚠️  Support API role not found")
+            out.append(f"      ⚠️  Support API role not found")
         except Exception as e:
-            print(f"      ❌ Failed: {e}")
+            out.append(f"      ❌ Failed: {e}")
         
     except Exception as e:
-        print(f"      ❌ Failed: {e}")
+        out.append(f"      ❌ Failed: {e}")
+    
+    return out
 
 
 # ============================================================================
 # Verify Command
 # ============================================================================
 
+def _verify_account(acc: Dict) -> Tuple[bool, str]:
+    """Check the Support API role in one account, returning (ok, status line)"""
+    from botocore.exceptions import ClientError
+    
+    profile = acc.get('profile', 'default')
+    try:
+        iam = get_account_client(profile, 'iam')
+        # Check if AWSSupportAccess is attached (also raises NoSuchEntity if the role is missing)
+        if SUPPORT_POLICY_ARN in attached_policy_arns(iam):
+            return True, f"   ✅ {acc['account_name']}: Role exists with AWSSupportAccess"
+        return True, f"   ⚠️  {acc['account_name']}: Role exists but missing AWSSupportAccess policy"
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'NoSuchEntity':
+            return False, f"   ❌ {acc['account_name']}: Role not found"
+        return False, f"   ❌ {acc['account_name']}: {e}"
+    except Exception as e:
+        return False, f"   ❌ {acc['account_name']}: {e}"
+
+
 def cmd_verify(args):
     """Verify deployment and configuration"""
     config = load_config()
@@ -425,7 +586,7 @@ def cmd_verify(args):
     # 2. Check Secrets
     print("\n🔐 Secrets Manager...")
     try:
-        sm = boto3.client('secretsmanager', region_name=REGION)
+        sm = get_default_client('secretsmanager')
         sm.get_secret_value(SecretId=outputs['AppIDSecretArn'])
         sm.get_secret_value(SecretId=outputs['AppSecretSecretArn'])
         print(f"   ✅ Secrets OK")
@@ -436,7 +597,7 @@ def cmd_verify(args):
     # 3. Check S3 config
     print("\n📊 S3 Configuration...")
     try:
-        s3 = boto3.client('s3', region_name=REGION)
+        s3 = get_default_client('s3')
         response = s3.get_object(
             Bucket=outputs['DataBucketName'],
             Key='config/LarkBotProfile-0.json'
@@ -450,25 +611,17 @@ def cmd_verify(args):
     
     # 4. Check IAM roles exist
     print("\n🔑 IAM Roles (existence check)...")
-    for acc in config['accounts']:
-        profile = acc.get('profile', 'default')
-        try:
-            session = boto3.Session(profile_name=profile, region_name=REGION)
-            iam = session.client('iam')
-            role = iam.get_role(RoleName=ROLE_NAME)
-            # Check if AWSSupportAccess is attached
-            policies = iam.list_attached_role_policies(RoleName=ROLE_NAME)
-            has_support = any(p['PolicyName'] == 'AWSSupportAccess' for p in policies['AttachedPolicies'])
-            if has_support:
-                print(f"   ✅ {acc['account_name']}: Role exists with AWSSupportAccess")
-            else:
-                print(f"   ⚠️  {acc['account_name']}: Role exists but missing AWSSupportAccess policy")
-        except iam.exceptions.NoSuchEntityException:
-            print(f"   ❌ {acc['account_name']}: Role not found")
-            all_ok = False
-        except Exception as e:
-            print(f"   ❌ {acc['account_name']}: {e}")
-            all_ok = False
+    accounts = config['accounts']
+    if not all_ok and not args.full:
+        # The deployment is already broken; skip one IAM call per account unless
+        # asked for the full report
+        print(f"   ⏭️  Skipped after the failures above (run 'verify --full' to check anyway)")
+    elif accounts:
+        with ThreadPoolExecutor(max_workers=min(MAX_ACCOUNT_WORKERS, len(accounts))) as executor:
+            results = list(executor.map(_verify_account, accounts))
+        sys.stdout.write(''.join(line + '\n' for _, line in results))
+        sys.stdout.flush()
+        all_ok = all_ok and all(ok for ok, _ in results)
     
     # Summary
     if all_ok:
@@ -493,6 +646,7 @@ Examples:
   python setup_lark_bot.py cleanup            # Remove all resources
   python setup_lark_bot.py cleanup -y         # Remove without confirmation
   python setup_lark_bot.py verify             # Verify configuration
+  python setup_lark_bot.py verify --full      # Run every check even after a failure
 '''
     )
     
@@ -509,7 +663,9 @@ Examples:
     cleanup_p.add_argument('-y', '--yes', action='store_true', help='Skip confirmation')
     
     # verify
-    subparsers.add_parser('verify', help='Verify configuration')
+    verify_p = subparsers.add_parser('verify', help='Verify configuration')
+    verify_p.add_argument('--full', action='store_true',
+                          help='Check IAM roles in every account even if an earlier check fails')
     
     args = parser.parse_args()
     